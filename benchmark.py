@@ -0,0 +1,1402 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Daily Tech News Curator (DTNC) - 성능 벤치마크
+
+사용법:
+    python benchmark.py dedup --sizes 1000 10000 100000
+    python benchmark.py keywords --entries 20000
+    python benchmark.py stream --days 60 --per-day 50
+    python benchmark.py scrape --articles 40 --page-kb 400
+    python benchmark.py memory --feeds 50 --days 7 --per-day 40
+    python benchmark.py parse --processes 0 4 16
+    python benchmark.py archive --days 365
+    python benchmark.py pipeline [--save-baseline benchmarks/baseline.json]
+    python benchmark.py curation --think 2
+    python benchmark.py record --fixtures benchmarks/fixtures
+    python benchmark.py importtime
+"""
+
+import argparse
+import copy
+import difflib
+import functools
+import hashlib
+import http.server
+import json
+import logging
+import os
+import platform
+import random
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, datetime, timedelta
+from email.utils import format_datetime
+from pathlib import Path
+from typing import List
+from xml.sax.saxutils import escape
+
+import feedparser
+import requests
+import yaml
+
+import main
+
+
+# =================================================================
+# 합성 데이터
+# =================================================================
+SOURCES = ['The Verge', 'CNET', 'Engadget', 'TechCrunch', 'Digital Trends', 'Ars Technica', 'Gizmodo']
+LETTERS = 'etaoinshrdlucmfwypvbgkjqxz'
+
+
+def make_vocabulary(size: int = 5000, seed: int = 1) -> List[str]:
+    """영문 빈도와 비슷한 분포의 가짜 단어 사전"""
+    rng = random.Random(seed)
+    return [
+        ''.join(rng.choice(LETTERS[:rng.randint(8, 26)]) for _ in range(rng.randint(2, 9)))
+        for _ in range(size)
+    ]
+
+
+def synthetic_titles(n: int, seed: int = 42, dup_ratio: float = 0.3) -> List[str]:
+    """
+    "[출처] 제목" 형식의 합성 제목 n개
+    dup_ratio 비율로 단어 추가/삭제/교체한 변형(다른 출처의 같은 기사)을 섞음
+    """
+    rng = random.Random(seed)
+    vocab = make_vocabulary(seed=seed)
+    weights = [1 / (i + 1) ** 0.9 for i in range(len(vocab))]  # Zipf 분포
+
+    def title() -> str:
+        return ' '.join(rng.choices(vocab, weights, k=rng.randint(6, 12)))
+
+    def variant(text: str) -> str:
+        words = text.split()
+        op = rng.random()
+        if op < 0.3:
+            words.insert(rng.randrange(len(words)), rng.choices(vocab, weights)[0])
+        elif op < 0.6:
+            words.pop(rng.randrange(len(words)))
+        else:
+            words[rng.randrange(len(words))] = rng.choices(vocab, weights)[0]
+        return ' '.join(words)
+
+    titles = []
+    while len(titles) < n:
+        base = title()
+        titles.append(f"[{rng.choice(SOURCES)}] {base}")
+        if rng.random() < dup_ratio:
+            titles.append(f"[{rng.choice(SOURCES)}] {variant(base)}")
+    rng.shuffle(titles)
+    return titles[:n]
+
+
+def synthetic_texts(n: int, keywords: List[str], seed: int = 42, keyword_ratio: float = 0.3) -> List[str]:
+    """제목+본문 형태의 합성 텍스트 (일부 단어는 설정 키워드를 대소문자 섞어 삽입)"""
+    rng = random.Random(seed)
+    vocab = make_vocabulary(seed=seed)
+    texts = []
+    for _ in range(n):
+        words = rng.choices(vocab, k=rng.randint(30, 80))
+        for i in range(len(words)):
+            if rng.random() < keyword_ratio / 10:
+                keyword = rng.choice(keywords)
+                words[i] = rng.choice([keyword, keyword.upper(), keyword.lower(), keyword + 's'])
+        texts.append(' '.join(words))
+    return texts
+
+
+# =================================================================
+# 기준 구현 (v2.0)
+# =================================================================
+def legacy_remove_duplicates(titles: List[str], threshold: float = 0.7) -> List[str]:
+    """v2.0 remove_duplicates: 유지된 모든 제목과 SequenceMatcher 전체 쌍 비교"""
+    unique = []
+    for title in titles:
+        if not any(difflib.SequenceMatcher(None, title, existing).ratio() > threshold for existing in unique):
+            unique.append(title)
+    return unique
+
+
+def legacy_classify(text: str, categories: dict) -> frozenset:
+    """v2.0 parse_feed_entry 키워드 필터를 카테고리마다 반복"""
+    combined_text = text.lower()
+    return frozenset(
+        cat for cat, info in categories.items()
+        if not info.get('keywords') or any(keyword.lower() in combined_text for keyword in info['keywords'])
+    )
+
+
+def legacy_brand_match(title: str, brands: List[str]) -> bool:
+    """v2.0 calculate_scores 브랜드 가중치 판정"""
+    title_lower = title.lower()
+    return any(brand.lower() in title_lower for brand in brands)
+
+
+# =================================================================
+# 중복 제거 벤치마크
+# =================================================================
+def bench_dedup(args: argparse.Namespace):
+    """MinHash LSH 인덱스 vs 기존 전체 쌍 비교"""
+    print(f"{'제목 수':>8} | {'LSH(초)':>9} | {'LSH 유지':>8} | {'기존(초)':>9} | {'기존 유지':>9} | {'누락 중복':>8}")
+    print('-' * 70)
+
+    legacy_per_pair = None
+    for n in args.sizes:
+        titles = synthetic_titles(n, seed=args.seed)
+
+        start = time.perf_counter()
+        index = main.NearDuplicateIndex(threshold=args.threshold)
+        kept = [title for title in titles if index.add_if_unique(title)]
+        lsh_time = time.perf_counter() - start
+
+        if n <= args.legacy_max:
+            start = time.perf_counter()
+            legacy_kept = legacy_remove_duplicates(titles, args.threshold)
+            legacy_time = time.perf_counter() - start
+            legacy_per_pair = legacy_time / max(1, n * len(legacy_kept) / 2)
+            missed = len(set(kept) - set(legacy_kept))
+            print(f"{n:>8} | {lsh_time:>9.2f} | {len(kept):>8} | {legacy_time:>9.2f} | "
+                  f"{len(legacy_kept):>9} | {missed:>8}")
+        else:
+            # O(n²): 측정한 쌍당 비용으로 추정
+            estimate = f"~{legacy_per_pair * n * len(kept) / 2:.0f}" if legacy_per_pair else '-'
+            print(f"{n:>8} | {lsh_time:>9.2f} | {len(kept):>8} | {estimate:>9} | {'(생략)':>9} | {'-':>8}")
+
+
+# =================================================================
+# 키워드 매칭 벤치마크
+# =================================================================
+def synthetic_feeds(config: dict, entries: int, target: date, seed: int = 42) -> dict:
+    """설정의 RSS URL마다 feedparser 형식의 합성 피드 (전체 entries개, 70%는 target 날짜)"""
+    rng = random.Random(seed)
+    urls = main.collect_feed_urls(config)
+    keywords = sorted({kw for info in config['categories'].values() for kw in info.get('keywords', [])})
+    texts = synthetic_texts(entries * 2, keywords, seed=seed, keyword_ratio=0.1)
+    feeds = {url: feedparser.FeedParserDict(entries=[]) for url in urls}
+    for i in range(entries):
+        day = target if rng.random() < 0.7 else target - timedelta(days=rng.randint(1, 3))
+        published = datetime(day.year, day.month, day.day, rng.randint(0, 23), rng.randint(0, 59))
+        feeds[urls[i % len(urls)]].entries.append(feedparser.FeedParserDict(
+            title=texts[2 * i][:80],
+            link=f"https://example.com/{i}",
+            description=f"<p>{texts[2 * i + 1]}</p>",
+            published=published.strftime('%a, %d %b %Y %H:%M:%S +0000')
+        ))
+    return feeds
+
+
+class SyntheticRegistry(main.FeedRegistry):
+    """네트워크 대신 합성 피드를 반환하는 레지스트리"""
+
+    def __init__(self, feeds: dict, logger: logging.Logger):
+        super().__init__(logger)
+        self.synthetic_feeds = feeds
+
+    def _fetch(self, url: str):
+        return self.synthetic_feeds[url]
+
+
+def bench_keywords(args: argparse.Namespace):
+    """컴파일된 매처로 전 카테고리 동시 분류 vs 카테고리별 부분 문자열 반복"""
+    with open(args.config, 'r', encoding='utf-8') as f:
+        config = yaml.safe_load(f)
+    categories = config['categories']
+    all_keywords = sorted({kw for info in categories.values() for kw in info.get('keywords', [])})
+    brands = sorted({b for info in categories.values() for b in info.get('priority_brands', [])})
+    texts = synthetic_texts(args.entries, all_keywords + brands, seed=args.seed, keyword_ratio=0.1)
+
+    # 1) 매처 단독: 텍스트 1개를 8개 카테고리 전체에 분류
+    start = time.perf_counter()
+    legacy = [legacy_classify(text, categories) for text in texts]
+    legacy_brands = [legacy_brand_match(text, brands) for text in texts]
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    classifier = main.CategoryClassifier(config)
+    brand_matcher = main.compile_keywords(tuple(brands))
+    compiled = [classifier.classify(text) for text in texts]
+    compiled_brands = [brand_matcher.search(text) for text in texts]
+    compiled_time = time.perf_counter() - start
+
+    mismatches = sum(a != b for a, b in zip(legacy, compiled)) + \
+        sum(a != b for a, b in zip(legacy_brands, compiled_brands))
+    print(f"[매처] 텍스트 {len(texts)}개 x 카테고리 {len(categories)}개 "
+          f"(키워드 {len(all_keywords)}개, 브랜드 {len(brands)}개)")
+    print(f"  기존 (키워드별 부분 문자열): {legacy_time:.3f}초")
+    print(f"  컴파일 매처 (1회 탐색):       {compiled_time:.3f}초")
+
+    # 2) 수집 단계: 카테고리마다 피드 엔트리 재파싱 vs 엔트리당 1회 파싱 + 동시 분류
+    logger = logging.getLogger('DTNC')
+    target = date(2026, 1, 5)
+    feeds = synthetic_feeds(config, args.entries, target, seed=args.seed)
+
+    start = time.perf_counter()
+    registry = SyntheticRegistry(feeds, logger)
+    per_category = {
+        cat: main.fetch_news_by_category(cat, '', config, logger, target, registry)
+        for cat in categories
+    }
+    per_category_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    collected = main.collect_news(config, logger, target, SyntheticRegistry(feeds, logger))
+    collect_time = time.perf_counter() - start
+
+    for cat in categories:
+        if [(n.title, n.link) for n in per_category[cat]] != \
+                [(n.title, n.link) for n in collected[cat]]:
+            mismatches += 1
+    listed = sum(len(info.get('rss_sources', [])) for info in categories.values())
+    print(f"[수집] 엔트리 {args.entries}개, 피드 {len(feeds)}개 (카테고리별 등록 {listed}개)")
+    print(f"  카테고리별 파싱 (fetch_news_by_category): {per_category_time:.3f}초")
+    print(f"  엔트리당 1회 분류 (collect_news):        {collect_time:.3f}초")
+    print(f"결과 불일치: {mismatches}건")
+    if mismatches:
+        sys.exit(1)
+
+
+# =================================================================
+# 스트리밍 파싱 벤치마크
+# =================================================================
+def synthetic_feed(
+    days: int,
+    per_day: int,
+    newest: date,
+    seed: int = 42,
+    shuffle_ratio: float = 0.05,
+    fmt: str = 'rss',
+    keywords: List[str] = None,
+    keyword_ratio: float = 0.3,
+    base_url: str = 'https://example.com',
+    updated_days: int = 0
+) -> bytes:
+    """
+    최신순 RSS 2.0 / Atom 피드 (days일 x 하루 per_day개)
+    shuffle_ratio 비율의 엔트리는 순서를 바꿔 순서가 섞인 피드를 흉내 냄
+    keywords를 주면 keyword_ratio 비율의 제목에 키워드를 하나 넣음 (없으면 모든 제목에 "TV & OLED")
+    updated_days를 주면 발행일보다 그만큼 늦은 수정일(Atom <updated>, RSS <dc:date>)을 발행일 앞에 넣음 (WordPress 방식)
+    """
+    rng = random.Random(seed)
+    vocab = make_vocabulary(seed=seed)
+    stamps = []
+    for d in range(days):
+        day = newest - timedelta(days=d)
+        for i in range(per_day):
+            minutes = (per_day - i) * (24 * 60 // (per_day + 1))
+            stamps.append(datetime(day.year, day.month, day.day) + timedelta(minutes=minutes))
+    for _ in range(int(len(stamps) * shuffle_ratio)):
+        i = rng.randrange(len(stamps) - 1)
+        j = min(len(stamps) - 1, i + rng.randint(1, 30))
+        stamps[i], stamps[j] = stamps[j], stamps[i]
+
+    items = []
+    for n, stamp in enumerate(stamps):
+        title = ' '.join(rng.choices(vocab, k=rng.randint(6, 12)))
+        if keywords is None:
+            title += ' TV & OLED'
+        elif rng.random() < keyword_ratio:
+            title += ' ' + rng.choice(keywords)
+        body = ' '.join(rng.choices(vocab, k=rng.randint(80, 200)))
+        link = f"{base_url}/{n}"
+        updated = f"{(stamp + timedelta(days=updated_days)).isoformat()}Z"
+        if fmt == 'atom':
+            items.append(
+                f"<entry><title>{escape(title)}</title><link rel=\"alternate\" href=\"{link}\"/>"
+                f"<id>{link}</id>{f'<updated>{updated}</updated>' if updated_days else ''}"
+                f"<published>{stamp.isoformat()}Z</published>"
+                f"<summary type=\"html\">{escape(f'<p>{body}</p>')}</summary></entry>"
+            )
+        else:
+            items.append(
+                f"<item><title>{escape(title)}</title><link>{link}</link>"
+                f"<description><![CDATA[<p>{body}</p>]]></description>"
+                f"{f'<dc:date>{updated}</dc:date>' if updated_days else ''}"
+                f"<pubDate>{format_datetime(stamp)}</pubDate></item>"
+            )
+
+    if fmt == 'atom':
+        document = (
+            '<?xml version="1.0" encoding="UTF-8"?><feed xmlns="http://www.w3.org/2005/Atom">'
+            f'<title>Synthetic</title><link href="{base_url}/"/><id>{base_url}/</id>'
+            + ''.join(items) + '</feed>'
+        )
+    else:
+        document = (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<rss version="2.0" xmlns:dc="http://purl.org/dc/elements/1.1/"><channel>'
+            f'<title>Synthetic</title><link>{base_url}/</link><description>bench</description>'
+            + ''.join(items) + '</channel></rss>'
+        )
+    return document.encode('utf-8')
+
+
+class _FeedHandler(http.server.BaseHTTPRequestHandler):
+    """경로별 피드(.html은 기사 페이지) 본문을 청크로 보내는 로컬 HTTP 핸들러"""
+
+    def __init__(self, feeds: dict, *args, **kwargs):
+        self.feeds = feeds
+        super().__init__(*args, **kwargs)
+
+    def do_GET(self):
+        body = self.feeds.get(self.path)
+        if body is None:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        content_type = 'text/html' if self.path.endswith('.html') else 'application/xml'
+        self.send_header('Content-Type', f'{content_type}; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        try:
+            for start in range(0, len(body), 16384):
+                self.wfile.write(body[start:start + 16384])
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # 클라이언트 조기 종료
+
+    def log_message(self, *args):
+        pass
+
+
+def start_feed_server(feeds: dict):
+    """
+    {경로: 본문} 피드를 제공하는 로컬 HTTP 서버 시작
+    (서버, 기본 URL) 반환 - 사용 후 server.shutdown()
+    """
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), functools.partial(_FeedHandler, feeds))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def bench_stream(args: argparse.Namespace):
+    """날짜 범위 스트리밍 파싱 vs 전체 다운로드 + feedparser 전체 파싱"""
+    with open(args.config, 'r', encoding='utf-8') as f:
+        config = yaml.safe_load(f)
+    logger = logging.getLogger('DTNC')
+    newest = date(2026, 1, 31)
+    target = newest - timedelta(days=args.target_offset)
+    body = synthetic_feed(args.days, args.per_day, newest, seed=args.seed)
+    # 정확성 확인용: 수정일(<updated>/<dc:date>)이 발행일보다 4일 늦고 발행일 앞에 오는 피드 (WordPress 방식)
+    updated_feeds = {
+        f'/updated_{fmt}.xml': synthetic_feed(10, 20, newest, seed=args.seed, fmt=fmt, updated_days=4)
+        for fmt in ('rss', 'atom')
+    }
+
+    server, base_url = start_feed_server({'/feed.xml': body, **updated_feeds})
+    url = f"{base_url}/feed.xml"
+
+    def entries(feed) -> list:
+        items = (main.parse_feed_entry(entry, target, config, logger) for entry in feed.entries)
+        return [(n.title, n.link, n.description) for n in items if n]
+
+    def window_registry() -> main.FeedRegistry:
+        window = main.FeedWindow(target, margin_days=args.margin_days, stop_after=args.stop_after)
+        return main.FeedRegistry(logger, window=window)
+
+    try:
+        start = time.perf_counter()
+        full = entries(main.FeedRegistry(logger).get(url))
+        full_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        registry = window_registry()
+        streamed = entries(registry.get(url))
+        stream_time = time.perf_counter() - start
+
+        updated_results = {
+            path: (entries(main.FeedRegistry(logger).get(base_url + path)),
+                   entries(window_registry().get(base_url + path)))
+            for path in updated_feeds
+        }
+    finally:
+        server.shutdown()
+
+    stats = registry.stream_stats
+    print(f"[피드] 엔트리 {args.days * args.per_day}개 ({len(body) / 1024:.0f}KB), "
+          f"대상 날짜 {target} (최신 {newest})")
+    print(f"  전체 파싱:     {full_time:.3f}초, 읽은 양 {len(body) / 1024:.0f}KB, 대상 날짜 엔트리 {len(full)}개")
+    print(f"  스트리밍 파싱: {stream_time:.3f}초, 읽은 양 {stats['bytes_read'] / 1024:.0f}KB, "
+          f"대상 날짜 엔트리 {len(streamed)}개 (유지 {stats['kept']} / 건너뜀 {stats['skipped']}, "
+          f"조기 종료 {'예' if stats['stopped'] else '아니오'})")
+    mismatches = len(set(full) ^ set(streamed)) + int(full != streamed)
+    for path, (updated_full, updated_streamed) in updated_results.items():
+        updated_mismatches = len(set(updated_full) ^ set(updated_streamed)) + int(updated_full != updated_streamed)
+        print(f"  수정일이 발행일 앞에 있는 피드 ({path}): 전체 {len(updated_full)}개 / "
+              f"스트리밍 {len(updated_streamed)}개, 불일치 {updated_mismatches}건")
+        mismatches += updated_mismatches
+    print(f"결과 불일치: {mismatches}건")
+    if mismatches:
+        sys.exit(1)
+
+
+# =================================================================
+# 기사 본문 스크래핑 벤치마크
+# =================================================================
+def legacy_fetch_article_content(url: str) -> str:
+    """v2.0 fetch_article_content: 요청마다 새 연결, 페이지 전체를 html.parser로 파싱, 패턴별 재탐색"""
+    from bs4 import BeautifulSoup
+
+    response = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=10)
+    response.raise_for_status()
+    soup = BeautifulSoup(response.content, 'html.parser')
+    content = ""
+    article_tag = soup.find('article')
+    if article_tag:
+        for tag in article_tag.find_all(['script', 'style', 'aside', 'nav', 'header', 'footer']):
+            tag.decompose()
+        content = article_tag.get_text(separator=' ', strip=True)
+    if not content:
+        for selector in main.ARTICLE_BODY_NAMES:
+            elem = soup.find(class_=selector) or soup.find(id=selector)
+            if elem:
+                for tag in elem.find_all(['script', 'style', 'aside', 'nav']):
+                    tag.decompose()
+                content = elem.get_text(separator=' ', strip=True)
+                break
+    if not content:
+        valid_paras = [p.get_text(strip=True) for p in soup.find_all('p') if len(p.get_text(strip=True)) > 30]
+        content = ' '.join(valid_paras[:10])
+    content = re.sub(r'\s+', ' ', content).strip()
+    return content[:2000] if len(content) >= 100 else ""
+
+
+def synthetic_article(index: int, size_kb: int, seed: int = 42) -> bytes:
+    """
+    뉴스 기사 페이지 흉내 (앞쪽 <article> 본문 + 스크립트/관련 기사/댓글로 size_kb까지 채움)
+    짝수 번호는 <article>, 홀수 번호는 본문 클래스(div.entry-content) 사용
+    """
+    rng = random.Random(seed + index)
+    vocab = make_vocabulary(seed=seed)
+    paragraphs = ''.join(
+        f"<p>{escape(' '.join(rng.choice(vocab) for _ in range(rng.randint(25, 60))))}.</p>" for _ in range(8)
+    )
+    body = (f"<article><header><h1>Article {index}</h1></header>{paragraphs}<aside>관련 상품</aside>"
+            f"<footer>저작권</footer></article>" if index % 2 == 0
+            else f"<div class=\"entry-content\">{paragraphs}<nav>다음 기사</nav></div>")
+    parts = [
+        "<!DOCTYPE html><html><head><meta charset=\"utf-8\"><title>Article</title>",
+        "<script>" + "var x = 1;" * 2000 + "</script></head><body><nav><ul>",
+        ''.join(f"<li><a href=\"/c/{i}\">메뉴 {i}</a></li>" for i in range(50)),
+        f"</ul></nav>{body}<div class=\"related\">"
+    ]
+    filler = []
+    size = sum(len(part.encode('utf-8')) for part in parts)
+    while size < size_kb * 1024:
+        item = (f"<div class=\"card\"><a href=\"/a/{rng.randint(0, 10**6)}\">"
+                f"{escape(' '.join(rng.choice(vocab) for _ in range(12)))}</a><span>댓글 {rng.randint(0, 99)}</span></div>")
+        filler.append(item)
+        size += len(item.encode('utf-8'))
+    return ''.join(parts + filler + ["</div></body></html>"]).encode('utf-8')
+
+
+def bench_scrape(args: argparse.Namespace):
+    """기사 본문: v2.0 방식(순차, 전체 페이지 파싱) vs ArticleScraper(공유 풀, 동시, 크기 제한, 디스크 캐시)"""
+    logger = logging.getLogger('DTNC')
+    pages = {f"/article/{i}.html": synthetic_article(i, args.page_kb, args.seed) for i in range(args.articles)}
+    server, base_url = start_feed_server(pages)
+    urls = [base_url + path for path in pages]
+    cache_dir = tempfile.mkdtemp(prefix='dtnc-scrape-')
+    try:
+        start = time.perf_counter()
+        legacy = [legacy_fetch_article_content(url) for url in urls]
+        legacy_time = time.perf_counter() - start
+
+        def scraper():
+            return main.ArticleScraper(
+                logger, cache_dir=cache_dir, max_kb=args.max_kb,
+                max_workers=args.workers, per_host_limit=args.workers
+            )
+
+        cold_scraper = scraper()
+        start = time.perf_counter()
+        cold = cold_scraper.fetch_many(urls)
+        cold_time = time.perf_counter() - start
+
+        warm_scraper = scraper()
+        start = time.perf_counter()
+        warm = warm_scraper.fetch_many(urls)
+        warm_time = time.perf_counter() - start
+    finally:
+        server.shutdown()
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+    total_kb = sum(len(body) for body in pages.values()) / 1024
+    print(f"[기사] {args.articles}개, 페이지당 {args.page_kb}KB (전체 {total_kb:.0f}KB), "
+          f"파서 {main.html_parser_backend()}, 동시 {args.workers}, 최대 {args.max_kb}KB")
+    print(f"  v2.0 방식:          {legacy_time:.3f}초, 읽은 양 {total_kb:.0f}KB")
+    print(f"  ArticleScraper:     {cold_time:.3f}초, 읽은 양 {cold_scraper.stats['bytes_read'] / 1024:.0f}KB "
+          f"({legacy_time / cold_time:.1f}배)")
+    print(f"  ArticleScraper 캐시: {warm_time:.3f}초 (캐시 {warm_scraper.stats['cached']}개)")
+    mismatches = sum(a != cold[url] or a != warm[url] for url, a in zip(urls, legacy))
+    print(f"결과 불일치: {mismatches}건 (빈 본문 {sum(not text for text in legacy)}개)")
+    if mismatches:
+        sys.exit(1)
+
+
+# =================================================================
+# 메모리 벤치마크 (피드 엔트리/뉴스 항목 표현)
+# =================================================================
+class LegacyRegistry(main.FeedRegistry):
+    """v2.0 방식: feedparser 결과 전체를 보관하고 분류 후에도 해제하지 않는 레지스트리"""
+
+    def _fetch(self, url: str):
+        body, headers = self._download(url)[:2]
+        return feedparser.parse(body, response_headers=headers)
+
+    def release(self, url: str):
+        pass
+
+
+def legacy_item(news: main.NewsItem) -> dict:
+    """v2.0의 항목별 dict (설명은 수집 시점에 정리)"""
+    return {
+        'title': news.title,
+        'original_title': news.original_title,
+        'source': news.source,
+        'link': news.link,
+        'description': news.description,
+        'summary': news.summary,
+        'score': news.score,
+        'pub_date': news.pub_date
+    }
+
+
+def serve_synthetic_feeds(config: dict, args: argparse.Namespace, newest: date) -> tuple:
+    """
+    합성 피드 args.feeds개(args.days일 x 하루 args.per_day개)를 로컬 서버로 제공하고 카테고리에 고르게 배분
+    (서버, 벤치마크 설정, 전체 KB) 반환 - 사용 후 server.shutdown()
+    """
+    keywords = sorted({kw for info in config['categories'].values() for kw in info.get('keywords', [])})
+    feeds = {
+        f"/feed/{i}.xml": synthetic_feed(
+            args.days, args.per_day, newest, seed=args.seed + i, keywords=keywords,
+            base_url=f"https://example.com/{i}"
+        )
+        for i in range(args.feeds)
+    }
+    server, base_url = start_feed_server(feeds)
+
+    config = bench_config(config, {})
+    categories = list(config['categories'])
+    for info in config['categories'].values():
+        info['rss_sources'] = []
+    for i, path in enumerate(feeds):
+        config['categories'][categories[i % len(categories)]]['rss_sources'].append(
+            {'name': SOURCES[i % len(SOURCES)], 'url': base_url + path}
+        )
+    config['rss']['stream_parse'] = False
+    return server, config, sum(len(body) for body in feeds.values()) / 1024
+
+
+def collected_rows(collected: dict, days: List[date]) -> list:
+    """날짜/카테고리별 수집 결과 비교용 (날짜, 카테고리, 제목, 링크, 설명) 목록 (v2.0 dict 항목 포함)"""
+    rows = []
+    for day in days:
+        for cat, items in collected[day].items():
+            for news in items:
+                if isinstance(news, dict):
+                    rows.append((str(day), cat, news['title'], news['link'], news['description']))
+                else:
+                    rows.append((str(day), cat, news.title, news.link, news.description))
+    return rows
+
+
+def rows_digest(rows: list) -> str:
+    return hashlib.sha256(json.dumps(rows, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+
+def memory_child(args: argparse.Namespace):
+    """한 가지 방식으로 수집해 tracemalloc 최대/잔존 메모리와 결과 해시를 JSON으로 출력 (하위 프로세스)"""
+    import gc
+    import tracemalloc
+
+    with open(args.child_config, 'r', encoding='utf-8') as f:
+        config = yaml.safe_load(f)
+    logger = logging.getLogger('DTNC')
+    newest = date.fromisoformat(args.newest)
+    days = [newest - timedelta(days=d) for d in range(args.days)]
+    urls = main.collect_feed_urls(config)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    registry = LegacyRegistry(logger) if args.variant == 'legacy' else main.FeedRegistry(logger)
+    registry.prefetch(urls, max_workers=8, per_host_limit=8)
+    collected = main.collect_news_by_day(config, logger, days, registry)
+    if args.variant == 'legacy':
+        collected = {
+            day: {cat: [legacy_item(news) for news in items] for cat, items in by_category.items()}
+            for day, by_category in collected.items()
+        }
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    rows = collected_rows(collected, days)
+    try:
+        import resource
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    except ImportError:  # Windows
+        max_rss = None
+    print(json.dumps({
+        'elapsed': elapsed, 'current': current, 'peak': peak, 'max_rss_kb': max_rss, 'items': len(rows),
+        'digest': rows_digest(rows)
+    }))
+
+
+def bench_memory(args: argparse.Namespace):
+    """수집 단계 메모리: v2.0 방식(feedparser 결과 보관 + 항목별 dict) vs FeedEntry/NewsItem + 피드 해제"""
+    if args.variant:
+        memory_child(args)
+        return
+
+    with open(args.config, 'r', encoding='utf-8') as f:
+        config = yaml.safe_load(f)
+    newest = date.today()
+    server, config, total_kb = serve_synthetic_feeds(config, args, newest)
+
+    workdir = tempfile.mkdtemp(prefix='dtnc-memory-')
+    child_config = os.path.join(workdir, 'config.yaml')
+    with open(child_config, 'w', encoding='utf-8') as f:
+        yaml.safe_dump(config, f, allow_unicode=True, sort_keys=False)
+
+    results = {}
+    try:
+        for variant in ('legacy', 'compact'):
+            output = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), 'memory', '--variant', variant,
+                 '--child-config', child_config, '--newest', newest.isoformat(), '--days', str(args.days)],
+                capture_output=True, text=True, check=True, cwd=workdir
+            ).stdout
+            results[variant] = json.loads(output.strip().splitlines()[-1])
+    finally:
+        server.shutdown()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print(f"[수집] 피드 {args.feeds}개 x {args.days}일 x 하루 {args.per_day}개 (전체 {total_kb / 1024:.1f}MB), "
+          f"수집 항목 {results['compact']['items']}개")
+    labels = {'legacy': 'v2.0 방식 (feedparser 보관 + dict)', 'compact': 'FeedEntry/NewsItem + 해제'}
+    for variant, result in results.items():
+        rss = f", 최대 RSS {result['max_rss_kb'] / 1024:.1f}MB" if result['max_rss_kb'] else ""
+        print(f"  {labels[variant]:<34} 최대 {result['peak'] / 2**20:7.1f}MB, 잔존 {result['current'] / 2**20:7.1f}MB"
+              f"{rss}, {result['elapsed']:.2f}초 (tracemalloc 포함)")
+    legacy, compact = results['legacy'], results['compact']
+    print(f"  감소율: 최대 {1 - compact['peak'] / legacy['peak']:.0%}, 잔존 {1 - compact['current'] / legacy['current']:.0%}")
+    mismatches = int(legacy['digest'] != compact['digest']) + abs(legacy['items'] - compact['items'])
+    print(f"결과 불일치: {mismatches}건")
+    if mismatches:
+        sys.exit(1)
+
+
+def bench_parse(args: argparse.Namespace):
+    """피드 파싱/분류: 다운로드 스레드에서 직접 vs 파싱 프로세스 풀 (rss.parse_processes)"""
+    with open(args.config, 'r', encoding='utf-8') as f:
+        config = yaml.safe_load(f)
+    logger = logging.getLogger('DTNC')
+    newest = date.today()
+    days = [newest - timedelta(days=d) for d in range(args.days)]
+    server, config, total_kb = serve_synthetic_feeds(config, args, newest)
+    urls = main.collect_feed_urls(config)
+
+    results = []
+    try:
+        for processes in args.processes:
+            pool = main.ParsePool(config, days, processes) if processes else None
+            start = time.perf_counter()
+            registry = main.FeedRegistry(logger, parse_pool=pool)
+            registry.prefetch(urls, max_workers=args.workers, per_host_limit=args.workers)
+            collected = main.collect_news_by_day(config, logger, days, registry)
+            elapsed = time.perf_counter() - start
+            if pool is not None:
+                pool.close()
+            results.append((processes, elapsed, collected_rows(collected, days)))
+    finally:
+        server.shutdown()
+
+    print(f"[파싱] 피드 {args.feeds}개 x {args.days}일 x 하루 {args.per_day}개 (전체 {total_kb / 1024:.1f}MB), "
+          f"다운로드 스레드 {args.workers}개, CPU 코어 {os.cpu_count()}개")
+    base_time = results[0][1]
+    for processes, elapsed, rows in results:
+        label = f"프로세스 {processes}개" if processes else "스레드에서 직접"
+        print(f"  {label:<14} {elapsed:.3f}초 ({base_time / elapsed:.1f}배), 수집 항목 {len(rows)}개")
+    mismatches = sum(rows_digest(rows) != rows_digest(results[0][2]) for _, _, rows in results)
+    print(f"결과 불일치: {mismatches}건")
+    if mismatches:
+        sys.exit(1)
+
+
+# =================================================================
+# 아카이브 조회 벤치마크
+# =================================================================
+def legacy_archive_search(archive_dir: Path, query: str, category: str = None) -> list:
+    """v2.0 방식: 아카이브의 모든 HTML을 읽어 기사 제목 검색 (카테고리 제목 아래 항목만)"""
+    terms = [term.lower() for term in query.split()]
+    found = []
+    for html_file in sorted(archive_dir.glob('*/*/newsletter_*.html'), reverse=True):
+        current = None
+        for line in html_file.read_text(encoding='utf-8').splitlines():
+            if line.startswith('<h2>'):
+                current = line[4:-5]
+            elif line.startswith('<li>') and (category is None or current == category):
+                title = re.sub('<.*?>', '', line)
+                if all(term in title.lower() for term in terms):
+                    found.append((html_file.stem.split('_')[1], current, title))
+    return found
+
+
+def bench_archive(args: argparse.Namespace):
+    """발행 이력 조회: HTML 아카이브 전체 읽기 vs ArchiveIndex (SQLite 색인/FTS5)"""
+    rng = random.Random(args.seed)
+    categories = ['Display', 'Audio_AV', 'AI_Cloud', 'Korea_IT']
+    titles = synthetic_titles(args.days * args.items, seed=args.seed, dup_ratio=0.0)
+    query = 'OLED'
+    workdir = tempfile.mkdtemp(prefix='dtnc-archive-')
+    archive_dir = Path(workdir)
+    try:
+        index = main.ArchiveIndex(str(archive_dir))
+        first_day = date(2026, 1, 1)
+        build_start = time.perf_counter()
+        for d in range(args.days):
+            issue_date = first_day + timedelta(days=d)
+            folder = archive_dir / str(issue_date.year) / f"{issue_date.month:02d}"
+            folder.mkdir(parents=True, exist_ok=True)
+            final_data, lines = {}, []
+            for n in range(args.items):
+                position = d * args.items + n
+                title = titles[position] + (' OLED' if rng.random() < 0.05 else '')
+                category = categories[n % len(categories)]
+                news = main.NewsItem(f"[{SOURCES[position % len(SOURCES)]}] {title}", title,
+                                     SOURCES[position % len(SOURCES)], f"https://example.com/{position}",
+                                     title, datetime(issue_date.year, issue_date.month, issue_date.day))
+                news.summary = f"요약: {title}"
+                final_data.setdefault(category, []).append(news)
+            for category, news_list in final_data.items():
+                lines.append(f"<h2>{category}</h2>")
+                lines.extend(f"<li><a href=\"{news.link}\">{news.title}</a></li>" for news in news_list)
+            html_file = folder / f"newsletter_{issue_date.strftime('%Y%m%d')}.html"
+            html_file.write_text('\n'.join(lines), encoding='utf-8')
+            index.add_issue(issue_date, html_file.name, [html_file], final_data)
+        build_time = time.perf_counter() - build_start
+
+        start = time.perf_counter()
+        legacy = legacy_archive_search(archive_dir, query, 'Display')
+        legacy_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        indexed = index.search(query, 'Display', limit=len(legacy) + 1)
+        index_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        sources = index.sources('Display', first_day + timedelta(days=args.days - 90), first_day + timedelta(days=args.days))
+        sources_time = time.perf_counter() - start
+        index.close()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print(f"[아카이브] {args.days}호 x {args.items}개 기사 (색인 작성 {build_time:.2f}초, FTS5 {'사용' if index.fts else '미지원'})")
+    print(f"  HTML 전체 읽기 검색 \"{query}\": {legacy_time * 1000:8.1f}ms, {len(legacy)}건")
+    print(f"  색인 검색 \"{query}\":          {index_time * 1000:8.1f}ms, {len(indexed)}건")
+    print(f"  색인 출처 통계 (최근 90호):  {sources_time * 1000:8.1f}ms, 출처 {len(sources)}개")
+    mismatches = abs(len(legacy) - len(indexed)) + sum(
+        (day.replace('-', ''), title) != (stamp, row_title)
+        for (stamp, _, title), (day, _, row_title, _, _) in zip(legacy, indexed)
+    )
+    print(f"결과 불일치: {mismatches}건")
+    if mismatches:
+        sys.exit(1)
+
+
+# =================================================================
+# 오프라인 파이프라인 벤치마크 (피드 픽스처 + 가짜 LLM)
+# =================================================================
+class FakeRateLimitError(Exception):
+    """프로바이더 SDK의 429 오류 흉내 (status_code로 판별)"""
+
+    status_code = 429
+
+
+class FakeLLMClient:
+    """
+    결정적 가짜 LLM 클라이언트
+    일괄 프롬프트에는 기사별 JSON 배열, 그 외에는 프롬프트에서 만든 고정 문장을 반환
+    latency초(±jitter) 지연, error_rate 비율로 429 오류 발생 (시드 고정)
+    """
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0, seed: int = 42):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.calls = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def complete(self, prompt: str) -> str:
+        with self._lock:
+            self.calls += 1
+            delay = self.latency * (1 + self._rng.uniform(-self.jitter, self.jitter))
+            fail = self._rng.random() < self.error_rate
+        time.sleep(max(0.0, delay))
+        if fail:
+            raise FakeRateLimitError('Resource has been exhausted (fake)')
+
+        if '기사 목록:' in prompt:
+            text = prompt.split('기사 목록:', 1)[1]
+            articles = json.loads(text[text.index('['):text.rindex(']') + 1])
+            return json.dumps([
+                {
+                    'id': article['id'],
+                    'title': f"(번역) {article['title']}" if article.get('translate') else article['title'],
+                    'summary': f"요약: {article['description'][:120]}"
+                }
+                for article in articles
+            ], ensure_ascii=False)
+        digest = hashlib.sha1(prompt.encode('utf-8')).hexdigest()[:8]
+        return f"가짜 응답 {digest}: {prompt[-80:].strip()}"
+
+
+class FakeSummarizer(main.AISummarizer):
+    """FakeLLMClient를 사용하는 AISummarizer (호출 제한/재시도/일괄 처리 경로는 그대로 사용)"""
+
+    def __init__(self, config: dict, logger: logging.Logger, client: FakeLLMClient,
+                 rpm: float = 0, tpm: float = 0, metrics: main.RunMetrics = None):
+        config = dict(config, ai_summary=dict(config.get('ai_summary', {}), enabled=False, cache={}))
+        super().__init__(config, logger, metrics)
+        self.enabled = True
+        self.provider = 'fake'
+        self.model_name = 'fake:bench'
+        self.client = client
+        self.rate_limiter = main.RateLimiter(rpm, tpm)
+
+    def _call_provider(self, prompt: str, max_tokens: int = None, temperature: float = None) -> str:
+        return self.client.complete(prompt)
+
+
+def load_fixtures(config: dict, args: argparse.Namespace, target: date) -> dict:
+    """
+    설정의 RSS URL → 피드 본문
+    fixtures 디렉토리에 record로 저장한 index.json이 있으면 녹화본을, 없으면 합성 피드(RSS/Atom 교대)를 사용
+    """
+    urls = main.collect_feed_urls(config)
+    index_path = Path(args.fixtures) / 'index.json'
+    if index_path.exists():
+        with open(index_path, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+        return {url: (Path(args.fixtures) / index[url]).read_bytes() for url in urls if url in index}
+
+    keywords = sorted({kw for info in config['categories'].values() for kw in info.get('keywords', [])})
+    per_day = max(1, args.entries_per_feed // args.days)
+    return {
+        url: synthetic_feed(
+            args.days, per_day, target, seed=args.seed + n, fmt='atom' if n % 3 == 2 else 'rss',
+            keywords=keywords, base_url=f"https://feed{n}.example.com"
+        )
+        for n, url in enumerate(urls)
+    }
+
+
+def bench_config(config: dict, url_map: dict) -> dict:
+    """픽스처 서버 URL로 바꾸고 로그 파일/아카이브/캐시/저장소/피드 상태 기록/본문 스크래핑을 끈 설정 사본"""
+    config = copy.deepcopy(config)
+    for info in config['categories'].values():
+        sources = []
+        for source in info.get('rss_sources', []):
+            if isinstance(source, dict):
+                sources.append(dict(source, url=url_map.get(source.get('url'), source.get('url'))))
+            else:
+                sources.append(url_map.get(source, source))
+        info['rss_sources'] = sources
+    config.setdefault('logging', {})['log_to_file'] = False
+    config.setdefault('archive', {})['enabled'] = False
+    config.setdefault('rss', {})['use_cache'] = False
+    config.setdefault('store', {})['enabled'] = False
+    config.setdefault('health', {})['enabled'] = False
+    config.setdefault('scrape', {})['enabled'] = False
+    return config
+
+
+def feed_registry(config: dict, logger: logging.Logger, target: date) -> main.FeedRegistry:
+    """main.run_newsletter와 같은 설정의 피드 레지스트리"""
+    rss_config = config.get('rss', {})
+    window = None
+    if rss_config.get('stream_parse', False):
+        window = main.FeedWindow(
+            target,
+            margin_days=rss_config.get('stream_margin_days', 1),
+            stop_after=rss_config.get('stream_stop_after', 10)
+        )
+    return main.FeedRegistry(logger, window=window, timeout=rss_config.get('timeout', 10))
+
+
+def run_stages(config: dict, args: argparse.Namespace, target: date) -> dict:
+    """단계별 (소요 시간, 처리 개수) 측정"""
+    logger = logging.getLogger('DTNC')
+    results = {}
+
+    def timed(name: str, func):
+        start = time.perf_counter()
+        value, count = func()
+        elapsed = time.perf_counter() - start
+        results[name] = {'seconds': elapsed, 'items': count, 'per_second': count / elapsed if elapsed > 0 else 0.0}
+        return value
+
+    # 1. 카테고리별 수집 (피드 다운로드/파싱 포함, 레지스트리 공유)
+    registry = feed_registry(config, logger, target)
+
+    def fetch():
+        news = {
+            cat: main.fetch_news_by_category(cat, '', config, logger, target, registry)
+            for cat in config['categories']
+        }
+        return news, sum(len(items) for items in news.values())
+    collected = timed('fetch_news_by_category', fetch)
+
+    # 2. 엔트리 파싱/필터 (다운로드된 피드의 전체 엔트리)
+    classifier = main.CategoryClassifier(config)
+    feeds = [registry.get(url) for url in main.collect_feed_urls(config) if url in registry._feeds]
+
+    def parse():
+        entries = [entry for feed in feeds for entry in feed.entries]
+        for entry in entries:
+            main.parse_feed_entry(entry, target, config, logger, classifier=classifier)
+        return None, len(entries)
+    timed('parse_feed_entry', parse)
+
+    # 3. 중복 제거 (카테고리별, 카테고리 간 중복은 선정 단계에서 처리)
+    def dedup():
+        unique = {
+            cat: main.remove_duplicates(items, logger, main.create_dedup_index(config))
+            for cat, items in collected.items()
+        }
+        return unique, sum(len(items) for items in collected.values())
+    unique = timed('remove_duplicates', dedup)
+
+    # 4. 스코어링
+    def score():
+        scored = {
+            cat: main.calculate_scores(items, config['categories'][cat].get('query', ''), config, cat)
+            for cat, items in unique.items()
+        }
+        return scored, sum(len(items) for items in unique.values())
+    scored = timed('calculate_scores', score)
+
+    # 5. 선정 뉴스 번역/요약 (가짜 LLM)
+    summarizer = FakeSummarizer(
+        config, logger, FakeLLMClient(args.llm_latency, args.llm_jitter, args.llm_error_rate, args.seed),
+        rpm=args.llm_rpm, tpm=args.llm_tpm
+    )
+
+    def enrich():
+        final = {}
+        for cat, items in scored.items():
+            selected = items[:config['categories'][cat].get('max_items', 10)]
+            if selected:
+                final[cat] = main.enrich_news(selected, summarizer, logger)
+        return final, sum(len(items) for items in final.values())
+    final_data = timed('enrich_news', enrich)
+
+    # 6. HTML 생성
+    def html():
+        main.generate_html(final_data, config, logger)
+        return None, sum(len(items) for items in final_data.values())
+    timed('generate_html', html)
+
+    # 7. 전체 실행 (main.run_newsletter, --auto)
+    metrics = main.RunMetrics()
+    run_args = argparse.Namespace(auto=True, target_date=target, metrics_json=None, offline=False, date_range=None, async_mode=False)
+    e2e_summarizer = FakeSummarizer(
+        config, logger, FakeLLMClient(args.llm_latency, args.llm_jitter, args.llm_error_rate, args.seed),
+        rpm=args.llm_rpm, tpm=args.llm_tpm, metrics=metrics
+    )
+    timed('end_to_end', lambda: (main.run_newsletter(run_args, config, logger, metrics, e2e_summarizer),
+                                 len(main.collect_feed_urls(config))))
+    results['end_to_end']['stages'] = metrics.to_dict()['stages']
+    results['end_to_end']['llm_calls'] = e2e_summarizer.client.calls
+    output = Path(f"newsletter_{datetime.now().strftime('%Y%m%d')}.html")
+    sync_html = output.read_text(encoding='utf-8')
+
+    # 8. 전체 실행 (--auto --async: 피드 다운로드/분류와 전체 카테고리 요약을 이벤트 루프에서 동시 실행)
+    metrics = main.RunMetrics()
+    async_args = argparse.Namespace(**dict(vars(run_args), async_mode=True))
+    async_summarizer = FakeSummarizer(
+        config, logger, FakeLLMClient(args.llm_latency, args.llm_jitter, args.llm_error_rate, args.seed),
+        rpm=args.llm_rpm, tpm=args.llm_tpm, metrics=metrics
+    )
+    timed('end_to_end_async', lambda: (main.run_newsletter(async_args, config, logger, metrics, async_summarizer),
+                                       len(main.collect_feed_urls(config))))
+    results['end_to_end_async']['stages'] = metrics.to_dict()['stages']
+    results['end_to_end_async']['llm_calls'] = async_summarizer.client.calls
+    results['end_to_end_async']['same_output'] = output.read_text(encoding='utf-8') == sync_html
+    return results
+
+
+def compare_baseline(results: dict, baseline: dict, tolerance: float, min_delta: float = 0.05) -> int:
+    """
+    기준선 대비 변화 출력, 회귀 수 반환
+    회귀: 소요 시간이 tolerance 비율과 min_delta초를 모두 넘게 늘었거나 처리 개수가 바뀐 단계
+    """
+    regressions = 0
+    print(f"\n{'단계':<24} | {'기준(초)':>9} | {'현재(초)':>9} | {'변화':>8} | 비고")
+    print('-' * 70)
+    for name, current in results['stages'].items():
+        base = baseline.get('stages', {}).get(name)
+        if not base:
+            print(f"{name:<24} | {'-':>9} | {current['seconds']:>9.3f} | {'-':>8} | 신규")
+            continue
+        change = (current['seconds'] - base['seconds']) / base['seconds'] if base['seconds'] else 0.0
+        notes = []
+        if change > tolerance and current['seconds'] - base['seconds'] > min_delta:
+            notes.append('느려짐')
+        if current['items'] != base['items']:
+            notes.append(f"처리 개수 변경 {base['items']} → {current['items']}")
+        regressions += bool(notes)
+        print(f"{name:<24} | {base['seconds']:>9.3f} | {current['seconds']:>9.3f} | {change:>+7.0%} | {', '.join(notes)}")
+    return regressions
+
+
+def bench_pipeline(args: argparse.Namespace):
+    """피드 픽스처를 로컬 HTTP 서버로 재생하고 가짜 LLM으로 파이프라인 단계별 처리량 측정"""
+    with open(args.config, 'r', encoding='utf-8') as f:
+        config = yaml.safe_load(f)
+    target = date(2026, 1, 5)
+    fixtures = load_fixtures(config, args, target)
+    paths = {url: f"/{hashlib.sha1(url.encode('utf-8')).hexdigest()[:12]}.xml" for url in fixtures}
+    server, base_url = start_feed_server({paths[url]: body for url, body in fixtures.items()})
+    config = bench_config(config, {url: base_url + path for url, path in paths.items()})
+
+    # generate_html은 현재 디렉토리의 template.html을 읽고 결과를 씀
+    template = Path(__file__).resolve().parent / 'template.html'
+    cwd = os.getcwd()
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            shutil.copy(template, workdir)
+            os.chdir(workdir)
+            stages = run_stages(config, args, target)
+    finally:
+        os.chdir(cwd)
+        server.shutdown()
+
+    total_bytes = sum(len(body) for body in fixtures.values())
+    print(f"[픽스처] 피드 {len(fixtures)}개, {total_bytes / 1024:.0f}KB "
+          f"({'녹화본' if (Path(args.fixtures) / 'index.json').exists() else '합성'}), 대상 날짜 {target}")
+    print(f"[가짜 LLM] 지연 {args.llm_latency}초 ±{args.llm_jitter:.0%}, RPM {args.llm_rpm or '무제한'}, "
+          f"오류율 {args.llm_error_rate:.0%}")
+    print(f"\n{'단계':<24} | {'소요(초)':>9} | {'처리 개수':>9} | {'처리량(/초)':>11}")
+    print('-' * 64)
+    for name, result in stages.items():
+        print(f"{name:<24} | {result['seconds']:>9.3f} | {result['items']:>9} | {result['per_second']:>11.0f}")
+    for name in ('end_to_end', 'end_to_end_async'):
+        e2e = stages[name]
+        print(f"  {name} 단계별: " + ', '.join(f"{k} {v:.2f}초" for k, v in e2e['stages'].items())
+              + f" (LLM 호출 {e2e['llm_calls']}회)")
+    print(f"  --async 결과 HTML 동일: {stages['end_to_end_async']['same_output']}")
+
+    results = {
+        'environment': {'python': platform.python_version(), 'platform': platform.platform()},
+        'options': {k: v for k, v in vars(args).items() if k != 'func'},
+        'stages': stages
+    }
+    if args.baseline and Path(args.baseline).exists():
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions = compare_baseline(results, json.load(f), args.tolerance, args.min_delta)
+        if regressions and not args.save_baseline:
+            print(f"\n회귀 {regressions}건 (허용 {args.tolerance:.0%})")
+            sys.exit(1)
+    if args.save_baseline:
+        Path(args.save_baseline).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n기준선 저장: {args.save_baseline}")
+
+
+def bench_curation(args: argparse.Namespace):
+    """
+    수동 큐레이션 대기 시간: 카테고리마다 요약 후 큐레이션 vs 백그라운드 요약 (ai_summary.background_enrich)
+    운영자는 카테고리마다 think초 동안 목록을 보고 q를 누른다고 가정 (합성 피드 + 가짜 LLM)
+    """
+    with open(args.config, 'r', encoding='utf-8') as f:
+        config = bench_config(yaml.safe_load(f), {})
+    logger = logging.getLogger('DTNC')
+    target = date(2026, 1, 5)
+    feeds = synthetic_feeds(config, args.entries, target, seed=args.seed)
+    template = Path(__file__).resolve().parent / 'template.html'
+    curate = main.curate_category
+
+    def run(background: bool) -> tuple:
+        """(운영자 대기 시간 합계, 카테고리별 대기 시간, 결과 HTML)"""
+        run_config = dict(config, ai_summary=dict(config.get('ai_summary', {}), background_enrich=background))
+        collected = main.collect_news(run_config, logger, target, SyntheticRegistry(feeds, logger))
+        summarizer = FakeSummarizer(run_config, logger, FakeLLMClient(args.llm_latency, args.llm_jitter, 0.0, args.seed))
+        waits = []
+        last = [time.perf_counter()]
+
+        def operator(category, news_list, max_items, logger):
+            # 직전 q 이후 이 목록이 화면에 나오기까지 기다린 시간
+            waits.append(time.perf_counter() - last[0])
+            time.sleep(args.think)
+            last[0] = time.perf_counter()
+            return news_list[:max_items]
+
+        main.curate_category = operator
+        try:
+            run_args = argparse.Namespace(auto=False, async_mode=False)
+            main.build_newsletter(collected, run_args, run_config, logger, main.RunMetrics(), summarizer,
+                                  newsletter_date=target)
+        finally:
+            main.curate_category = curate
+        return sum(waits), waits, Path(f"newsletter_{target.strftime('%Y%m%d')}.html").read_text(encoding='utf-8')
+
+    cwd = os.getcwd()
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            shutil.copy(template, workdir)
+            os.chdir(workdir)
+            sequential = run(False)
+            background = run(True)
+    finally:
+        os.chdir(cwd)
+
+    print(f"[큐레이션] 엔트리 {args.entries}개, 카테고리 {len(sequential[1])}개, 운영자 검토 {args.think}초/카테고리, "
+          f"가짜 LLM 지연 {args.llm_latency}초")
+    for label, (total, waits, _) in (('카테고리마다 요약', sequential), ('백그라운드 요약', background)):
+        print(f"  {label:<12} 대기 합계 {total:6.2f}초 (카테고리별 " + ', '.join(f"{w:.1f}" for w in waits) + ")")
+    same = sequential[2] == background[2]
+    print(f"결과 HTML 동일: {same}")
+    if not same:
+        sys.exit(1)
+
+
+def record_fixtures(args: argparse.Namespace):
+    """설정의 RSS 피드를 내려받아 픽스처로 저장 (index.json: URL → 파일명)"""
+    with open(args.config, 'r', encoding='utf-8') as f:
+        config = yaml.safe_load(f)
+    out = Path(args.fixtures)
+    out.mkdir(parents=True, exist_ok=True)
+    session = requests.Session()
+    session.headers['User-Agent'] = main.FeedCache.USER_AGENT
+    index = {}
+    for url in main.collect_feed_urls(config):
+        name = f"{hashlib.sha1(url.encode('utf-8')).hexdigest()[:12]}.xml"
+        try:
+            response = session.get(url, timeout=args.timeout)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            print(f"  실패: {url} ({e})")
+            continue
+        (out / name).write_bytes(response.content)
+        index[url] = name
+        print(f"  저장: {url} → {name} ({len(response.content) / 1024:.0f}KB)")
+    with open(out / 'index.json', 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, indent=2)
+    print(f"픽스처 {len(index)}개 저장: {out}")
+
+
+# =================================================================
+# 시작 시간 벤치마크 (python -X importtime)
+# =================================================================
+# 모듈 import 시점에는 로드되면 안 되는 무거운 라이브러리 (사용 단계에서 지연 import)
+LAZY_MODULES = [
+    'feedparser', 'requests', 'bs4', 'dateutil', 'jinja2',
+    'google.generativeai', 'openai', 'anthropic', 'workalendar', 'asyncio'
+]
+# v2.0처럼 모두 즉시 import했을 때의 비교 대상
+EAGER_IMPORTS = 'import main, feedparser, requests, bs4, dateutil.parser, jinja2'
+
+
+def import_times(code: str, cwd: str) -> List[tuple]:
+    """-X importtime 출력을 (깊이, 누적 µs, 모듈명) 목록으로 (출력 순서: 하위 모듈이 상위보다 먼저)"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=cwd, capture_output=True, text=True, check=True
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        rows.append((depth, int(cumulative), name.strip()))
+    return rows
+
+
+def import_children(rows: List[tuple], module: str) -> List[tuple]:
+    """module이 직접 import한 (누적 µs, 모듈명) 목록"""
+    children = []
+    for index, (depth, _, name) in enumerate(rows):
+        if depth == 0 and name == module:
+            for child_depth, cumulative, child in reversed(rows[:index]):
+                if child_depth == 0:
+                    break
+                if child_depth == 1:
+                    children.append((cumulative, child))
+            break
+    return children
+
+
+def bench_importtime(args: argparse.Namespace):
+    """import main / main.py --test 시작 시간과 지연 import 회귀 검사"""
+    root = str(Path(__file__).resolve().parent)
+
+    def total(code: str, modules: List[str]) -> float:
+        """top-level로 import한 modules의 누적 시간 합 (ms, 중앙값)"""
+        samples = []
+        for _ in range(args.repeat):
+            rows = import_times(code, root)
+            samples.append(sum(cumulative for depth, cumulative, name in rows if depth == 0 and name in modules))
+        return sorted(samples)[len(samples) // 2] / 1000
+
+    eager_modules = [name.strip() for name in EAGER_IMPORTS[len('import '):].split(',')]
+    lazy_ms = total('import main', ['main'])
+    eager_ms = total(EAGER_IMPORTS, eager_modules)
+    print(f"[import] 중앙값 {args.repeat}회 (인터프리터 시작/site 제외)")
+    print(f"  import main (지연 import):         {lazy_ms:>7.1f}ms")
+    print(f"  import main + 파서/HTTP 즉시 로드: {eager_ms:>7.1f}ms")
+
+    children = sorted(import_children(import_times('import main', root), 'main'), reverse=True)
+    print(f"  main이 import하는 모듈 상위 {args.top}개:")
+    for cumulative, name in children[:args.top]:
+        print(f"    {cumulative / 1000:>7.1f}ms  {name}")
+
+    # main.py --test 전체 실행 시간 (설정만 복사한 임시 디렉토리에서)
+    samples = []
+    with tempfile.TemporaryDirectory() as workdir:
+        shutil.copy(Path(root) / args.config, Path(workdir) / 'config.yaml')
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, str(Path(root) / 'main.py'), '--test'],
+                           cwd=workdir, capture_output=True, check=True)
+            samples.append(time.perf_counter() - start)
+    print(f"[main.py --test] 중앙값 {sorted(samples)[len(samples) // 2] * 1000:.0f}ms")
+
+    loaded = subprocess.run(
+        [sys.executable, '-c', 'import json, sys, main; '
+         f'print(json.dumps([m for m in {LAZY_MODULES!r} if m in sys.modules]))'],
+        cwd=root, capture_output=True, text=True, check=True
+    )
+    eager = json.loads(loaded.stdout)
+    if eager:
+        print(f"지연 import 회귀: import main 시 로드됨 → {', '.join(eager)}")
+        sys.exit(1)
+    print("지연 import 확인: import main 시 무거운 라이브러리 미로드")
+
+
+# =================================================================
+# 메인 실행
+# =================================================================
+def main_cli():
+    parser = argparse.ArgumentParser(description='DTNC 성능 벤치마크')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    dedup = subparsers.add_parser('dedup', help='중복 제거 (MinHash LSH vs 전체 쌍 비교)')
+    dedup.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000], help='제목 수')
+    dedup.add_argument('--threshold', type=float, default=0.7, help='유사도 기준')
+    dedup.add_argument('--legacy-max', type=int, default=1000, help='기존 구현을 실제로 실행할 최대 제목 수')
+    dedup.add_argument('--seed', type=int, default=42)
+    dedup.set_defaults(func=bench_dedup)
+
+    keywords = subparsers.add_parser('keywords', help='키워드 매칭 (컴파일 매처 vs 부분 문자열 반복)')
+    keywords.add_argument('--entries', type=int, default=20000, help='엔트리 수')
+    keywords.add_argument('--config', default='config.yaml', help='키워드를 읽을 설정 파일')
+    keywords.add_argument('--seed', type=int, default=42)
+    keywords.set_defaults(func=bench_keywords)
+
+    stream = subparsers.add_parser('stream', help='피드 파싱 (날짜 범위 스트리밍 vs 전체 파싱)')
+    stream.add_argument('--days', type=int, default=60, help='피드에 담긴 일수')
+    stream.add_argument('--per-day', type=int, default=50, help='하루 엔트리 수')
+    stream.add_argument('--target-offset', type=int, default=2, help='대상 날짜 (최신 날짜로부터 며칠 전)')
+    stream.add_argument('--margin-days', type=int, default=1)
+    stream.add_argument('--stop-after', type=int, default=10)
+    stream.add_argument('--config', default='config.yaml', help='키워드를 읽을 설정 파일')
+    stream.add_argument('--seed', type=int, default=42)
+    stream.set_defaults(func=bench_stream)
+
+    scrape = subparsers.add_parser('scrape', help='기사 본문 (v2.0 순차 전체 파싱 vs 공유 풀/동시/크기 제한/캐시)')
+    scrape.add_argument('--articles', type=int, default=40, help='기사 수')
+    scrape.add_argument('--page-kb', type=int, default=400, help='페이지 크기 (KB)')
+    scrape.add_argument('--max-kb', type=int, default=256, help='ArticleScraper가 읽을 최대 크기 (KB)')
+    scrape.add_argument('--workers', type=int, default=8, help='동시 요청 수')
+    scrape.add_argument('--seed', type=int, default=42)
+    scrape.set_defaults(func=bench_scrape)
+
+    memory = subparsers.add_parser('memory', help='수집 메모리 (feedparser 결과/dict vs FeedEntry/NewsItem, tracemalloc)')
+    memory.add_argument('--feeds', type=int, default=50, help='합성 피드 수')
+    memory.add_argument('--days', type=int, default=7, help='피드에 담긴 일수 (전부 수집)')
+    memory.add_argument('--per-day', type=int, default=40, help='피드당 하루 엔트리 수')
+    memory.add_argument('--config', default='config.yaml', help='카테고리/키워드 설정 파일')
+    memory.add_argument('--seed', type=int, default=42)
+    memory.add_argument('--variant', choices=['legacy', 'compact'], help=argparse.SUPPRESS)
+    memory.add_argument('--child-config', help=argparse.SUPPRESS)
+    memory.add_argument('--newest', help=argparse.SUPPRESS)
+    memory.set_defaults(func=bench_memory)
+
+    parse = subparsers.add_parser('parse', help='피드 파싱/분류 (스레드 vs 파싱 프로세스 풀)')
+    parse.add_argument('--feeds', type=int, default=64, help='합성 피드 수')
+    parse.add_argument('--days', type=int, default=7, help='피드에 담긴 일수 (전부 수집)')
+    parse.add_argument('--per-day', type=int, default=40, help='피드당 하루 엔트리 수')
+    parse.add_argument('--processes', type=int, nargs='+', default=[0, os.cpu_count() or 1],
+                       help='비교할 파싱 프로세스 수 (0: 스레드에서 직접, 첫 값이 기준)')
+    parse.add_argument('--workers', type=int, default=16, help='다운로드 스레드 수')
+    parse.add_argument('--config', default='config.yaml', help='카테고리/키워드 설정 파일')
+    parse.add_argument('--seed', type=int, default=42)
+    parse.set_defaults(func=bench_parse)
+
+    archive = subparsers.add_parser('archive', help='발행 이력 조회 (HTML 전체 읽기 vs 아카이브 색인)')
+    archive.add_argument('--days', type=int, default=365, help='아카이브 호수 (일)')
+    archive.add_argument('--items', type=int, default=40, help='호당 기사 수')
+    archive.add_argument('--seed', type=int, default=42)
+    archive.set_defaults(func=bench_archive)
+
+    pipeline = subparsers.add_parser('pipeline', help='오프라인 파이프라인 (피드 픽스처 + 가짜 LLM, 기준선 비교)')
+    pipeline.add_argument('--config', default='config.yaml', help='카테고리/RSS 설정 파일')
+    pipeline.add_argument('--fixtures', default='benchmarks/fixtures', help='record로 저장한 픽스처 (없으면 합성 피드)')
+    pipeline.add_argument('--entries-per-feed', type=int, default=140, help='합성 피드당 엔트리 수')
+    pipeline.add_argument('--days', type=int, default=7, help='합성 피드에 담긴 일수')
+    pipeline.add_argument('--llm-latency', type=float, default=0.05, help='가짜 LLM 응답 지연 (초)')
+    pipeline.add_argument('--llm-jitter', type=float, default=0.2, help='지연 변동 비율')
+    pipeline.add_argument('--llm-rpm', type=float, default=0, help='가짜 LLM 분당 요청 제한 (0: 무제한)')
+    pipeline.add_argument('--llm-tpm', type=float, default=0, help='가짜 LLM 분당 토큰 제한 (0: 무제한)')
+    pipeline.add_argument('--llm-error-rate', type=float, default=0.0, help='429 오류 비율')
+    pipeline.add_argument('--baseline', default='benchmarks/baseline.json', help='비교할 기준선')
+    pipeline.add_argument('--save-baseline', metavar='PATH', help='결과를 기준선으로 저장')
+    pipeline.add_argument('--tolerance', type=float, default=0.25, help='회귀로 판단할 소요 시간 증가율')
+    pipeline.add_argument('--min-delta', type=float, default=0.05, help='회귀로 판단할 최소 증가 시간 (초, 짧은 단계의 측정 잡음 무시)')
+    pipeline.add_argument('--seed', type=int, default=42)
+    pipeline.set_defaults(func=bench_pipeline)
+
+    curation = subparsers.add_parser('curation', help='수동 큐레이션 대기 시간 (카테고리별 요약 vs 백그라운드 요약)')
+    curation.add_argument('--config', default='config.yaml', help='카테고리/RSS 설정 파일')
+    curation.add_argument('--entries', type=int, default=5000, help='합성 엔트리 수')
+    curation.add_argument('--think', type=float, default=2.0, help='운영자가 카테고리 하나를 검토하는 시간 (초)')
+    curation.add_argument('--llm-latency', type=float, default=0.5, help='가짜 LLM 응답 지연 (초)')
+    curation.add_argument('--llm-jitter', type=float, default=0.2, help='지연 변동 비율')
+    curation.add_argument('--seed', type=int, default=42)
+    curation.set_defaults(func=bench_curation)
+
+    record = subparsers.add_parser('record', help='설정의 RSS 피드를 픽스처로 저장 (네트워크 필요)')
+    record.add_argument('--config', default='config.yaml')
+    record.add_argument('--fixtures', default='benchmarks/fixtures', help='저장할 디렉토리')
+    record.add_argument('--timeout', type=float, default=15)
+    record.set_defaults(func=record_fixtures)
+
+    importtime = subparsers.add_parser('importtime', help='시작 시간 (python -X importtime, 지연 import 회귀 검사)')
+    importtime.add_argument('--repeat', type=int, default=5, help='반복 횟수 (중앙값 사용)')
+    importtime.add_argument('--top', type=int, default=10, help='출력할 상위 모듈 수')
+    importtime.add_argument('--config', default='config.yaml', help='--test 실행에 사용할 설정 파일')
+    importtime.set_defaults(func=bench_importtime)
+
+    args = parser.parse_args()
+    logging.getLogger('DTNC').addHandler(logging.NullHandler())
+    args.func(args)
+
+
+if __name__ == "__main__":
+    try:
+        main_cli()
+    except KeyboardInterrupt:
+        print("\n\n>>> 사용자에 의해 중단되었습니다.")
+        sys.exit(0)
@@ -8,7 +8,6 @@ MS본부 뉴스레터 자동 생성 시스템
 """
 
 import yaml
-import feedparser
 import difflib
 import os
 import sys
@@ -17,15 +16,24 @@ import logging
 import argparse
 import json
 import re
+import hashlib
+import importlib.util
+import math
+import random
+import sqlite3
+from array import array
 import time
-import requests
 import socket
-from datetime import datetime, date
-from dateutil import parser as date_parser
-from jinja2 import Environment, FileSystemLoader
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from datetime import datetime, date, timedelta
 from pathlib import Path
 from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
+
+# 무거운 파서/HTTP 라이브러리(feedparser, requests, bs4, dateutil, jinja2)와 AI SDK는
+# 해당 단계가 실행될 때 함수 안에서 import (--test, 공휴일 종료 등 빠른 경로의 시작 시간 단축)
 
 # RSS 피드 파싱 시 타임아웃 설정 (초)
 socket.setdefaulttimeout(15)
@@ -37,30 +45,23 @@ try:
 except ImportError:
     print("⚠️ python-dotenv가 설치되지 않았습니다. 환경 변수를 시스템에서 로드합니다.")
 
-# AI 라이브러리 (선택사항)
-AI_AVAILABLE = {
-    'gemini': False,
-    'openai': False,
-    'claude': False
+# AI 라이브러리 (선택사항, 설정된 프로바이더의 SDK만 클라이언트 초기화 시 import)
+AI_MODULES = {
+    'gemini': 'google.generativeai',
+    'openai': 'openai',
+    'claude': 'anthropic'
 }
 
-try:
-    import google.generativeai as genai
-    AI_AVAILABLE['gemini'] = True
-except ImportError:
-    pass
-
-try:
-    from openai import OpenAI
-    AI_AVAILABLE['openai'] = True
-except ImportError:
-    pass
 
-try:
-    from anthropic import Anthropic
-    AI_AVAILABLE['claude'] = True
-except ImportError:
-    pass
+def ai_available() -> Dict[str, bool]:
+    """프로바이더별 SDK 설치 여부 (import 없이 확인)"""
+    available = {}
+    for provider, module in AI_MODULES.items():
+        try:
+            available[provider] = importlib.util.find_spec(module) is not None
+        except (ImportError, ValueError):
+            available[provider] = False
+    return available
 
 
 # =================================================================
@@ -141,25 +142,362 @@ def should_skip_today(config: dict, logger: logging.Logger) -> bool:
     return False
 
 
+# =================================================================
+# 실행 지표 (단계별 소요 시간)
+# =================================================================
+class RunMetrics:
+    """
+    실행 단위 성능 지표
+    단계별 소요 시간, 피드별 다운로드/파싱/필터 시간과 크기,
+    카테고리별 중복 제거/스코어링/요약 시간, LLM 호출 지연/토큰/대기 시간을 기록
+    """
+
+    def __init__(self):
+        self.started_at = datetime.now()
+        self.stages = {}      # 단계 → 누적 소요 시간 (초)
+        self.feeds = {}       # URL → fetch/parse/filter(초), bytes, entries, kept
+        self.categories = {}  # 카테고리 → collected/unique 개수, dedup/score/enrich(초)
+        self.llm = {
+            'calls': 0, 'errors': 0, 'retries': 0, 'latencies': [],
+            'prompt_tokens': 0, 'output_tokens': 0, 'rate_limit_wait': 0.0, 'backoff_wait': 0.0
+        }
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name: str, category: str = None):
+        """with 블록 소요 시간을 단계(및 카테고리)에 누적"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self.stages[name] = self.stages.get(name, 0.0) + elapsed
+            if category is not None:
+                self.record_category(category, **{name: elapsed})
+
+    @staticmethod
+    def _add(target: dict, values: dict):
+        for key, value in values.items():
+            target[key] = target.get(key, 0) + value
+
+    def record_feed(self, url: str, **values):
+        with self._lock:
+            self._add(self.feeds.setdefault(url, {}), values)
+
+    def record_category(self, category: str, **values):
+        with self._lock:
+            self._add(self.categories.setdefault(category, {}), values)
+
+    def record_llm(self, latency: float = None, prompt_tokens: int = 0, output_tokens: int = 0,
+                   rate_limit_wait: float = 0.0, backoff_wait: float = 0.0, error: bool = False,
+                   retry: bool = False):
+        """LLM 호출 시도 1회 (토큰은 문자 4개 ≈ 1토큰 추정, retry: 실패 후 재시도 예정)"""
+        with self._lock:
+            llm = self.llm
+            llm['calls'] += 1
+            llm['errors'] += int(error)
+            llm['retries'] += int(retry)
+            if latency is not None:
+                llm['latencies'].append(latency)
+            llm['prompt_tokens'] += prompt_tokens
+            llm['output_tokens'] += output_tokens
+            llm['rate_limit_wait'] += rate_limit_wait
+            llm['backoff_wait'] += backoff_wait
+
+    @staticmethod
+    def percentile(values: List[float], pct: float) -> float:
+        """최근접 순위 백분위수"""
+        if not values:
+            return 0.0
+        ordered = sorted(values)
+        return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+    def to_dict(self) -> dict:
+        """JSON 저장용 사전"""
+        with self._lock:
+            latencies = list(self.llm['latencies'])
+            llm = {k: v for k, v in self.llm.items() if k != 'latencies'}
+            llm['latency'] = {
+                'p50': self.percentile(latencies, 50),
+                'p90': self.percentile(latencies, 90),
+                'p99': self.percentile(latencies, 99),
+                'max': max(latencies, default=0.0),
+                'total': sum(latencies)
+            }
+            return {
+                'started_at': self.started_at.strftime('%Y-%m-%d %H:%M:%S'),
+                'elapsed': (datetime.now() - self.started_at).total_seconds(),
+                'stages': dict(self.stages),
+                'feeds': {url: dict(values) for url, values in self.feeds.items()},
+                'categories': {cat: dict(values) for cat, values in self.categories.items()},
+                'llm': llm
+            }
+
+    def save(self, path: Path):
+        """JSON 파일로 저장"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+
+    def log_summary(self, logger: logging.Logger, slowest_feeds: int = 5):
+        """단계별 요약 표 로그"""
+        data = self.to_dict()
+        logger.info("\n>>> [실행 지표] 단계별 소요 시간")
+        for name, elapsed in data['stages'].items():
+            logger.info(f"    {name:<12} {elapsed:>8.2f}초")
+        logger.info(f"    {'전체':<12} {data['elapsed']:>8.2f}초")
+
+        feeds = data['feeds']
+        if feeds:
+            total_bytes = sum(v.get('bytes', 0) for v in feeds.values())
+            logger.info(
+                f">>> 피드 {len(feeds)}개: 다운로드 {sum(v.get('fetch', 0) for v in feeds.values()):.2f}초 / "
+                f"파싱 {sum(v.get('parse', 0) for v in feeds.values()):.2f}초 / "
+                f"필터 {sum(v.get('filter', 0) for v in feeds.values()):.2f}초, {total_bytes / 1024:.0f}KB (스레드 누적)"
+            )
+            by_cost = sorted(
+                feeds.items(), key=lambda item: item[1].get('fetch', 0) + item[1].get('parse', 0), reverse=True
+            )
+            for url, values in by_cost[:slowest_feeds]:
+                logger.info(
+                    f"    {url}: 다운로드 {values.get('fetch', 0):.2f}초, 파싱 {values.get('parse', 0):.2f}초, "
+                    f"필터 {values.get('filter', 0):.2f}초, {values.get('bytes', 0) / 1024:.0f}KB"
+                )
+
+        if data['categories']:
+            logger.info(f"    {'카테고리':<14} {'수집':>5} {'중복제거후':>6} {'중복제거':>8} {'스코어링':>8} {'AI요약':>8}")
+            for cat, values in data['categories'].items():
+                logger.info(
+                    f"    {cat:<16} {values.get('collected', 0):>5} {values.get('unique', 0):>8} "
+                    f"{values.get('dedup', 0):>9.3f}초 {values.get('score', 0):>7.3f}초 {values.get('enrich', 0):>7.2f}초"
+                )
+
+        llm = data['llm']
+        if llm['calls']:
+            latency = llm['latency']
+            logger.info(
+                f">>> LLM: 호출 {llm['calls']}회 (오류 {llm['errors']}회, 재시도 {llm['retries']}회), 지연 p50 {latency['p50']:.2f}초 / "
+                f"p90 {latency['p90']:.2f}초 / p99 {latency['p99']:.2f}초, "
+                f"토큰(추정) 입력 {llm['prompt_tokens']} / 출력 {llm['output_tokens']}, "
+                f"제한 대기 {llm['rate_limit_wait']:.1f}초 / 백오프 {llm['backoff_wait']:.1f}초"
+            )
+
+
+# =================================================================
+# API 호출 제한 (토큰 버킷)
+# =================================================================
+class RateLimiter:
+    """
+    요청 수(RPM)와 토큰 수(TPM) 토큰 버킷
+    할당량 내에서는 즉시 통과(버스트 허용), 초과 시 필요한 만큼만 대기
+    """
+
+    def __init__(self, rpm: float = 0, tpm: float = 0):
+        self.rpm = float(rpm or 0)
+        self.tpm = float(tpm or 0)
+        self._requests = self.rpm
+        self._tokens = self.tpm
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        if self.rpm:
+            self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60)
+        if self.tpm:
+            self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60)
+
+    def acquire(self, tokens: int = 0) -> float:
+        """요청 1회 + tokens만큼 차감, 대기한 시간(초) 반환"""
+        # TPM보다 큰 요청은 버킷 용량으로 제한 (무한 대기 방지)
+        tokens = min(tokens, self.tpm) if self.tpm else 0
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                wait = 0.0
+                if self.rpm and self._requests < 1:
+                    wait = max(wait, (1 - self._requests) * 60 / self.rpm)
+                if self.tpm and self._tokens < tokens:
+                    wait = max(wait, (tokens - self._tokens) * 60 / self.tpm)
+                if wait <= 0:
+                    if self.rpm:
+                        self._requests -= 1
+                    if self.tpm:
+                        self._tokens -= tokens
+                    return waited
+            time.sleep(wait)
+            waited += wait
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """
+    429 / 할당량 초과 오류 여부 (프로바이더 SDK 공통)
+    openai/anthropic: RateLimitError(status_code 429), gemini(google.api_core): ResourceExhausted/TooManyRequests(code 429)
+    오류 메시지 문자열은 보지 않음 (ID/URL/바이트 수에 들어간 "429"로 오판하지 않도록)
+    """
+    status = getattr(error, 'status_code', None) or getattr(getattr(error, 'response', None), 'status_code', None)
+    if status == 429 or getattr(error, 'code', None) == 429:
+        return True
+    return any(cls.__name__ in ('RateLimitError', 'ResourceExhausted', 'TooManyRequests')
+               for cls in type(error).__mro__)
+
+
+# =================================================================
+# AI 요약/번역 캐시
+# =================================================================
+def normalize_link(link: str) -> str:
+    """캐시/중복 판별용 링크 정규화 (스킴/호스트 소문자, 프래그먼트·utm 파라미터·끝 슬래시 제거)"""
+    parts = urllib.parse.urlsplit((link or '').strip())
+    query = urllib.parse.urlencode([
+        (k, v) for k, v in urllib.parse.parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith('utm_')
+    ])
+    path = parts.path.rstrip('/') or '/'
+    return urllib.parse.urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, query, ''))
+
+
+class SummaryCache:
+    """
+    AI 요약/번역 결과 영구 캐시 (SQLite)
+    키: 정규화 링크 + 본문 해시 + 프로바이더/모델 + 프롬프트 해시
+    """
+
+    def __init__(self, db_path: str, max_age_days: float = 30, max_entries: int = 20000):
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS ai_cache ("
+            "key TEXT PRIMARY KEY, kind TEXT NOT NULL, value TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_ai_cache_created ON ai_cache(created_at)")
+        self.conn.commit()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self.evict(max_age_days, max_entries)
+
+    @staticmethod
+    def make_key(kind: str, link: str, content: str, model: str, prompt_hash: str) -> str:
+        content_hash = hashlib.sha1(content.encode('utf-8')).hexdigest()
+        raw = '|'.join([kind, normalize_link(link), content_hash, model, prompt_hash])
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self.conn.execute("SELECT value FROM ai_cache WHERE key = ?", (key,)).fetchone()
+            if row:
+                self.hits += 1
+                return row[0]
+            self.misses += 1
+            return None
+
+    def set(self, key: str, kind: str, value: str):
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO ai_cache (key, kind, value, created_at) VALUES (?, ?, ?, ?)",
+                (key, kind, value, time.time())
+            )
+            self.conn.commit()
+
+    def evict(self, max_age_days: float, max_entries: int):
+        """보관 기간 초과 항목 삭제 후, 최대 개수 초과분은 오래된 순으로 삭제"""
+        with self._lock:
+            if max_age_days:
+                self.conn.execute("DELETE FROM ai_cache WHERE created_at < ?",
+                                  (time.time() - max_age_days * 86400,))
+            if max_entries:
+                self.conn.execute(
+                    "DELETE FROM ai_cache WHERE key IN ("
+                    "SELECT key FROM ai_cache ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+                    (max_entries,)
+                )
+            self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+
 # =================================================================
 # AI 요약 생성
 # =================================================================
 class AISummarizer:
     """AI 기반 뉴스 요약 생성"""
 
-    def __init__(self, config: dict, logger: logging.Logger):
+    def __init__(self, config: dict, logger: logging.Logger, metrics: RunMetrics = None):
         self.config = config
         self.logger = logger
+        self.metrics = metrics
         self.ai_config = config.get('ai_summary', {})
         self.provider = os.getenv('AI_SUMMARY_PROVIDER', self.ai_config.get('provider', 'none'))
         self.enabled = os.getenv('USE_AI_SUMMARY', str(self.ai_config.get('enabled', False))).lower() == 'true'
 
+        # 호출 제한 및 통계
+        limits = self.ai_config.get('rate_limits', {}).get(self.provider, {})
+        self.rate_limiter = RateLimiter(limits.get('rpm', 0), limits.get('tpm', 0))
+        self.max_retries = self.ai_config.get('max_retries', 4)
+        self.backoff_base = self.ai_config.get('backoff_base', 2.0)
+        self.stats = {'requests': 0, 'retries': 0, 'wait_time': 0.0, 'first_call': None, 'last_call': None}
+        self._stats_lock = threading.Lock()
+
+        # 모델명 (캐시 키에 사용)
+        model_env = {
+            'gemini': ('GEMINI_MODEL', 'gemini-2.0-flash-exp'),
+            'openai': ('OPENAI_MODEL', 'gpt-4o-mini'),
+            'claude': ('CLAUDE_MODEL', 'claude-3-haiku-20240307')
+        }.get(self.provider)
+        self.model_name = f"{self.provider}:{os.getenv(*model_env) if model_env else ''}"
+
         if self.enabled and self.provider != 'none':
             self._initialize_client()
 
+        # 요약/번역 캐시 (프롬프트가 바뀌면 키가 달라져 자동 무효화)
+        self.cache = None
+        cache_config = self.ai_config.get('cache', {})
+        if self.enabled and cache_config.get('enabled', False):
+            self.cache = SummaryCache(
+                cache_config.get('path', 'cache/ai_cache.sqlite3'),
+                max_age_days=cache_config.get('max_age_days', 30),
+                max_entries=cache_config.get('max_entries', 20000)
+            )
+        prompts = '\x00'.join([
+            self.ai_config.get('prompt_template', ''),
+            self.ai_config.get('batch_prompt_template', self.BATCH_PROMPT),
+            self.TRANSLATE_PROMPT
+        ])
+        self.prompt_hash = hashlib.sha1(prompts.encode('utf-8')).hexdigest()[:16]
+
+    def _cache_key(self, kind: str, link: str, content: str) -> str:
+        return SummaryCache.make_key(kind, link, content, self.model_name, self.prompt_hash)
+
+    def _cache_get(self, kind: str, link: str, content: str) -> Optional[str]:
+        if self.cache is None:
+            return None
+        return self.cache.get(self._cache_key(kind, link, content))
+
+    def _cache_set(self, kind: str, link: str, content: str, value: str):
+        if self.cache is not None:
+            self.cache.set(self._cache_key(kind, link, content), kind, value)
+
     def _initialize_client(self):
-        """AI 클라이언트 초기화"""
-        if self.provider == 'gemini' and AI_AVAILABLE['gemini']:
+        """AI 클라이언트 초기화 (설정된 프로바이더의 SDK만 import)"""
+        try:
+            if self.provider == 'gemini':
+                import google.generativeai as genai
+            elif self.provider == 'openai':
+                from openai import OpenAI
+            elif self.provider == 'claude':
+                from anthropic import Anthropic
+        except ImportError:
+            self.logger.info("AI 요약 기능이 비활성화되어 있습니다.")
+            self.enabled = False
+            return
+
+        if self.provider == 'gemini':
             api_key = os.getenv('GEMINI_API_KEY')
             if api_key:
                 genai.configure(api_key=api_key)
@@ -170,7 +508,7 @@ class AISummarizer:
                 self.logger.warning("GEMINI_API_KEY가 설정되지 않았습니다.")
                 self.enabled = False
 
-        elif self.provider == 'openai' and AI_AVAILABLE['openai']:
+        elif self.provider == 'openai':
             api_key = os.getenv('OPENAI_API_KEY')
             if api_key:
                 self.client = OpenAI(api_key=api_key)
@@ -179,7 +517,7 @@ class AISummarizer:
                 self.logger.warning("OPENAI_API_KEY가 설정되지 않았습니다.")
                 self.enabled = False
 
-        elif self.provider == 'claude' and AI_AVAILABLE['claude']:
+        elif self.provider == 'claude':
             api_key = os.getenv('CLAUDE_API_KEY')
             if api_key:
                 self.client = Anthropic(api_key=api_key)
@@ -191,101 +529,269 @@ class AISummarizer:
             self.logger.info("AI 요약 기능이 비활성화되어 있습니다.")
             self.enabled = False
 
-    def summarize(self, title: str, description: str) -> str:
+    def _complete(self, prompt: str, max_tokens: int = None, temperature: float = None) -> str:
+        """
+        호출 제한을 적용한 프롬프트 호출
+        429/할당량 오류는 지터를 준 지수 백오프로 재시도
+        """
+        # TPM 추정: 입력(문자 4개 ≈ 1토큰) + 최대 출력 토큰
+        estimated_tokens = len(prompt) // 4 + (max_tokens or 200)
+
+        attempt = 0
+        while True:
+            waited = self.rate_limiter.acquire(estimated_tokens)
+            start = time.time()
+            with self._stats_lock:
+                self.stats['requests'] += 1
+                self.stats['wait_time'] += waited
+                if self.stats['first_call'] is None:
+                    self.stats['first_call'] = start
+
+            try:
+                result = self._call_provider(prompt, max_tokens, temperature)
+                with self._stats_lock:
+                    self.stats['last_call'] = time.time()
+                if self.metrics:
+                    self.metrics.record_llm(
+                        time.time() - start, len(prompt) // 4, len(result) // 4, rate_limit_wait=waited
+                    )
+                return result
+            except Exception as e:
+                retry = is_rate_limit_error(e) and attempt < self.max_retries
+                delay = self.backoff_base * (2 ** attempt) * random.uniform(0.5, 1.5) if retry else 0.0
+                if self.metrics:
+                    self.metrics.record_llm(
+                        time.time() - start, len(prompt) // 4, rate_limit_wait=waited,
+                        backoff_wait=delay, error=True, retry=retry
+                    )
+                if not retry:
+                    raise
+                attempt += 1
+                self.logger.info(f"AI 호출 제한 (429), {delay:.1f}초 후 재시도 ({attempt}/{self.max_retries})")
+                with self._stats_lock:
+                    self.stats['retries'] += 1
+                    self.stats['wait_time'] += delay
+                time.sleep(delay)
+
+    def _call_provider(self, prompt: str, max_tokens: int = None, temperature: float = None) -> str:
+        """프로바이더별 단일 프롬프트 호출 (응답 텍스트 반환)"""
+        if self.provider == 'gemini':
+            response = self.client.generate_content(prompt)
+            return response.text.strip()
+
+        elif self.provider == 'openai':
+            response = self.client.chat.completions.create(
+                model=os.getenv('OPENAI_MODEL', 'gpt-4o-mini'),
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=max_tokens or int(os.getenv('OPENAI_MAX_TOKENS', '200')),
+                temperature=temperature if temperature is not None else float(os.getenv('OPENAI_TEMPERATURE', '0.3'))
+            )
+            return response.choices[0].message.content.strip()
+
+        elif self.provider == 'claude':
+            response = self.client.messages.create(
+                model=os.getenv('CLAUDE_MODEL', 'claude-3-haiku-20240307'),
+                max_tokens=max_tokens or int(os.getenv('CLAUDE_MAX_TOKENS', '200')),
+                messages=[{"role": "user", "content": prompt}]
+            )
+            return response.content[0].text.strip()
+
+        raise ValueError(f"지원하지 않는 AI 프로바이더: {self.provider}")
+
+    def log_stats(self):
+        """AI 호출 통계 로그 (요청 수, 실제 처리율, 대기 시간, 캐시 적중)"""
+        if self.cache is not None:
+            self.logger.info(f">>> AI 캐시: 적중 {self.cache.hits}회 / 미스 {self.cache.misses}회")
+
+        stats = self.stats
+        if not stats['requests']:
+            return
+        elapsed = (stats['last_call'] or time.time()) - stats['first_call']
+        rate = stats['requests'] / elapsed if elapsed > 0 else float(stats['requests'])
+        self.logger.info(
+            f">>> AI 호출: {stats['requests']}회, {rate:.2f} req/s, "
+            f"제한 대기 {stats['wait_time']:.1f}초, 재시도 {stats['retries']}회"
+        )
+
+    def _truncate_summary(self, summary: str) -> str:
+        """요약 길이 제한"""
+        max_length = self.ai_config.get('max_summary_length', 200)
+        if len(summary) > max_length:
+            summary = summary[:max_length] + "..."
+        return summary
+
+    def summarize(self, title: str, description: str, link: str = '') -> str:
         """뉴스 요약 생성"""
+        return self.summarize_with_status(title, description, link)[0]
+
+    def summarize_with_status(self, title: str, description: str, link: str = '') -> tuple:
+        """(요약, AI 요약 여부) - 비활성/실패 시 RSS 설명 대체 요약과 False (저널은 True만 기록)"""
         if not self.enabled:
-            return self._fallback_summary(description)
+            return self._fallback_summary(description), False
+
+        content = f"{title}\n{description[:1200]}"
+        cached = self._cache_get('summary', link, content)
+        if cached is not None:
+            return cached, True
 
         try:
             prompt = self.ai_config.get('prompt_template', '').format(
                 title=title,
                 description=description[:1200]  # 최대 1200자로 증가
             )
+            summary = self._truncate_summary(self._complete(prompt))
+            self._cache_set('summary', link, content, summary)
+            return summary, True
 
-            if self.provider == 'gemini':
-                # API 할당량 문제 방지를 위한 지연
-                # gemini-1.5-flash: 15 RPM (분당 15개)
-                time.sleep(1.5)  # 1.5초 지연으로 안전하게 설정
-                response = self.client.generate_content(prompt)
-                summary = response.text.strip()
+        except Exception as e:
+            self.logger.warning(f"AI 요약 실패: {str(e)}")
+            if self.ai_config.get('fallback_to_rss', True):
+                return self._fallback_summary(description), False
+            return "요약을 생성할 수 없습니다.", False
 
-            elif self.provider == 'openai':
-                model = os.getenv('OPENAI_MODEL', 'gpt-4o-mini')
-                max_tokens = int(os.getenv('OPENAI_MAX_TOKENS', '200'))
-
-                response = self.client.chat.completions.create(
-                    model=model,
-                    messages=[{"role": "user", "content": prompt}],
-                    max_tokens=max_tokens,
-                    temperature=float(os.getenv('OPENAI_TEMPERATURE', '0.3'))
-                )
-                summary = response.choices[0].message.content.strip()
+    TRANSLATE_PROMPT = "다음 영문 뉴스 제목을 간결한 한글로 번역해주세요. 번역만 출력하고 다른 설명은 하지 마세요:\n\n{title}"
 
-            elif self.provider == 'claude':
-                model = os.getenv('CLAUDE_MODEL', 'claude-3-haiku-20240307')
-                max_tokens = int(os.getenv('CLAUDE_MAX_TOKENS', '200'))
+    def translate_title(self, title: str, link: str = '') -> str:
+        """영문 제목을 한글로 번역"""
+        return self.translate_title_with_status(title, link)[0]
 
-                response = self.client.messages.create(
-                    model=model,
-                    max_tokens=max_tokens,
-                    messages=[{"role": "user", "content": prompt}]
-                )
-                summary = response.content[0].text.strip()
+    def translate_title_with_status(self, title: str, link: str = '') -> tuple:
+        """(번역 제목, AI 번역 여부) - 비활성/실패 시 원제목과 False"""
+        if not self.enabled:
+            return title, False
 
-            # 길이 제한
-            max_length = self.ai_config.get('max_summary_length', 200)
-            if len(summary) > max_length:
-                summary = summary[:max_length] + "..."
+        cached = self._cache_get('title', link, title)
+        if cached is not None:
+            return cached, True
 
-            return summary
+        try:
+            prompt = self.TRANSLATE_PROMPT.format(title=title)
+            translated = self._complete(prompt, max_tokens=100, temperature=0.3)
+            self._cache_set('title', link, title, translated)
+            return translated, True
 
         except Exception as e:
-            self.logger.warning(f"AI 요약 실패: {str(e)}")
-            if self.ai_config.get('fallback_to_rss', True):
-                return self._fallback_summary(description)
-            return "요약을 생성할 수 없습니다."
+            self.logger.debug(f"제목 번역 실패: {str(e)}")
+            return title, False
+
+    BATCH_PROMPT = (
+        "다음 뉴스 기사 목록을 처리해주세요.\n"
+        "- translate가 true인 기사는 영문 제목을 간결한 한글로 번역해 title에 넣고, false면 원래 제목을 그대로 넣으세요.\n"
+        "- 각 기사에 아래 요약 지침을 적용한 결과를 summary에 넣으세요.\n"
+        "반드시 JSON 배열만 출력하세요. 형식: "
+        '[{{"id": 0, "title": "...", "summary": "..."}}]\n\n'
+        "요약 지침 (제목/내용은 각 기사의 title/description):\n{instructions}\n\n"
+        "기사 목록:\n{articles}"
+    )
+    BATCH_INSTRUCTIONS = "각 기사를 3-4줄로 한글 요약해주세요. 핵심 내용만 간결하게 작성하세요."
+
+    def _batch_instructions(self) -> str:
+        """일괄 요청의 요약 지침 (개별 요청과 같은 prompt_template에서 만듦)"""
+        template = self.ai_config.get('prompt_template', '')
+        if not template:
+            return self.BATCH_INSTRUCTIONS
+        return template.format(title='(기사 title)', description='(기사 description)').strip()
+
+    def summarize_batch(self, items: List[Dict]) -> List[Dict]:
+        """
+        여러 기사를 한 번의 요청으로 번역 + 요약
+        items: [{'title', 'description', 'translate', 'link'}] → [{'title', 'summary', 'ok'}] (같은 순서)
+        응답에서 누락/손상된 항목은 개별적으로 원제목 + _fallback_summary 사용
+        ok: 요약(과 요청한 번역)이 모두 AI 결과(캐시 포함)인지 (대체 요약은 False)
+        """
+        if not items:
+            return []
 
-    def translate_title(self, title: str) -> str:
-        """영문 제목을 한글로 번역"""
         if not self.enabled:
-            return title
-
+            return [{'title': item['title'], 'summary': self._fallback_summary(item['description']), 'ok': False}
+                    for item in items]
+
+        # 캐시에 요약(+번역)이 모두 있는 항목은 요청에서 제외
+        results = [None] * len(items)
+        pending = []
+        for idx, item in enumerate(items):
+            link = item.get('link', '')
+            summary = self._cache_get('summary', link, f"{item['title']}\n{item['description'][:1200]}")
+            title = self._cache_get('title', link, item['title']) if item.get('translate') else item['title']
+            if summary is not None and title is not None:
+                results[idx] = {'title': title, 'summary': summary, 'ok': True}
+            else:
+                pending.append(idx)
+
+        if not pending:
+            return results
+
+        articles = json.dumps([
+            {
+                'id': idx,
+                'translate': bool(items[idx].get('translate')),
+                'title': items[idx]['title'],
+                'description': items[idx]['description'][:1200]
+            }
+            for idx in pending
+        ], ensure_ascii=False, indent=1)
+        prompt = self.ai_config.get('batch_prompt_template', self.BATCH_PROMPT).format(
+            articles=articles, instructions=self._batch_instructions()
+        )
+        max_tokens = self.ai_config.get('batch_tokens_per_item', 300) * len(pending) + 100
+
+        parsed = {}
         try:
-            prompt = f"다음 영문 뉴스 제목을 간결한 한글로 번역해주세요. 번역만 출력하고 다른 설명은 하지 마세요:\n\n{title}"
+            parsed = self._parse_batch_response(self._complete(prompt, max_tokens=max_tokens))
+        except Exception as e:
+            self.logger.warning(f"AI 일괄 요약 실패 ({len(pending)}개): {str(e)}")
+
+        for idx in pending:
+            item = items[idx]
+            link = item.get('link', '')
+            entry = parsed.get(idx)
+            summary = entry.get('summary') if entry else None
+            ok = isinstance(summary, str) and bool(summary.strip())
+            if ok:
+                summary = self._truncate_summary(summary.strip())
+                self._cache_set('summary', link, f"{item['title']}\n{item['description'][:1200]}", summary)
+            else:
+                if entry is not None:
+                    self.logger.debug(f"일괄 응답 항목 손상 (id={idx}), RSS 요약 사용")
+                if self.ai_config.get('fallback_to_rss', True):
+                    summary = self._fallback_summary(item['description'])
+                else:
+                    summary = "요약을 생성할 수 없습니다."
 
-            if self.provider == 'gemini':
-                time.sleep(1.5)
-                response = self.client.generate_content(prompt)
-                return response.text.strip()
+            title = entry.get('title') if entry else None
+            if not item.get('translate') or not isinstance(title, str) or not title.strip():
+                ok = ok and not item.get('translate')
+                title = item['title']
+            else:
+                self._cache_set('title', link, item['title'], title.strip())
 
-            elif self.provider == 'openai':
-                response = self.client.chat.completions.create(
-                    model=os.getenv('OPENAI_MODEL', 'gpt-4o-mini'),
-                    messages=[{"role": "user", "content": prompt}],
-                    max_tokens=100,
-                    temperature=0.3
-                )
-                return response.choices[0].message.content.strip()
+            results[idx] = {'title': title.strip(), 'summary': summary, 'ok': ok}
 
-            elif self.provider == 'claude':
-                response = self.client.messages.create(
-                    model=os.getenv('CLAUDE_MODEL', 'claude-3-haiku-20240307'),
-                    max_tokens=100,
-                    messages=[{"role": "user", "content": prompt}]
-                )
-                return response.content[0].text.strip()
+        return results
 
-            return title
+    @staticmethod
+    def _parse_batch_response(text: str) -> Dict[int, Dict]:
+        """일괄 응답(JSON 배열) 파싱 → {id: 항목}, 코드 블록/앞뒤 설명문 허용"""
+        text = re.sub(r'^```(?:json)?\s*|\s*```$', '', text.strip())
+        start, end = text.find('['), text.rfind(']')
+        if start == -1 or end <= start:
+            raise ValueError("JSON 배열을 찾을 수 없습니다")
+        data = json.loads(text[start:end + 1])
 
-        except Exception as e:
-            self.logger.debug(f"제목 번역 실패: {str(e)}")
-            return title
+        parsed = {}
+        for position, entry in enumerate(data):
+            if not isinstance(entry, dict):
+                continue
+            try:
+                idx = int(entry.get('id', position))
+            except (TypeError, ValueError):
+                continue
+            parsed[idx] = entry
+        return parsed
 
     def _fallback_summary(self, description: str) -> str:
         """RSS description을 간단히 정리"""
-        clean = re.compile('<.*?>')
-        text = re.sub(clean, '', description)
-        text = text.strip()
+        text = clean_text(description)
 
         # 빈 텍스트 처리
         if not text or len(text) < 10:
@@ -325,95 +831,1462 @@ class AISummarizer:
 # =================================================================
 # 텍스트 정리
 # =================================================================
+HTML_TAG_PATTERN = re.compile('<.*?>')
+
+
 def clean_text(text: str) -> str:
     """HTML 태그 제거 및 텍스트 정리"""
-    clean = re.compile('<.*?>')
-    text = re.sub(clean, '', text)
-    return text.strip()
+    return HTML_TAG_PATTERN.sub('', text).strip()
+
+
+@lru_cache(maxsize=8192)
+def parse_published(value: str) -> datetime:
+    """
+    RSS 발행일 문자열 파싱 (dateutil)
+    저장소 적재와 parse_feed_entry가 같은 엔트리를 파싱하므로 결과를 캐시
+    """
+    from dateutil import parser as date_parser
+    return date_parser.parse(value)
+
+
+# =================================================================
+# 키워드 매칭
+# =================================================================
+class KeywordMatcher:
+    """
+    키워드 목록을 미리 정규화(소문자 변환, 중복 제거)해 둔 매처
+    `keyword in text` (lowercase=True면 `keyword.lower() in text.lower()`)를
+    키워드마다 반복한 것과 같은 결과를 텍스트 소문자 변환 1회로 반환
+    """
+
+    def __init__(self, keywords: List[str], lowercase: bool = True):
+        self.lowercase = lowercase
+        self.words = tuple(dict.fromkeys(kw.lower() if lowercase else kw for kw in keywords))
+
+    def _prepare(self, text: str, lowered: bool) -> str:
+        return text.lower() if self.lowercase and not lowered else text
+
+    def search(self, text: str, lowered: bool = False) -> bool:
+        """키워드가 하나라도 포함되어 있는지 (lowered=True면 이미 소문자인 텍스트)"""
+        text = self._prepare(text, lowered)
+        return any(word in text for word in self.words)
+
+    def find(self, text: str, lowered: bool = False) -> frozenset:
+        """포함된 모든 키워드 (lowered=True면 이미 소문자인 텍스트)"""
+        text = self._prepare(text, lowered)
+        return frozenset(word for word in self.words if word in text)
+
+
+@lru_cache(maxsize=256)
+def compile_keywords(keywords: tuple, lowercase: bool = True) -> KeywordMatcher:
+    """키워드 목록별 매처 캐시 (같은 목록은 1회만 정규화)"""
+    return KeywordMatcher(list(keywords), lowercase=lowercase)
+
+
+class CategoryClassifier:
+    """
+    전 카테고리 키워드를 한데 모아 엔트리를 모든 카테고리에 한 번에 분류
+    여러 카테고리에 공통인 키워드는 1회만 검사하고, 이미 확정된 카테고리의 키워드는 건너뜀
+    """
+
+    def __init__(self, config: dict):
+        keywords = {
+            cat: frozenset(kw.lower() for kw in info.get('keywords', []))
+            for cat, info in config.get('categories', {}).items()
+        }
+        # 키워드가 없는 카테고리는 항상 포함
+        self._always = frozenset(cat for cat, kws in keywords.items() if not kws)
+        self._total = len(keywords)
+        all_words = dict.fromkeys(kw for kws in keywords.values() for kw in kws)
+        self._keyword_categories = tuple(
+            (word, frozenset(cat for cat, kws in keywords.items() if word in kws))
+            for word in all_words
+        )
+
+    def classify(self, text: str) -> frozenset:
+        """텍스트에 키워드가 포함된 카테고리"""
+        text = text.lower()
+        matched = set(self._always)
+        for word, categories in self._keyword_categories:
+            if categories <= matched:
+                continue
+            if word in text:
+                matched |= categories
+                if len(matched) == self._total:
+                    break
+        return frozenset(matched)
 
 
 # =================================================================
 # 기사 본문 가져오기 (웹 스크래핑)
 # =================================================================
-def fetch_article_content(url: str, logger: logging.Logger) -> str:
+ARTICLE_BODY_NAMES = [
+    'article-body', 'article_body', 'articleBody',
+    'news-content', 'news_content', 'newsContent',
+    'post-content', 'entry-content', 'content-body'
+]
+# 본문 후보 클래스/ID를 한 번의 CSS 선택으로 탐색
+ARTICLE_BODY_SELECTOR = ', '.join(
+    [f'.{name}' for name in ARTICLE_BODY_NAMES] + [f'#{name}' for name in ARTICLE_BODY_NAMES]
+)
+
+
+def html_parser_backend() -> str:
+    """BeautifulSoup 파서 (lxml 설치 시 lxml, 없으면 내장 html.parser)"""
+    return 'lxml' if importlib.util.find_spec('lxml') else 'html.parser'
+
+
+def extract_article_text(html: bytes, encoding: str = None, max_chars: int = 2000) -> str:
+    """
+    HTML에서 기사 본문 추출 (<article> → 본문 클래스/ID → 30자 이상 <p> 10개 순)
+    100자 미만이면 빈 문자열
+    """
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, html_parser_backend(), from_encoding=encoding)
+    for tag in soup.find_all(['script', 'style', 'noscript', 'aside', 'nav']):
+        tag.decompose()
+
+    content = ""
+    article_tag = soup.find('article')
+    if article_tag:
+        for tag in article_tag.find_all(['header', 'footer']):
+            tag.decompose()
+        content = article_tag.get_text(separator=' ', strip=True)
+
+    if not content:
+        elem = soup.select_one(ARTICLE_BODY_SELECTOR)
+        if elem:
+            content = elem.get_text(separator=' ', strip=True)
+
+    if not content:
+        # 최후의 수단: 길이가 30자 이상인 <p> 태그 최대 10개
+        paragraphs = (p.get_text(strip=True) for p in soup.find_all('p'))
+        content = ' '.join([text for text in paragraphs if len(text) > 30][:10])
+
+    content = re.sub(r'\s+', ' ', content).strip()
+    if len(content) < 100:
+        return ""
+    return content[:max_chars]
+
+
+class ArticleScraper:
+    """
+    기사 본문 스크래퍼
+    공유 커넥션 풀(requests.Session)로 동시 요청하고, 응답은 앞부분 max_kb만 스트리밍으로 읽음
+    추출한 본문은 URL별로 디스크에 캐시 (cache_days 이후 다시 가져옴)
+    parse_pool을 주면 본문 추출(HTML 파싱)은 파싱 프로세스에서 실행
+    """
+
+    def __init__(self, logger: logging.Logger, cache_dir: str = None, cache_days: float = 30,
+                 max_kb: int = 256, max_chars: int = 2000, timeout: float = 10,
+                 max_workers: int = 8, per_host_limit: int = 2, parse_pool: 'ParsePool' = None):
+        self.logger = logger
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_days = cache_days
+        self.max_bytes = max_kb * 1024
+        self.max_chars = max_chars
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.per_host_limit = per_host_limit
+        self.parse_pool = parse_pool
+        self.stats = {'cached': 0, 'fetched': 0, 'failed': 0, 'bytes_read': 0}
+        self._lock = threading.Lock()
+        self._http = None
+
+    def _session(self) -> 'requests.Session':
+        """워커가 함께 쓰는 HTTP 세션 (호스트별 커넥션 풀 크기 = 동시 요청 수)"""
+        if self._http is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.max_workers)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            session.headers['User-Agent'] = (
+                'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+                '(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            )
+            self._http = session
+        return self._http
+
+    def _cache_path(self, url: str) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.txt"
+
+    def _count(self, name: str, value: int = 1):
+        with self._lock:
+            self.stats[name] += value
+
+    def fetch(self, url: str) -> str:
+        """기사 본문 (실패/본문 없음은 빈 문자열)"""
+        path = self._cache_path(url)
+        if path is not None and path.exists() and time.time() - path.stat().st_mtime < self.cache_days * 86400:
+            self._count('cached')
+            return path.read_text(encoding='utf-8')
+
+        try:
+            response = self._session().get(url, timeout=self.timeout, stream=True)
+            try:
+                response.raise_for_status()
+                content_type = response.headers.get('Content-Type', '')
+                if content_type and 'html' not in content_type:
+                    raise ValueError(f"HTML이 아닙니다 ({content_type})")
+                # 앞부분 max_bytes만 읽고 연결 종료 (본문은 대부분 페이지 앞쪽)
+                chunks, size = [], 0
+                for chunk in response.iter_content(chunk_size=16384):
+                    chunks.append(chunk)
+                    size += len(chunk)
+                    if size >= self.max_bytes:
+                        break
+                encoding = response.encoding if 'charset' in content_type.lower() else None
+            finally:
+                response.close()
+            html = b''.join(chunks)[:self.max_bytes]
+            self._count('bytes_read', len(html))
+            if self.parse_pool is not None:
+                content = self.parse_pool.extract_article(html, encoding, self.max_chars)
+            else:
+                content = extract_article_text(html, encoding, self.max_chars)
+        except Exception as e:
+            self._count('failed')
+            self.logger.debug(f"기사 가져오기 실패 (URL: {url[:50]}...): {str(e)[:50]}")
+            return ""
+
+        self._count('fetched')
+        if not content:
+            self.logger.debug(f"기사 본문이 너무 짧음 (URL: {url[:50]}...)")
+        if path is not None:
+            path.write_text(content, encoding='utf-8')
+        return content
+
+    def fetch_many(self, urls: List[str]) -> Dict[str, str]:
+        """여러 기사 동시 요청 (전체 max_workers, 호스트당 per_host_limit) → {URL: 본문}"""
+        urls = list(dict.fromkeys(urls))
+        host_limits = {
+            urllib.parse.urlparse(url).netloc.lower(): threading.BoundedSemaphore(max(1, self.per_host_limit))
+            for url in urls
+        }
+
+        def worker(url: str) -> str:
+            with host_limits[urllib.parse.urlparse(url).netloc.lower()]:
+                return self.fetch(url)
+
+        if len(urls) <= 1:
+            return {url: self.fetch(url) for url in urls}
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(urls)))) as executor:
+            return dict(zip(urls, executor.map(worker, urls)))
+
+
+def fetch_article_content(url: str, logger: logging.Logger, scraper: ArticleScraper = None) -> str:
     """
     뉴스 URL에서 실제 기사 본문 추출
     Google News RSS는 본문이 없으므로 직접 웹페이지에서 가져옴
     """
-    try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+    return (scraper or ArticleScraper(logger)).fetch(url)
+
+
+def create_article_scraper(
+    config: dict,
+    logger: logging.Logger,
+    parse_pool: 'ParsePool' = None
+) -> Optional[ArticleScraper]:
+    """설정(scrape)으로 기사 본문 스크래퍼 생성 (비활성화 시 None)"""
+    scrape_config = config.get('scrape', {})
+    if not scrape_config.get('enabled', False):
+        return None
+    return ArticleScraper(
+        logger,
+        cache_dir=scrape_config.get('cache_dir', 'cache/articles'),
+        cache_days=scrape_config.get('cache_days', 30),
+        max_kb=scrape_config.get('max_kb', 256),
+        max_chars=scrape_config.get('max_chars', 2000),
+        timeout=scrape_config.get('timeout', 10),
+        max_workers=scrape_config.get('max_workers', 8),
+        per_host_limit=scrape_config.get('per_host_limit', 2),
+        parse_pool=parse_pool
+    )
+
+
+def scrape_thin_descriptions(
+    selected: Dict[str, List['NewsItem']],
+    scraper: ArticleScraper,
+    config: dict,
+    logger: logging.Logger
+) -> int:
+    """
+    선정 뉴스 중 RSS 설명이 짧은(scrape.min_description_chars 미만 또는 제목뿐인) 항목만
+    원문 본문을 동시에 가져와 description으로 사용 (요약 입력 개선), 바꾼 개수 반환
+    """
+    thin = thin_descriptions(selected, config)
+    if not thin:
+        return 0
+
+    start = time.perf_counter()
+    contents = scraper.fetch_many([news.link for news in thin])
+    replaced = sum(apply_article_content(news, contents.get(news.link)) for news in thin)
+    log_scrape_stats(scraper, logger, len(thin), replaced, time.perf_counter() - start)
+    return replaced
+
+
+def thin_descriptions(selected: Dict[str, List['NewsItem']], config: dict) -> List['NewsItem']:
+    """요약 전인 선정 뉴스 중 RSS 설명이 짧거나(scrape.min_description_chars 미만) 제목뿐인 항목"""
+    min_chars = config.get('scrape', {}).get('min_description_chars', 200)
+    return [
+        news for news_list in selected.values() for news in news_list
+        if news.summary is None and news.link
+        and (len(news.description) < min_chars or news.description == news.original_title)
+    ]
+
+
+def apply_article_content(news: 'NewsItem', content: Optional[str]) -> bool:
+    """가져온 본문이 RSS 설명보다 길면 description으로 사용 (바꿨으면 True)"""
+    if content and len(content) > len(news.description):
+        news.description = content
+        return True
+    return False
+
+
+def log_scrape_stats(scraper: ArticleScraper, logger: logging.Logger, thin: int, replaced: int, elapsed: float):
+    stats = scraper.stats
+    logger.info(
+        f">>> 기사 본문: 설명이 짧은 {thin}개 중 {replaced}개 보강 ({elapsed:.1f}초, "
+        f"캐시 {stats['cached']} / 다운로드 {stats['fetched']} / 실패 {stats['failed']}, "
+        f"{stats['bytes_read'] / 1024:.0f}KB, 파서 {html_parser_backend()})"
+    )
+
+
+# =================================================================
+# RSS 피드 레지스트리
+# =================================================================
+def collect_feed_urls(config: dict) -> List[str]:
+    """전체 카테고리의 RSS URL을 설정 순서대로 중복 없이 수집"""
+    urls = []
+    seen = set()
+    for cat_info in config.get('categories', {}).values():
+        for rss_source in cat_info.get('rss_sources', []):
+            url = rss_source.get('url') if isinstance(rss_source, dict) else rss_source
+            if url and url not in seen:
+                seen.add(url)
+                urls.append(url)
+    return urls
+
+
+class FeedCache:
+    """
+    RSS 피드 디스크 캐시
+    URL별로 원본 XML과 ETag/Last-Modified 값을 저장하고 조건부 요청(304)으로 재사용
+    """
+
+    USER_AGENT = 'Mozilla/5.0 (compatible; DTNC/2.1; +RSS reader)'
+
+    def __init__(self, cache_dir: str, logger: logging.Logger, ttl_minutes: float = 0, timeout: float = 10):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.logger = logger
+        self.ttl_seconds = float(ttl_minutes) * 60
+        self.timeout = timeout
+        self.stats = {'fresh': 0, 'not_modified': 0, 'downloaded': 0, 'stale': 0}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _session(self) -> 'requests.Session':
+        """스레드별 HTTP 세션 (커넥션 재사용)"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            import requests
+            session = requests.Session()
+            session.headers['User-Agent'] = self.USER_AGENT
+            self._local.session = session
+        return session
+
+    def _paths(self, url: str):
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{key}.json", self.cache_dir / f"{key}.xml"
+
+    def _count(self, name: str):
+        with self._lock:
+            self.stats[name] += 1
+
+    def load(self, url: str):
+        """캐시된 (메타데이터, 본문) 반환, 없으면 (None, None)"""
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            return meta, body_path.read_bytes()
+        except (OSError, ValueError):
+            return None, None
+
+    def save(self, url: str, body: bytes, etag: str = None, last_modified: str = None):
+        """본문과 검증자 저장 (임시 파일 작성 후 교체)"""
+        meta_path, body_path = self._paths(url)
+        meta = {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'fetched_at': time.time()
         }
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
+        tmp_body = body_path.with_suffix(f'.xml.{threading.get_ident()}.tmp')
+        tmp_body.write_bytes(body)
+        os.replace(tmp_body, body_path)
+        self._write_meta(meta_path, meta)
+
+    def _write_meta(self, meta_path: Path, meta: dict):
+        tmp_meta = meta_path.with_suffix(f'.json.{threading.get_ident()}.tmp')
+        with open(tmp_meta, 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False)
+        os.replace(tmp_meta, meta_path)
+
+    def fetch(self, url: str) -> tuple:
+        """
+        (피드 원본, 출처, 네트워크 오류) 반환
+        1) TTL 이내 캐시는 네트워크 없이 사용 (출처 'fresh')
+        2) 그 외에는 If-None-Match / If-Modified-Since 조건부 요청, 304면 캐시 사용 ('not_modified'), 아니면 'downloaded'
+        3) 네트워크 오류 시 캐시가 있으면 캐시 사용 ('stale', 세 번째 값에 오류)
+        """
+        import requests
+
+        meta, body = self.load(url)
+
+        if meta and self.ttl_seconds > 0 and time.time() - meta.get('fetched_at', 0) < self.ttl_seconds:
+            self._count('fresh')
+            return body, 'fresh', None
+
+        headers = {}
+        if meta:
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
 
-        soup = BeautifulSoup(response.content, 'html.parser')
+        try:
+            response = self._session().get(url, headers=headers, timeout=self.timeout)
+        except requests.RequestException as e:
+            if body is not None:
+                self.logger.debug(f"    네트워크 오류로 캐시 사용 ({url}): {str(e)}")
+                self._count('stale')
+                return body, 'stale', e
+            raise
+
+        if response.status_code == 304 and meta:
+            meta['fetched_at'] = time.time()
+            self._write_meta(self._paths(url)[0], meta)
+            self._count('not_modified')
+            return body, 'not_modified', None
 
-        # 기사 본문 추출 시도 (다양한 태그 패턴)
-        # 대부분의 뉴스 사이트는 article, .article-body, #article-body 등을 사용
-        content = ""
+        response.raise_for_status()
+        self.save(
+            url,
+            response.content,
+            etag=response.headers.get('ETag'),
+            last_modified=response.headers.get('Last-Modified')
+        )
+        self._count('downloaded')
+        return response.content, 'downloaded', None
 
-        # 패턴 1: <article> 태그
-        article_tag = soup.find('article')
-        if article_tag:
-            # <script>, <style>, <aside> 태그 제거
-            for tag in article_tag.find_all(['script', 'style', 'aside', 'nav', 'header', 'footer']):
-                tag.decompose()
-            content = article_tag.get_text(separator=' ', strip=True)
 
-        # 패턴 2: 일반적인 본문 클래스/ID
-        if not content:
-            selectors = [
-                'article-body', 'article_body', 'articleBody',
-                'news-content', 'news_content', 'newsContent',
-                'post-content', 'entry-content', 'content-body'
-            ]
-            for selector in selectors:
-                elem = soup.find(class_=selector) or soup.find(id=selector)
-                if elem:
-                    for tag in elem.find_all(['script', 'style', 'aside', 'nav']):
-                        tag.decompose()
-                    content = elem.get_text(separator=' ', strip=True)
+class FeedWindow:
+    """
+    피드 스트리밍 읽기 + 날짜 범위 조기 종료
+    원본을 청크 단위로 읽으며 <item>/<entry> 단위로 잘라 발행일만 빠르게 확인하고,
+    범위(since~until, 앞뒤 margin_days 여유) 밖 엔트리는 버림.
+    범위보다 오래된 엔트리가 stop_after개 연속되면 나머지는 읽지 않음 (최신순 피드 가정, 순서가 섞인 피드는 여유값으로 보호)
+    남은 엔트리만 원래 헤더/닫는 태그와 합쳐 feedparser에 넘기므로 엔트리 파싱 결과는 전체 파싱과 동일
+    """
+
+    ITEM_START = re.compile(rb'<(item|entry)[\s>]')
+    DATE_TAG = re.compile(
+        rb'<(pubDate|published|issued|dcterms:issued|dc:date|updated)\b[^>]*>\s*(?:<!\[CDATA\[)?\s*([^<\]]+)'
+    )
+    # feedparser가 entry.published로 쓰는 태그 우선, 수정일(dc:date/updated)은 발행일 태그가 없을 때만
+    PUBLISHED_TAGS = (b'pubDate', b'published', b'issued', b'dcterms:issued')
+    OPEN_TAG = re.compile(rb'<!--.*?-->|<!\[CDATA\[.*?\]\]>|<(/?)([A-Za-z_][\w:.-]*)[^>]*?(/?)>', re.S)
+
+    def __init__(self, since: date, until: date = None, margin_days: int = 1, stop_after: int = 10):
+        margin = timedelta(days=max(0, margin_days))
+        self.since = since - margin
+        self.until = (until or since) + margin
+        self.stop_after = max(1, stop_after)
+
+    @classmethod
+    def iter_segments(cls, chunks):
+        """
+        청크 스트림을 ('header', 채널 정보), ('item', 엔트리 1개), ('tail', 나머지) 순서로 분리
+        버퍼에는 엔트리 1개 분량만 유지 (엔트리를 찾지 못하면 전체가 'tail')
+        """
+        # 엔트리마다 버퍼를 잘라내지 않고 위치(pos)만 옮겨 탐색 (본문 전체가 청크 1개로 와도 선형 시간)
+        buffer = b''
+        pos = 0
+        header_done = False
+        for chunk in chunks:
+            buffer = buffer[pos:] + chunk
+            pos = 0
+            while True:
+                match = cls.ITEM_START.search(buffer, pos)
+                if not match:
+                    break
+                if not header_done:
+                    yield 'header', buffer[:match.start()]
+                    header_done = True
+                end_tag = b'</' + match.group(1) + b'>'
+                end = buffer.find(end_tag, match.end())
+                if end < 0:
+                    pos = match.start()
                     break
+                end += len(end_tag)
+                yield 'item', buffer[match.start():end]
+                pos = end
+        yield 'tail', buffer[pos:]
+
+    @classmethod
+    def entry_date(cls, item: bytes) -> Optional[date]:
+        """
+        엔트리의 발행일 (표기된 날짜 그대로, 알 수 없으면 None)
+        WordPress Atom처럼 <updated>가 <published> 앞에 와도 발행일 태그 사용 (파이프라인은 entry.published로 거름)
+        """
+        matches = cls.DATE_TAG.findall(item)
+        if not matches:
+            return None
+        value = next((value for tag, value in matches if tag in cls.PUBLISHED_TAGS), matches[0][1])
+        value = value.decode('ascii', 'ignore').strip()
+        import email.utils
+        try:
+            return email.utils.parsedate_to_datetime(value).date()
+        except (TypeError, ValueError, IndexError):
+            pass
+        try:
+            return datetime.fromisoformat(value.replace('Z', '+00:00')).date()
+        except ValueError:
+            pass
+        from dateutil import parser as date_parser
+        try:
+            return date_parser.parse(value).date()
+        except (ValueError, OverflowError):
+            return None
 
-        # 패턴 3: <p> 태그들의 집합 (최후의 수단)
-        if not content:
-            paragraphs = soup.find_all('p')
-            if paragraphs:
-                # 길이가 30자 이상인 <p> 태그만 수집
-                valid_paras = [p.get_text(strip=True) for p in paragraphs if len(p.get_text(strip=True)) > 30]
-                content = ' '.join(valid_paras[:10])  # 최대 10개 문단만
+    @classmethod
+    def closing_tags(cls, header: bytes) -> bytes:
+        """헤더에서 열린 채 끝난 태그(rss, channel 등)의 닫는 태그"""
+        stack = []
+        for match in cls.OPEN_TAG.finditer(header):
+            closing, name, self_closing = match.groups()
+            if not name or self_closing:
+                continue
+            if closing:
+                if name in stack:
+                    del stack[len(stack) - 1 - stack[::-1].index(name):]
+            else:
+                stack.append(name)
+        return b''.join(b'</' + name + b'>' for name in reversed(stack))
+
+    def read(self, chunks) -> tuple:
+        """
+        범위 안의 엔트리만 남긴 피드 본문과 통계 반환
+        통계: kept(유지), skipped(범위 밖), stopped(조기 종료 여부), bytes_read(읽은 바이트),
+        oldest/newest(확인한 가장 오래된/최신 날짜), dated(발행일을 확인한 엔트리 수, 범위 밖 포함)
+        """
+        stats = {'kept': 0, 'skipped': 0, 'stopped': False, 'bytes_read': 0, 'oldest': None, 'newest': None, 'dated': 0}
+
+        def counted():
+            for chunk in chunks:
+                stats['bytes_read'] += len(chunk)
+                yield chunk
+
+        parts = []
+        header = b''
+        old_run = 0
+        segments = self.iter_segments(counted())
+        for kind, data in segments:
+            if kind == 'header':
+                header = data
+                parts.append(data)
+            elif kind == 'tail':
+                parts.append(data)
+            else:
+                pub_date = self.entry_date(data)
+                if pub_date is not None:
+                    stats['dated'] += 1
+                    if stats['oldest'] is None or pub_date < stats['oldest']:
+                        stats['oldest'] = pub_date
+                    if stats['newest'] is None or pub_date > stats['newest']:
+                        stats['newest'] = pub_date
+                if pub_date is None or self.since <= pub_date <= self.until:
+                    parts.append(data)
+                    stats['kept'] += 1
+                    if pub_date is not None:
+                        old_run = 0
+                    continue
+                stats['skipped'] += 1
+                if pub_date < self.since:
+                    old_run += 1
+                    if old_run >= self.stop_after:
+                        stats['stopped'] = True
+                        break
+
+        if stats['stopped']:
+            segments.close()
+            parts.append(self.closing_tags(header))
+        return b''.join(parts), stats
+
+
+class FeedEntry:
+    """
+    파이프라인이 쓰는 필드(제목/링크/설명/발행일)만 남긴 피드 엔트리
+    feedparser 엔트리(content, links, tags 등 전체 dict)를 파싱 직후 이 형태로 바꿔
+    피드를 보관하는 동안의 메모리를 줄임 (없는 필드는 feedparser처럼 AttributeError)
+    """
 
-        # 텍스트 정리
-        content = re.sub(r'\s+', ' ', content).strip()
+    __slots__ = ('title', 'link', 'description', 'published')
 
-        if len(content) < 100:
-            logger.debug(f"기사 본문이 너무 짧음 (URL: {url[:50]}...)")
-            return ""
+    def __init__(self, **fields):
+        for name, value in fields.items():
+            setattr(self, name, value)
 
-        # 최대 2000자로 제한 (AI 입력용)
-        return content[:2000]
+    @classmethod
+    def from_entry(cls, entry) -> 'FeedEntry':
+        compact = cls(description=entry.get('description', entry.get('summary', '')))
+        for name in ('title', 'link', 'published'):
+            value = entry.get(name)
+            if value is not None:
+                setattr(compact, name, value)
+        return compact
 
-    except requests.Timeout:
-        logger.debug(f"기사 가져오기 타임아웃 (URL: {url[:50]}...)")
-        return ""
-    except Exception as e:
-        logger.debug(f"기사 가져오기 실패: {str(e)[:50]}")
-        return ""
+    def get(self, name: str, default=None):
+        return getattr(self, name, default)
+
+    def to_record(self) -> tuple:
+        """프로세스 간 전달용 튜플 (없는 필드는 None)"""
+        return tuple(getattr(self, name, None) for name in self.__slots__)
+
+    @classmethod
+    def from_record(cls, record: tuple) -> 'FeedEntry':
+        return cls(**{name: value for name, value in zip(cls.__slots__, record) if value is not None})
+
+
+def compact_feed(feed):
+    """파싱된 피드에서 엔트리 필드와 version만 남긴 사본 (원본 feedparser 결과는 바로 해제 가능)"""
+    import feedparser
+
+    return feedparser.FeedParserDict(
+        entries=[FeedEntry.from_entry(entry) for entry in feed.entries],
+        version=feed.get('version', '')
+    )
+
+
+class ArticleStore:
+    """
+    수집한 피드 엔트리 누적 저장소 (SQLite)
+    실행마다 다운로드한 엔트리를 (피드 URL, 정규화 링크) 단위로 누적하고,
+    피드별로 빠짐없이 받은 날짜 범위(coverage)를 기록해 지난 날짜(--date)는 네트워크 없이 조회
+    카테고리 분류/필터는 조회 후 parse_feed_entry에서 현재 설정으로 수행
+    """
+
+    def __init__(self, db_path: str, keep_days: float = 60):
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(
+            "CREATE TABLE IF NOT EXISTS articles ("
+            "feed_url TEXT NOT NULL, link TEXT NOT NULL, url TEXT NOT NULL, title TEXT NOT NULL, "
+            "description TEXT NOT NULL, published TEXT NOT NULL, pub_day TEXT NOT NULL, "
+            "position INTEGER NOT NULL, fetched_at REAL NOT NULL, PRIMARY KEY (feed_url, link));"
+            "CREATE INDEX IF NOT EXISTS idx_articles_day ON articles(pub_day, feed_url);"
+            "CREATE INDEX IF NOT EXISTS idx_articles_link ON articles(link);"
+            "CREATE TABLE IF NOT EXISTS coverage ("
+            "feed_url TEXT NOT NULL, first_day TEXT NOT NULL, last_day TEXT NOT NULL, fetched_at REAL NOT NULL);"
+            "CREATE INDEX IF NOT EXISTS idx_coverage_feed ON coverage(feed_url, first_day);"
+            "CREATE TABLE IF NOT EXISTS schedule ("
+            "feed_url TEXT PRIMARY KEY, last_poll REAL, next_poll REAL NOT NULL, "
+            "interval REAL NOT NULL, errors INTEGER NOT NULL DEFAULT 0);"
+        )
+        self.conn.commit()
+        self._lock = threading.Lock()
+        self.prune(keep_days)
+
+    def add_feed(self, feed_url: str, entries: list, oldest_seen: date = None,
+                 window: 'FeedWindow' = None, fetched_on: date = None) -> int:
+        """
+        피드 엔트리 저장 (같은 링크는 갱신), 저장한 개수 반환
+        빠짐없이 받은 날짜 범위: (가장 오래된 엔트리 날짜 + 1일) ~ 어제,
+        window로 걸렀으면 그 범위 안으로 제한
+        """
+        fetched_on = fetched_on or date.today()
+        now = time.time()
+        rows = []
+        oldest = oldest_seen
+        for position, entry in enumerate(entries):
+            try:
+                published = entry.published
+                pub_day = parse_published(published).date()
+                title, link = entry.title, entry.link
+            except Exception:
+                continue
+            oldest = pub_day if oldest is None or pub_day < oldest else oldest
+            description = entry.get('description', entry.get('summary', ''))
+            rows.append((
+                feed_url, normalize_link(link), link, title, description, published,
+                pub_day.isoformat(), position, now
+            ))
+
+        first_day = oldest + timedelta(days=1) if oldest else None
+        last_day = fetched_on - timedelta(days=1)
+        if window is not None and first_day is not None:
+            first_day = max(first_day, window.since)
+            last_day = min(last_day, window.until)
+
+        with self._lock:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO articles "
+                "(feed_url, link, url, title, description, published, pub_day, position, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            if first_day is not None and first_day <= last_day:
+                self.conn.execute(
+                    "INSERT INTO coverage (feed_url, first_day, last_day, fetched_at) VALUES (?, ?, ?, ?)",
+                    (feed_url, first_day.isoformat(), last_day.isoformat(), now)
+                )
+            self.conn.commit()
+        return len(rows)
+
+    def covers(self, feed_url: str, day: date, until: date = None) -> bool:
+        """해당 피드의 day(~until) 엔트리를 빠짐없이 저장했는지 (여러 실행의 범위를 이어 붙여 판단)"""
+        until = until or day
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT first_day, last_day FROM coverage "
+                "WHERE feed_url = ? AND first_day <= ? AND last_day >= ? ORDER BY first_day",
+                (feed_url, until.isoformat(), day.isoformat())
+            ).fetchall()
+        needed = day
+        for first_day, last_day in rows:
+            if date.fromisoformat(first_day) > needed:
+                return False
+            needed = max(needed, date.fromisoformat(last_day) + timedelta(days=1))
+            if needed > until:
+                return True
+        return False
+
+    def feed(self, feed_url: str, day: date, until: date = None):
+        """저장된 day(~until) 엔트리를 compact_feed 결과와 같은 형태로 반환 (최신 날짜 먼저, 피드 내 순서 유지)"""
+        import feedparser
+
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT url, title, description, published FROM articles "
+                "WHERE pub_day BETWEEN ? AND ? AND feed_url = ? ORDER BY pub_day DESC, position, published DESC",
+                (day.isoformat(), (until or day).isoformat(), feed_url)
+            ).fetchall()
+        return feedparser.FeedParserDict(entries=[
+            FeedEntry(link=url, title=title, description=description, published=published)
+            for url, title, description, published in rows
+        ])
+
+    def count(self, feed_url: str) -> int:
+        """저장된 피드 엔트리 수"""
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM articles WHERE feed_url = ?", (feed_url,)).fetchone()[0]
+
+    def recent_published(self, feed_url: str, limit: int = 20) -> List[float]:
+        """최근 저장된 엔트리의 발행 시각 타임스탬프 (최신순, 발행 주기 추정용)"""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT published FROM articles WHERE feed_url = ? ORDER BY pub_day DESC, position LIMIT ?",
+                (feed_url, limit * 2)
+            ).fetchall()
+        published = []
+        for (value,) in rows:
+            try:
+                published.append(parse_published(value).timestamp())
+            except Exception:
+                continue
+        published.sort(reverse=True)
+        return published[:limit]
+
+    def schedule(self, feed_url: str) -> Optional[tuple]:
+        """폴링 일정 (last_poll, next_poll, interval, errors), 없으면 None"""
+        with self._lock:
+            return self.conn.execute(
+                "SELECT last_poll, next_poll, interval, errors FROM schedule WHERE feed_url = ?", (feed_url,)
+            ).fetchone()
+
+    def set_schedule(self, feed_url: str, last_poll: Optional[float], next_poll: float,
+                     interval: float, errors: int = 0):
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO schedule (feed_url, last_poll, next_poll, interval, errors) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (feed_url, last_poll, next_poll, interval, errors)
+            )
+            self.conn.commit()
+
+    def polled_within(self, feed_url: str, max_age: float) -> bool:
+        """--watch가 max_age초 안에 피드를 성공적으로 폴링했는지 (오늘 엔트리를 빠짐없이 갖고 있는지)"""
+        row = self.schedule(feed_url)
+        return bool(row and row[0] and time.time() - row[0] <= max_age)
+
+    def prune(self, keep_days: float):
+        """보관 기간이 지난 엔트리/범위 삭제"""
+        if not keep_days:
+            return
+        cutoff = (date.today() - timedelta(days=keep_days)).isoformat()
+        with self._lock:
+            self.conn.execute("DELETE FROM articles WHERE pub_day < ?", (cutoff,))
+            self.conn.execute("DELETE FROM coverage WHERE last_day < ?", (cutoff,))
+            self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+
+class FeedHealth:
+    """
+    피드별 상태 기록 (SQLite) + 회로 차단기
+    지연(지수 이동 평균), 성공/실패 수, 마지막 성공 시각, 하루 엔트리 수를 실행 간 유지
+    연속 failure_threshold회 실패하면 회로를 열어 open_minutes 동안 요청하지 않고,
+    대기가 끝나면 1회 시험 요청(half-open): 성공 시 복구, 실패 시 대기 시간 2배 (max_open_minutes까지)
+    """
+
+    FIELDS = (
+        'successes', 'failures', 'consecutive_failures', 'avg_latency', 'last_latency',
+        'last_success', 'last_failure', 'last_error', 'open_until', 'open_count', 'entries_per_day'
+    )
+
+    def __init__(self, db_path: str, failure_threshold: int = 3, open_minutes: float = 360,
+                 max_open_minutes: float = 10080, slow_seconds: float = 5):
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS feed_health ("
+            "feed_url TEXT PRIMARY KEY, successes INTEGER NOT NULL DEFAULT 0, failures INTEGER NOT NULL DEFAULT 0, "
+            "consecutive_failures INTEGER NOT NULL DEFAULT 0, avg_latency REAL, last_latency REAL, "
+            "last_success REAL, last_failure REAL, last_error TEXT, open_until REAL, "
+            "open_count INTEGER NOT NULL DEFAULT 0, entries_per_day REAL)"
+        )
+        self.conn.commit()
+        self.failure_threshold = failure_threshold
+        self.open_seconds = open_minutes * 60
+        self.max_open_seconds = max_open_minutes * 60
+        self.slow_seconds = slow_seconds
+        self._lock = threading.Lock()
+        self._rows = {
+            row[0]: dict(zip(self.FIELDS, row[1:]))
+            for row in self.conn.execute(f"SELECT feed_url, {', '.join(self.FIELDS)} FROM feed_health")
+        }
+
+    def get(self, url: str) -> Optional[dict]:
+        """기록 사본 (없으면 None)"""
+        with self._lock:
+            row = self._rows.get(url)
+            return dict(row) if row else None
+
+    def state(self, url: str, now: float = None) -> str:
+        """'closed'(정상) / 'open'(차단) / 'half_open'(시험 요청 대기)"""
+        row = self.get(url)
+        if not row or row['open_until'] is None:
+            return 'closed'
+        return 'open' if (now or time.time()) < row['open_until'] else 'half_open'
+
+    def allow(self, url: str) -> bool:
+        """요청 가능 여부 (차단 대기 중이면 False)"""
+        return self.state(url) != 'open'
+
+    def is_slow(self, url: str) -> bool:
+        row = self.get(url)
+        return bool(row and row['avg_latency'] and row['avg_latency'] > self.slow_seconds)
+
+    def _update(self, url: str, **values):
+        row = self._rows.setdefault(url, dict.fromkeys(self.FIELDS))
+        for name in ('successes', 'failures', 'consecutive_failures', 'open_count'):
+            row[name] = row[name] or 0
+        for name, value in values.items():
+            row[name] = value(row) if callable(value) else value
+        self.conn.execute(
+            f"INSERT OR REPLACE INTO feed_health (feed_url, {', '.join(self.FIELDS)}) "
+            f"VALUES (?, {', '.join('?' * len(self.FIELDS))})",
+            (url, *(row[name] for name in self.FIELDS))
+        )
+        self.conn.commit()
+
+    def record_success(self, url: str, latency: float, entries_per_day: float = None):
+        """성공 기록 (회로 복구), 지연/하루 엔트리 수는 지수 이동 평균"""
+        def ema(name, value):
+            return lambda row: value if row[name] is None else row[name] * 0.7 + value * 0.3
+
+        with self._lock:
+            values = dict(
+                successes=lambda row: row['successes'] + 1, consecutive_failures=0,
+                avg_latency=ema('avg_latency', latency), last_latency=latency,
+                last_success=time.time(), open_until=None, open_count=0
+            )
+            if entries_per_day is not None:
+                values['entries_per_day'] = ema('entries_per_day', entries_per_day)
+            self._update(url, **values)
+
+    def record_failure(self, url: str, latency: float, error: Exception):
+        """실패 기록, 연속 실패가 기준을 넘거나 시험 요청이 실패하면 회로 차단"""
+        now = time.time()
+        with self._lock:
+            row = self._rows.get(url) or {}
+            consecutive = (row.get('consecutive_failures') or 0) + 1
+            open_count = row.get('open_count') or 0
+            open_until = row.get('open_until')
+            if open_until is not None or consecutive >= self.failure_threshold:
+                open_count += 1
+                open_until = now + min(self.open_seconds * 2 ** (open_count - 1), self.max_open_seconds)
+            self._update(
+                url, failures=lambda r: r['failures'] + 1, consecutive_failures=consecutive,
+                last_latency=latency, last_failure=now, last_error=str(error)[:200],
+                open_until=open_until, open_count=open_count
+            )
+
+    def close(self):
+        self.conn.close()
+
+
+def create_feed_health(config: dict) -> Optional[FeedHealth]:
+    """설정(health)으로 피드 상태 기록기 생성 (비활성화 시 None)"""
+    health_config = config.get('health', {})
+    if not health_config.get('enabled', False):
+        return None
+    return FeedHealth(
+        health_config.get('path', 'cache/feed_health.sqlite3'),
+        failure_threshold=health_config.get('failure_threshold', 3),
+        open_minutes=health_config.get('open_minutes', 360),
+        max_open_minutes=health_config.get('max_open_minutes', 10080),
+        slow_seconds=health_config.get('slow_seconds', 5)
+    )
+
+
+def feeds_report(config: dict, logger: logging.Logger):
+    """
+    --feeds-report: config.yaml의 피드별 상태 (차단/시험 요청/느림/정상/기록 없음)
+    차단·느린 피드부터 평균 지연 순으로 출력
+    """
+    health = create_feed_health(config)
+    if health is None:
+        logger.warning("피드 상태 기록이 꺼져 있습니다 (config.yaml의 health.enabled)")
+        return
+
+    sources = {}
+    for category, cat_config in config['categories'].items():
+        for rss_source in cat_config.get('rss_sources', []):
+            url = rss_source.get('url') if isinstance(rss_source, dict) else rss_source
+            name = rss_source.get('name', url) if isinstance(rss_source, dict) else url
+            entry = sources.setdefault(url, {'name': name, 'categories': []})
+            entry['categories'].append(category)
+
+    labels = {'open': '차단', 'half_open': '시험 요청', 'slow': '느림', 'closed': '정상', None: '기록 없음'}
+    order = ['open', 'half_open', 'slow', None, 'closed']
+    rows = []
+    for url, source in sources.items():
+        row = health.get(url)
+        state = None if row is None else health.state(url)
+        if state == 'closed' and health.is_slow(url):
+            state = 'slow'
+        rows.append((order.index(state), -((row or {}).get('avg_latency') or 0), state, url, source, row))
+    rows.sort(key=lambda item: item[:2])
+
+    logger.info(f">>> 피드 상태 ({len(rows)}개, 느림 기준 평균 {health.slow_seconds:g}초)")
+    logger.info(f"    {'상태':<6} {'성공/실패':>9} {'평균지연':>8} {'하루엔트리':>10}  {'마지막 성공':<16} 이름 (카테고리)")
+    for _, _, state, url, source, row in rows:
+        row = row or {}
+        counts = f"{row.get('successes') or 0}/{row.get('failures') or 0}"
+        latency = f"{row['avg_latency']:.1f}초" if row.get('avg_latency') is not None else '-'
+        per_day = f"{row['entries_per_day']:.1f}" if row.get('entries_per_day') is not None else '-'
+        last_success = (datetime.fromtimestamp(row['last_success']).strftime('%Y-%m-%d %H:%M')
+                        if row.get('last_success') else '없음')
+        logger.info(
+            f"    {labels[state]:<6} {counts:>9} {latency:>8} {per_day:>10}  {last_success:<16} "
+            f"{source['name']} ({', '.join(source['categories'])})"
+        )
+        if state in ('open', 'half_open') and row.get('last_error'):
+            logger.info(f"           {url} - {row['last_error']}")
+    health.close()
+
+
+# =================================================================
+# 프로세스 풀 파싱 (rss.parse_processes)
+# =================================================================
+_parse_worker = {}
+
+
+def _init_parse_worker(config: dict, days: List[date], published: 'PublishedFilter' = None):
+    """파싱 프로세스 초기화 (설정/분류기/발행 이력은 프로세스마다 1회만 준비)"""
+    _parse_worker['config'] = config
+    _parse_worker['days'] = days
+    _parse_worker['published'] = published
+    _parse_worker['classifier'] = CategoryClassifier(config)
+    _parse_worker['logger'] = logging.getLogger('DTNC')
+
+
+def _parse_feed_in_process(url: str, body: bytes, headers: dict) -> tuple:
+    """
+    원본 바이트 → (엔트리 레코드, version, {날짜: 뉴스 레코드}, 분류 소요 시간, 이미 발행해 제외한 수)
+    feedparser/발행일 파싱/HTML 정리/분류를 모두 이 프로세스에서 하고 튜플만 돌려줌
+    """
+    import feedparser
+
+    published = _parse_worker['published']
+    hits = published.hits if published is not None else 0
+    feed = compact_feed(feedparser.parse(body, response_headers=headers))
+    start = time.perf_counter()
+    by_day = split_feed_by_day(
+        url, feed, _parse_worker['days'], _parse_worker['config'], _parse_worker['logger'],
+        _parse_worker['classifier'], published=published
+    )
+    return (
+        [entry.to_record() for entry in feed.entries],
+        feed.version,
+        {day: [item.to_record() for item in items] for day, items in by_day.items()},
+        time.perf_counter() - start,
+        published.hits - hits if published is not None else 0
+    )
+
+
+class ParsePool:
+    """
+    CPU를 쓰는 단계(피드 XML 파싱, 발행일 파싱, HTML 정리, 카테고리 분류, 기사 본문 추출) 전용 프로세스 풀
+    GIL 때문에 스레드로는 코어 1개만 쓰므로, 다운로드 스레드가 받은 바이트를 프로세스로 넘기고
+    feedparser 결과 대신 간단한 튜플만 돌려받음
+    (수집 스레드가 도는 중에 fork하지 않도록 spawn 방식 사용)
+    """
+
+    def __init__(self, config: dict, days: List[date], processes: int, published: 'PublishedFilter' = None):
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        self.days = list(days)
+        self.processes = processes
+        self.published = published
+        self._executor = ProcessPoolExecutor(
+            max_workers=processes, mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_parse_worker, initargs=(config, self.days, published)
+        )
+
+    def parse_feed(self, url: str, body: bytes, headers: dict) -> tuple:
+        """(FeedEntry 목록, version, {날짜: NewsItem 목록}, 분류 소요 시간), 발행 이력 제외 수는 published에 합산"""
+        entries, version, by_day, elapsed, hits = self._executor.submit(
+            _parse_feed_in_process, url, body, headers
+        ).result()
+        if hits:
+            self.published.add_hits(hits)
+        return (
+            [FeedEntry.from_record(record) for record in entries],
+            version,
+            {day: [NewsItem.from_record(record) for record in records] for day, records in by_day.items()},
+            elapsed
+        )
+
+    def extract_article(self, html: bytes, encoding: Optional[str], max_chars: int) -> str:
+        return self._executor.submit(extract_article_text, html, encoding, max_chars).result()
+
+    def close(self):
+        self._executor.shutdown()
+
+
+def create_parse_pool(
+    config: dict,
+    days: List[date],
+    logger: logging.Logger,
+    published: 'PublishedFilter' = None
+) -> Optional[ParsePool]:
+    """설정(rss.parse_processes)으로 파싱 프로세스 풀 생성 (0이면 None, -1이면 CPU 코어 수)"""
+    processes = config.get('rss', {}).get('parse_processes', 0)
+    if processes < 0:
+        processes = os.cpu_count() or 1
+    if not processes:
+        return None
+    logger.info(f">>> 피드 파싱/분류 프로세스 {processes}개")
+    return ParsePool(config, days, processes, published)
+
+
+class FeedRegistry:
+    """
+    실행 단위 RSS 피드 레지스트리
+    동일한 URL이 여러 카테고리에 등록되어 있어도 다운로드/파싱은 1회만 수행
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        cache: FeedCache = None,
+        window: FeedWindow = None,
+        timeout: float = 10,
+        metrics: RunMetrics = None,
+        store: 'ArticleStore' = None,
+        target_date: date = None,
+        until_date: date = None,
+        offline: bool = False,
+        pool_max_age: float = 0,
+        health: 'FeedHealth' = None,
+        parse_pool: ParsePool = None
+    ):
+        self.logger = logger
+        self.cache = cache
+        self.window = window
+        self.timeout = timeout
+        self.metrics = metrics
+        self.store = store
+        self.target_date = target_date
+        self.until_date = until_date or target_date
+        self.offline = offline
+        self.pool_max_age = pool_max_age
+        self.health = health
+        self.parse_pool = parse_pool
+        self.store_stats = {'from_store': 0, 'fetched': 0, 'saved': 0}
+        self._feeds = {}
+        self._errors = {}
+        self._released = set()
+        self._split = {}  # 파싱 프로세스가 분류까지 마친 결과 {URL: {날짜: 뉴스}}
+        self.timings = {}  # URL별 다운로드+파싱 소요 시간 (초)
+        self.stream_stats = {'feeds': 0, 'stopped': 0, 'kept': 0, 'skipped': 0, 'bytes_read': 0}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def get(self, url: str):
+        """파싱된 피드 반환 (최초 요청 시에만 다운로드)"""
+        if url in self._errors:
+            raise self._errors[url]
+        if url not in self._feeds:
+            start = time.perf_counter()
+            try:
+                self._feeds[url] = self._fetch(url)
+                self._released.discard(url)
+            except Exception as e:
+                self._errors[url] = e
+                raise
+            finally:
+                self.timings[url] = time.perf_counter() - start
+        return self._feeds[url]
+
+    def _fetch(self, url: str):
+        """
+        피드 다운로드 및 파싱 (단계별 소요 시간은 metrics에 기록)
+        저장소가 target_date~until_date를 모두 담고 있으면 네트워크 대신 저장소에서 조회하고,
+        다운로드한 엔트리는 저장소에 누적
+        """
+        import feedparser
+
+        start = time.perf_counter()
+        if self.store is not None and self.target_date is not None and self._in_store(url):
+            feed = self.store.feed(url, self.target_date, self.until_date)
+            with self._lock:
+                self.store_stats['from_store'] += 1
+            if self.metrics:
+                self.metrics.record_feed(url, fetch=time.perf_counter() - start, from_store=1)
+            return feed
+        if self.offline:
+            span = self.target_date if self.until_date == self.target_date else f"{self.target_date} ~ {self.until_date}"
+            raise RuntimeError(f"오프라인 모드: 저장소에 {span} 기사가 없습니다")
+        if self.health is not None and not self.health.allow(url):
+            row = self.health.get(url)
+            retry_at = datetime.fromtimestamp(row['open_until']).strftime('%m-%d %H:%M')
+            raise RuntimeError(f"회로 차단 중 (연속 실패 {row['consecutive_failures']}회, 재시도 {retry_at} 이후)")
+
+        try:
+            body, headers, size, stats, source, stale_error = self._download(url)
+            downloaded = time.perf_counter()
+            split = None
+            if self.parse_pool is not None:
+                entries, version, split, filter_time = self.parse_pool.parse_feed(url, body, headers)
+                feed = feedparser.FeedParserDict(entries=entries, version=version)
+            else:
+                feed = compact_feed(feedparser.parse(body, response_headers=headers))
+            if not feed.entries and not feed.version:
+                raise ValueError("RSS/Atom 피드가 아닙니다")
+        except Exception as e:
+            if self.health is not None:
+                self.health.record_failure(url, time.perf_counter() - start, e)
+            raise
+        if self.health is not None:
+            # 오류 후 캐시로 대신한 경우는 실패, TTL 캐시(네트워크 없음)는 기록하지 않음
+            # 하루 엔트리 수는 날짜 범위로 자르기 전 기준 (window 사용 시 스트리밍 중 확인한 발행일)
+            if stale_error is not None:
+                self.health.record_failure(url, downloaded - start, stale_error)
+            elif source != 'fresh':
+                volume = self.window_entries_per_day(stats) if stats else self.entries_per_day(feed.entries)
+                self.health.record_success(url, downloaded - start, volume)
+        if self.metrics:
+            self.metrics.record_feed(
+                url, fetch=downloaded - start, parse=time.perf_counter() - downloaded, bytes=size
+            )
+        if split is not None:
+            with self._lock:
+                self._split[url] = split
+            if self.metrics:
+                kept = sum(len(items) for items in split.values())
+                self.metrics.record_feed(url, filter=filter_time, entries=len(feed.entries), kept=kept)
+        if self.store is not None:
+            saved = self.store.add_feed(
+                url, feed.entries, oldest_seen=stats['oldest'] if stats else None, window=self.window
+            )
+            with self._lock:
+                self.store_stats['fetched'] += 1
+                self.store_stats['saved'] += saved
+        return feed
+
+    @staticmethod
+    def entries_per_day(entries: list) -> Optional[float]:
+        """엔트리 발행일 범위 기준 하루 평균 엔트리 수 (발행일이 없으면 None)"""
+        days = []
+        for entry in entries:
+            try:
+                days.append(parse_published(entry.published).date())
+            except Exception:
+                continue
+        if not days:
+            return None
+        return len(days) / ((max(days) - min(days)).days + 1)
+
+    @staticmethod
+    def window_entries_per_day(stats: dict) -> Optional[float]:
+        """FeedWindow가 읽으며 확인한 발행일(범위 밖 포함) 기준 하루 평균 엔트리 수 (조기 종료 시 읽은 부분만)"""
+        if not stats['dated']:
+            return None
+        return stats['dated'] / ((stats['newest'] - stats['oldest']).days + 1)
+
+    def _in_store(self, url: str) -> bool:
+        """
+        target_date~until_date 엔트리가 저장소에 모두 있는지
+        오늘은 항상 수집 중이므로, --watch가 pool_max_age 안에 폴링한 피드만 저장소(대기 풀)에서 조회
+        """
+        today = date.today()
+        if self.until_date < today:
+            return self.store.covers(url, self.target_date, self.until_date)
+        if not (self.pool_max_age and self.store.polled_within(url, self.pool_max_age)):
+            return False
+        return self.target_date >= today or self.store.covers(url, self.target_date, today - timedelta(days=1))
+
+    def _session(self) -> 'requests.Session':
+        """스레드별 HTTP 세션 (커넥션 재사용)"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            import requests
+            session = requests.Session()
+            session.headers['User-Agent'] = FeedCache.USER_AGENT
+            self._local.session = session
+        return session
+
+    def _download(self, url: str) -> tuple:
+        """
+        (파싱할 본문, 응답 헤더, 읽은 바이트, 스트리밍 통계 또는 None, 출처, 네트워크 오류) 반환
+        출처/오류는 FeedCache.fetch 기준 (캐시 미사용 시 'downloaded', None)
+        캐시 사용 시 조건부 요청, window 지정 시 날짜 범위 안의 엔트리만 남김
+        캐시 사용 시에는 전체 본문을 받아(검증자 저장용) 파싱만 줄이고,
+        캐시 미사용 시에는 응답을 청크로 읽다가 조기 종료하면 연결을 끊어 다운로드도 줄임
+        """
+        if self.cache is not None:
+            headers = {'content-location': url}
+            raw, source, error = self.cache.fetch(url)
+            if self.window is None:
+                return raw, headers, len(raw), None, source, error
+            body, stats = self.window.read([raw])
+        else:
+            response = self._session().get(url, timeout=self.timeout, stream=self.window is not None)
+            try:
+                response.raise_for_status()
+                headers = {
+                    'content-location': response.url,
+                    'content-type': response.headers.get('Content-Type', '')
+                }
+                if self.window is None:
+                    return response.content, headers, len(response.content), None, 'downloaded', None
+                body, stats = self.window.read(response.iter_content(chunk_size=16384))
+            finally:
+                response.close()
+            source, error = 'downloaded', None
+
+        with self._lock:
+            self.stream_stats['feeds'] += 1
+            self.stream_stats['stopped'] += int(stats['stopped'])
+            for name in ('kept', 'skipped', 'bytes_read'):
+                self.stream_stats[name] += stats[name]
+        return body, headers, stats['bytes_read'], stats, source, error
+
+    def prefetch(self, urls: List[str], max_workers: int = 8, per_host_limit: int = 2):
+        """
+        피드 병렬 다운로드
+        전체 동시 실행 수는 max_workers, 동일 호스트는 per_host_limit 개까지만 동시 요청
+        """
+        pending = [url for url in dict.fromkeys(urls) if url not in self]
+        if not pending:
+            return
+
+        # 호스트별 세마포어 + 호스트 라운드로빈 순서로 제출 (한 호스트가 워커를 독점하지 않도록)
+        by_host = {}
+        for url in pending:
+            host = urllib.parse.urlparse(url).netloc.lower()
+            by_host.setdefault(host, []).append(url)
+        host_limits = {host: threading.BoundedSemaphore(max(1, per_host_limit)) for host in by_host}
+
+        ordered = []
+        queues = list(by_host.values())
+        while queues:
+            ordered.extend(queue.pop(0) for queue in queues)
+            queues = [queue for queue in queues if queue]
+        # 느린 피드는 마지막에 (빠른 피드가 워커를 먼저 쓰도록)
+        if self.health is not None:
+            ordered.sort(key=self.health.is_slow)
+
+        def worker(url: str):
+            host = urllib.parse.urlparse(url).netloc.lower()
+            with host_limits[host]:
+                try:
+                    self.get(url)
+                except Exception as e:
+                    self.logger.debug(f"    피드 다운로드 실패 ({url}): {str(e)}")
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            list(executor.map(worker, ordered))
+        elapsed = time.perf_counter() - start
+
+        total = sum(self.timings.get(url, 0.0) for url in pending)
+        self.logger.info(
+            f">>> RSS 병렬 수집 완료: {len(pending)}개, {elapsed:.1f}초 (순차 실행 시 {total:.1f}초)"
+        )
+        for url in sorted(pending, key=lambda u: self.timings.get(u, 0.0), reverse=True)[:5]:
+            self.logger.info(f"    느린 피드: {url} ({self.timings.get(url, 0.0):.1f}초)")
+
+    def error(self, url: str) -> Optional[Exception]:
+        """다운로드/파싱에 실패한 피드의 예외 (성공 또는 미요청 시 None)"""
+        return self._errors.get(url)
+
+    def pop_split(self, url: str, days: List[date]) -> Optional[Dict[date, List['NewsItem']]]:
+        """파싱 프로세스가 days 기준으로 분류해 둔 결과 (없으면 None - 호출 측에서 split_feed_by_day)"""
+        with self._lock:
+            split = self._split.pop(url, None)
+        if split is None or self.parse_pool.days != list(days):
+            return None
+        return split
+
+    def release(self, url: str):
+        """
+        처리가 끝난 피드의 엔트리 해제 (수집 결과만 남기고 피드 전체를 들고 있지 않도록)
+        해제한 피드를 다시 get()하면 새로 가져옴
+        """
+        with self._lock:
+            self._split.pop(url, None)
+            if self._feeds.pop(url, None) is not None:
+                self._released.add(url)
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._feeds or url in self._errors or url in self._released
+
+    def __len__(self) -> int:
+        return len(self._feeds) + len(self._errors) + len(self._released)
 
 
 # =================================================================
 # 뉴스 수집
 # =================================================================
+class NewsItem:
+    """
+    수집한 뉴스 1건 (항목마다 dict 대신 __slots__ 객체로 메모리/할당 감소)
+    출처 이름은 intern해 같은 문자열을 공유하고, 정리된 설명(description)과
+    소문자 제목(title_lower)은 처음 사용할 때 계산
+    """
+
+    __slots__ = (
+        '_title', '_title_lower', 'original_title', 'source', 'link',
+        '_raw_description', '_description', 'summary', 'score', 'pub_date', 'categories'
+    )
+
+    def __init__(self, title: str, original_title: str, source: Optional[str], link: str,
+                 raw_description: str, pub_date: datetime, categories: frozenset = None):
+        self._title = title
+        self._title_lower = None
+        self.original_title = original_title
+        self.source = sys.intern(source) if source else source
+        self.link = link
+        self._raw_description = raw_description
+        self._description = None
+        self.summary = None
+        self.score = 0
+        self.pub_date = pub_date
+        self.categories = categories
+
+    @property
+    def title(self) -> str:
+        return self._title
+
+    @title.setter
+    def title(self, value: str):
+        self._title = value
+        self._title_lower = None
+
+    @property
+    def title_lower(self) -> str:
+        """소문자 제목 (키워드/브랜드 매칭용, 제목이 바뀌면 다시 계산)"""
+        if self._title_lower is None:
+            self._title_lower = self._title.lower()
+        return self._title_lower
+
+    @property
+    def raw_description(self) -> str:
+        """정리 전 설명 (정리된 뒤에는 원문을 버리므로 정리된 설명)"""
+        if self._raw_description is None:
+            return self._description
+        return self._raw_description
+
+    def set_cleaned_description(self, cleaned: str):
+        """이미 clean_text를 거친 설명 저장 (키워드 매칭에서 정리한 결과 재사용)"""
+        # Google News URL은 리다이렉트 URL이므로 스크래핑 스킵
+        # 대신 description이 거의 없으면 제목 사용
+        self._description = cleaned if len(cleaned) >= 20 else self.original_title
+        self._raw_description = None
+
+    @property
+    def description(self) -> str:
+        """HTML 태그를 제거한 설명 (거의 비어 있으면 원제목)"""
+        if self._description is None:
+            self.set_cleaned_description(clean_text(self._raw_description))
+        return self._description
+
+    @description.setter
+    def description(self, value: str):
+        self._description = value
+        self._raw_description = None
+
+    def copy(self, **changes) -> 'NewsItem':
+        """필드 일부를 바꾼 사본 (카테고리별 배정 시 출처/제목 지정)"""
+        item = NewsItem.__new__(NewsItem)
+        for name in self.__slots__:
+            setattr(item, name, getattr(self, name))
+        for name, value in changes.items():
+            setattr(item, name, value)
+        return item
+
+    def to_record(self) -> tuple:
+        """프로세스 간 전달용 튜플 (출처 없이 파싱/분류된 항목, 설명은 정리된 값)"""
+        return (self.original_title, self.link, self.description, self.pub_date, self.categories)
+
+    @classmethod
+    def from_record(cls, record: tuple) -> 'NewsItem':
+        original_title, link, description, pub_date, categories = record
+        item = cls(original_title, original_title, None, link, description, pub_date, categories)
+        item.set_cleaned_description(description)
+        return item
+
+    def __repr__(self) -> str:
+        return f"NewsItem({self._title!r}, {self.link!r})"
+
+
 def fetch_news_by_category(
     category: str,
     query: str,
     config: dict,
     logger: logging.Logger,
-    summarizer: AISummarizer,
-    target_date: date = None
-) -> List[Dict]:
-    """카테고리별 뉴스 수집 (RSS 피드 전용)"""
+    target_date: date = None,
+    feed_registry: FeedRegistry = None
+) -> List[NewsItem]:
+    """카테고리별 뉴스 수집 (RSS 피드 전용, AI 요약 전 원본 항목)"""
     logger.info(f">>> [{category}] 뉴스 수집 시작")
 
     news_list = []
@@ -428,117 +2301,625 @@ def fetch_news_by_category(
         logger.warning(f"    [{category}] RSS 소스가 설정되지 않았습니다")
         return news_list
 
+    # 레지스트리가 없으면 이 카테고리 전용으로 생성
+    if feed_registry is None:
+        feed_registry = FeedRegistry(logger)
+
     for rss_source in rss_sources:
         try:
             url = rss_source.get('url') if isinstance(rss_source, dict) else rss_source
             name = rss_source.get('name', url) if isinstance(rss_source, dict) else url
 
-            feed = feedparser.parse(url)
+            feed = feed_registry.get(url)
             count_before = len(news_list)
 
-            for entry in feed.entries:
-                news_item = parse_feed_entry(entry, today, config, summarizer, logger, keywords, source_name=name)
-                if news_item:
-                    news_list.append(news_item)
+            for entry in feed.entries:
+                news_item = parse_feed_entry(entry, today, config, logger, keywords, source_name=name)
+                if news_item:
+                    news_list.append(news_item)
+
+            collected = len(news_list) - count_before
+            elapsed = feed_registry.timings.get(url, 0.0)
+            logger.info(f"    {name}: {collected}개 수집 ({elapsed:.1f}초)")
+
+        except Exception as e:
+            logger.warning(f"    RSS 소스 오류 ({name}): {str(e)}")
+
+    logger.info(f"    [{category}] 총 {len(news_list)}개 수집 완료")
+    return news_list
+
+
+def collect_news(
+    config: dict,
+    logger: logging.Logger,
+    target_date: date = None,
+    feed_registry: FeedRegistry = None,
+    published: 'PublishedFilter' = None
+) -> Dict[str, List[NewsItem]]:
+    """
+    전체 카테고리 뉴스 수집
+    피드 엔트리마다 날짜/제외 키워드 필터와 키워드 매칭을 1회만 수행하고,
+    매칭된 모든 카테고리에 동시에 분류 (카테고리별 결과는 fetch_news_by_category와 동일)
+    """
+    today = target_date if target_date else date.today()
+    return collect_news_by_day(config, logger, [today], feed_registry, published)[today]
+
 
-            collected = len(news_list) - count_before
-            logger.info(f"    {name}: {collected}개 수집")
+def collect_news_by_day(
+    config: dict,
+    logger: logging.Logger,
+    days: List[date],
+    feed_registry: FeedRegistry = None,
+    published: 'PublishedFilter' = None
+) -> Dict[date, Dict[str, List[NewsItem]]]:
+    """
+    여러 날짜 뉴스를 한 번에 수집 (--from/--to)
+    피드마다 엔트리를 1회만 파싱/분류한 뒤 발행일로 날짜별 분배
+    날짜별 결과는 해당 날짜로 collect_news를 실행한 것과 동일
+    """
+    if feed_registry is None:
+        feed_registry = FeedRegistry(logger)
+    classifier = CategoryClassifier(config)
 
+    # 1. 피드별 1회 파싱 + 분류 + 날짜별 분배
+    parsed = {}
+    for url in collect_feed_urls(config):
+        try:
+            feed = feed_registry.get(url)
         except Exception as e:
-            logger.warning(f"    RSS 소스 오류 ({name}): {str(e)}")
+            parsed[url] = e
+            continue
+        try:
+            split = feed_registry.pop_split(url, days)
+            if split is None:
+                split = split_feed_by_day(url, feed, days, config, logger, classifier, feed_registry.metrics, published)
+        except Exception as e:
+            # 엔트리 파싱 오류는 다운로드 오류처럼 해당 피드만 실패 처리 ("RSS 소스 오류")
+            split = e
+        parsed[url] = split
+        feed_registry.release(url)  # 분류가 끝난 피드 엔트리는 바로 해제
 
-    logger.info(f"    [{category}] 총 {len(news_list)}개 수집 완료")
-    return news_list
+    # 2. 날짜/카테고리별 배정
+    return assign_by_category(parsed, days, config, logger, feed_registry)
+
+
+def split_feed_by_day(
+    url: str,
+    feed,
+    days: List[date],
+    config: dict,
+    logger: logging.Logger,
+    classifier: CategoryClassifier,
+    metrics: RunMetrics = None,
+    published: 'PublishedFilter' = None
+) -> Dict[date, List[NewsItem]]:
+    """피드 엔트리를 1회씩 파싱/분류해 발행일별로 나눔 (days 밖 엔트리와 이미 발행한 기사는 버림)"""
+    start = time.perf_counter()
+    wanted = set(days)
+    single_day = days[0] if len(days) == 1 else None
+    by_day = {day: [] for day in days}
+    kept = 0
+    for entry in feed.entries:
+        news_item = parse_feed_entry(entry, single_day, config, logger, classifier=classifier, published=published)
+        if news_item and news_item.pub_date.date() in wanted:
+            by_day[news_item.pub_date.date()].append(news_item)
+            kept += 1
+    if metrics:
+        metrics.record_feed(url, filter=time.perf_counter() - start, entries=len(feed.entries), kept=kept)
+    return by_day
+
+
+def assign_by_category(
+    parsed: Dict[str, object],
+    days: List[date],
+    config: dict,
+    logger: logging.Logger,
+    feed_registry: FeedRegistry
+) -> Dict[date, Dict[str, List[NewsItem]]]:
+    """
+    피드별 분류 결과({URL: {날짜: 뉴스} 또는 예외})를 날짜/카테고리별로 배정
+    설정된 RSS 소스 순서를 유지하므로 피드가 끝난 순서와 무관하게 결과가 같음
+    """
+    single_day = days[0] if len(days) == 1 else None
+    collected = {}
+    for day in days:
+        collected[day] = {}
+        for category, cat_config in config['categories'].items():
+            label = f"{category} {day}" if single_day is None else category
+            logger.info(f"\n--- 카테고리: {label} ---")
+            logger.info(f">>> [{label}] 뉴스 수집 시작")
+            news_list = []
+
+            rss_sources = cat_config.get('rss_sources', [])
+            if not rss_sources:
+                logger.warning(f"    [{category}] RSS 소스가 설정되지 않았습니다")
+
+            for rss_source in rss_sources:
+                url = rss_source.get('url') if isinstance(rss_source, dict) else rss_source
+                name = rss_source.get('name', url) if isinstance(rss_source, dict) else url
+
+                items = parsed.get(url, {})
+                if isinstance(items, Exception):
+                    logger.warning(f"    RSS 소스 오류 ({name}): {str(items)}")
+                    continue
+
+                count_before = len(news_list)
+                for item in items.get(day, []):
+                    if category in item.categories:
+                        news_list.append(item.copy(
+                            title=f"[{name}] {item.original_title}", source=sys.intern(name), categories=None
+                        ))
+
+                elapsed = feed_registry.timings.get(url, 0.0)
+                logger.info(f"    {name}: {len(news_list) - count_before}개 수집 ({elapsed:.1f}초)")
+
+            logger.info(f"    [{label}] 총 {len(news_list)}개 수집 완료")
+            collected[day][category] = news_list
+            if feed_registry.metrics:
+                feed_registry.metrics.record_category(category, collected=len(news_list))
+
+    return collected
 
 
 def parse_feed_entry(
     entry,
     today: date,
     config: dict,
-    summarizer: AISummarizer,
     logger: logging.Logger,
     keywords: List[str] = None,
-    source_name: str = None
-) -> Optional[Dict]:
-    """RSS 엔트리 파싱"""
+    source_name: str = None,
+    classifier: CategoryClassifier = None,
+    published: 'PublishedFilter' = None
+) -> Optional[NewsItem]:
+    """
+    RSS 엔트리 파싱 (날짜/키워드 필터링만 수행)
+    번역과 AI 요약은 선정 이후 enrich_news()에서 처리
+    classifier를 주면 keywords 대신 전 카테고리로 분류해 categories에 담음
+    today가 None이면 날짜 필터 없이 발행일만 파싱 (여러 날짜 수집 시 호출 측에서 분배)
+    published를 주면 최근 뉴스레터에 이미 실린 기사(같은 링크 또는 제목)는 제외
+    """
     try:
         # 날짜 필터링
-        pub_date_dt = date_parser.parse(entry.published)
-        if pub_date_dt.date() != today:
+        pub_date_dt = parse_published(entry.published)
+        if today is not None and pub_date_dt.date() != today:
             return None
     except:
         return None
 
-    # 제목 추출
-    original_title = entry.title
-    title = original_title
+    # 제목/링크 추출 (RSS 2.0은 제목 없는 item도 허용, 제목이나 링크가 없으면 뉴스로 쓰지 않음)
+    original_title = entry.get('title')
+    link = entry.get('link')
+    if not original_title or not link:
+        return None
 
-    # 제외 키워드 체크
+    # 제외 키워드 체크 (대소문자 구분)
     exclude_keywords = config.get('exclude_keywords', [])
-    if any(bad in title for bad in exclude_keywords):
+    if exclude_keywords and compile_keywords(tuple(exclude_keywords), lowercase=False).search(original_title):
         return None
 
-    # 카테고리 키워드 필터링 (keywords가 있는 경우만)
-    if keywords:
-        # 제목 또는 description에 키워드가 하나라도 포함되어 있는지 확인
-        description = entry.get('description', entry.get('summary', ''))
-        combined_text = (title + " " + clean_text(description)).lower()
+    # 이미 발행한 기사는 분류/스코어링/요약 전에 제외
+    if published is not None and published.seen(link, original_title):
+        return None
+
+    # 출처 표시 (번역 전 제목, 번역은 enrich_news에서)
+    title = f"[{source_name}] {original_title}" if source_name else original_title
+    news_item = NewsItem(
+        title, original_title, source_name, link,
+        entry.get('description', entry.get('summary', '')), pub_date_dt
+    )
 
-        if not any(keyword.lower() in combined_text for keyword in keywords):
+    # 제목 또는 description에 키워드가 하나라도 포함되어 있는지 확인
+    # (키워드가 없으면 설명 정리는 실제로 쓰일 때까지 미룸)
+    if classifier is not None or keywords:
+        cleaned_desc = clean_text(news_item.raw_description)
+        combined_text = original_title + " " + cleaned_desc
+        if classifier is not None:
+            news_item.categories = classifier.classify(combined_text)
+            if not news_item.categories:
+                return None
+        # 카테고리 키워드 필터링 (keywords가 있는 경우만)
+        elif not compile_keywords(tuple(keywords)).search(combined_text):
             return None
+        news_item.set_cleaned_description(cleaned_desc)
+
+    return news_item
 
-    # 기사 본문 가져오기
-    # Google News RSS는 본문이 없으므로 URL에서 직접 가져옴
-    description = entry.get('description', entry.get('summary', ''))
 
-    # Google News URL은 리다이렉트 URL이므로 스크래핑 스킵
-    # 대신 제목을 description으로 사용
-    cleaned_desc = clean_text(description)
-    if len(cleaned_desc) < 20:
-        # description이 거의 없으면 제목 사용
-        description = title
+# =================================================================
+# 번역 및 AI 요약 (선정된 뉴스만)
+# =================================================================
+def has_hangul(text: str) -> bool:
+    """한글 포함 여부"""
+    return any('\uac00' <= c <= '\ud7a3' for c in text)
+
+
+def enrich_tasks(news_list: List[NewsItem], summarizer: AISummarizer, journal: 'RunJournal' = None) -> List[tuple]:
+    """
+    요약이 없는 뉴스의 번역/요약 작업 목록 [(함수, 인자)]
+    일괄 요청 사용 시 batch_size개씩 묶은 요청 1개가 작업 1개
+    journal을 주면 요약이 끝난 뉴스를 바로 저널에 기록 (--resume 시 재사용)
+    """
+    pending = [news for news in news_list if news.summary is None]
+
+    def enrich_batch(chunk: List[NewsItem]):
+        # 일괄 요청 (여러 기사를 하나의 프롬프트로 번역 + 요약)
+        results = summarizer.summarize_batch([
+            {
+                'title': news.original_title,
+                'description': news.description,
+                'translate': bool(news.source) and not has_hangul(news.original_title),
+                'link': news.link
+            }
+            for news in chunk
+        ])
+        for news, result in zip(chunk, results):
+            if news.source:
+                news.title = f"[{news.source}] {result['title']}"
+            news.summary = result['summary']
+            # 대체 요약(호출 실패/비활성)은 기록하지 않아 --resume 시 다시 요약
+            if journal is not None and result.get('ok'):
+                journal.record_enriched(news)
+
+    def enrich_one(news: NewsItem):
+        original_title = news.original_title
+        source_name = news.source
+
+        # 영문 제목 번역 (한글이 포함되어 있지 않으면 번역)
+        translated = True
+        if source_name and not has_hangul(original_title):
+            try:
+                translated_title, translated = summarizer.translate_title_with_status(original_title, news.link)
+                news.title = f"[{source_name}] {translated_title}"
+            except:
+                translated = False
+                news.title = f"[{source_name}] {original_title}"
+
+        # AI 요약 생성
+        news.summary, summarized = summarizer.summarize_with_status(original_title, news.description, news.link)
+        # 대체 요약/원제목(호출 실패/비활성)은 기록하지 않아 --resume 시 다시 요약
+        if journal is not None and summarized and translated:
+            journal.record_enriched(news)
+
+    batch_size = summarizer.ai_config.get('batch_size', 1)
+    if summarizer.enabled and batch_size > 1:
+        return [(enrich_batch, pending[i:i + batch_size]) for i in range(0, len(pending), batch_size)]
+    return [(enrich_one, news) for news in pending]
+
+
+def enrich_news(
+    news_list: List[NewsItem],
+    summarizer: AISummarizer,
+    logger: logging.Logger,
+    journal: 'RunJournal' = None
+) -> List[NewsItem]:
+    """
+    영문 제목 번역 + AI 요약 생성
+    중복 제거/스코어링/선정을 통과한 뉴스에만 호출하여 LLM 호출 수를 최소화
+    """
+    tasks = enrich_tasks(news_list, summarizer, journal)
+    if not tasks:
+        return news_list
+
+    logger.info(f"    AI 번역/요약: {sum(news.summary is None for news in news_list)}개")
+
+    # 동시 요청 (호출 제한은 AISummarizer의 RateLimiter가 담당)
+    max_concurrency = summarizer.ai_config.get('max_concurrency', 4) if summarizer.enabled else 1
+    if max_concurrency > 1 and len(tasks) > 1:
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(tasks))) as executor:
+            list(executor.map(lambda task: task[0](task[1]), tasks))
+    else:
+        for func, arg in tasks:
+            func(arg)
+
+    return news_list
+
 
-    # 영문 제목 번역 (한글이 포함되어 있지 않으면 번역)
-    if source_name and not any('\uac00' <= c <= '\ud7a3' for c in original_title):
-        # 한글이 없으면 영문 뉴스로 간주하고 번역
+# =================================================================
+# 비동기 파이프라인 (--async)
+# =================================================================
+async def collect_news_async(
+    config: dict,
+    logger: logging.Logger,
+    days: List[date],
+    feed_registry: FeedRegistry,
+    max_workers: int = 8,
+    per_host_limit: int = 2,
+    published: 'PublishedFilter' = None
+) -> Dict[date, Dict[str, List[NewsItem]]]:
+    """
+    피드 다운로드를 하나의 이벤트 루프에서 코루틴으로 실행하고, 끝난 피드부터 바로 파싱/분류
+    (다운로드 단계 전체를 기다린 뒤 파싱하지 않음, 결과는 collect_news_by_day와 동일)
+    HTTP/feedparser는 동기 라이브러리이므로 기존 FeedRegistry를 전용 스레드 풀에서 실행하고
+    전체/호스트별 세마포어로 동시 요청 수 제한
+    엔트리 분류(split_feed_by_day)도 같은 스레드 풀에서 실행해 분류 중에도 루프가 다음 다운로드를 시작
+    """
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    urls = collect_feed_urls(config)
+    if feed_registry.health is not None:
+        urls.sort(key=feed_registry.health.is_slow)  # 느린 피드는 마지막에
+    classifier = CategoryClassifier(config)
+    limit = asyncio.Semaphore(max(1, max_workers))
+    host_limits = {}
+    parsed = {}
+
+    def classify(url: str, feed) -> object:
         try:
-            translated_title = summarizer.translate_title(original_title)
-            title = f"[{source_name}] {translated_title}"
-        except:
-            title = f"[{source_name}] {original_title}"
-    elif source_name:
-        # 한글 뉴스는 출처만 표시
-        title = f"[{source_name}] {original_title}"
-
-    # AI 요약 생성
-    summary = summarizer.summarize(original_title, clean_text(description))
-
-    return {
-        'title': title,
-        'original_title': original_title,
-        'source': source_name,
-        'link': entry.link,
-        'summary': summary,
-        'score': 0,
-        'pub_date': pub_date_dt
-    }
+            split = feed_registry.pop_split(url, days)
+            if split is None:
+                split = split_feed_by_day(url, feed, days, config, logger, classifier, feed_registry.metrics, published)
+        except Exception as e:
+            # 엔트리 파싱 오류는 다운로드 오류처럼 해당 피드만 실패 처리 ("RSS 소스 오류")
+            split = e
+        feed_registry.release(url)  # 분류가 끝난 피드 엔트리는 바로 해제
+        return split
+
+    async def fetch(url: str):
+        host = urllib.parse.urlparse(url).netloc.lower()
+        host_limit = host_limits.setdefault(host, asyncio.Semaphore(max(1, per_host_limit)))
+        async with host_limit, limit:
+            try:
+                feed = await loop.run_in_executor(executor, feed_registry.get, url)
+            except Exception as e:
+                logger.debug(f"    피드 다운로드 실패 ({url}): {str(e)}")
+                parsed[url] = e
+                return
+        parsed[url] = await loop.run_in_executor(executor, classify, url, feed)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        await asyncio.gather(*(fetch(url) for url in urls))
+    elapsed = time.perf_counter() - start
+    total = sum(feed_registry.timings.get(url, 0.0) for url in urls)
+    logger.info(f">>> RSS 비동기 수집 완료: {len(urls)}개, {elapsed:.1f}초 (순차 실행 시 {total:.1f}초)")
+
+    return assign_by_category(parsed, days, config, logger, feed_registry)
+
+
+async def enrich_all_async(
+    selected: Dict[str, List[NewsItem]],
+    summarizer: AISummarizer,
+    logger: logging.Logger,
+    journal: 'RunJournal' = None,
+    scraper: ArticleScraper = None,
+    config: dict = None
+):
+    """
+    모든 카테고리의 선정 뉴스를 한 번에 번역/요약 (카테고리 순서대로 기다리지 않음)
+    동시 요청 수는 ai_summary.max_concurrency, 호출 제한은 AISummarizer의 RateLimiter가 담당
+    scraper를 주면 설명이 짧은 뉴스의 본문 보강도 같은 루프에서 실행: 카테고리마다 자기 뉴스의 본문이 모이는 대로
+    요약을 시작하므로 보강할 뉴스가 없거나 먼저 끝난 카테고리는 다른 카테고리의 본문을 기다리지 않음
+    (요청 묶음은 카테고리 단위 그대로라 LLM 호출 수와 결과는 동기 모드와 동일)
+    """
+    thin = thin_descriptions(selected, config) if scraper is not None else []
+    pending = sum(news.summary is None for news_list in selected.values() for news in news_list)
+    if not pending:
+        return
+    import asyncio
+
+    logger.info(f">>> AI 번역/요약 (전체 카테고리 동시): {pending}개" + (f", 본문 보강 후 요약 {len(thin)}개" if thin else ""))
+
+    loop = asyncio.get_running_loop()
+    max_concurrency = summarizer.ai_config.get('max_concurrency', 4) if summarizer.enabled else 1
+    thin_ids = {id(news) for news in thin}
+    host_limits = {}
+    replaced = 0
+    scraped_at = [0.0]  # 마지막 본문을 받은 시각 (보강 소요 시간 로그용)
+
+    async def scrape(link: str) -> str:
+        # 본문 요청은 ArticleScraper.fetch_many와 같은 제한 (전체 max_workers, 호스트당 per_host_limit)
+        host = urllib.parse.urlparse(link).netloc.lower()
+        host_limit = host_limits.setdefault(host, asyncio.Semaphore(max(1, scraper.per_host_limit)))
+        async with host_limit, scrape_limit:
+            content = await loop.run_in_executor(scrape_executor, scraper.fetch, link)
+        scraped_at[0] = time.perf_counter()
+        return content
+
+    async def enrich_category(news_list: List[NewsItem]):
+        nonlocal replaced
+        waiting = [news for news in news_list if id(news) in thin_ids]
+        for news, content in zip(waiting, await asyncio.gather(*(contents[news.link] for news in waiting))):
+            replaced += apply_article_content(news, content)
+        await asyncio.gather(*(
+            loop.run_in_executor(executor, func, arg) for func, arg in enrich_tasks(news_list, summarizer, journal)
+        ))
+
+    start = time.perf_counter()
+    scrape_limit = asyncio.Semaphore(max(1, scraper.max_workers)) if thin else None
+    with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as executor, \
+            ThreadPoolExecutor(max_workers=max(1, min(scraper.max_workers, len(thin))) if thin else 1) as scrape_executor:
+        # 본문 요청은 카테고리 순서대로 제출 (앞 카테고리부터 요약 시작)
+        contents = {link: asyncio.ensure_future(scrape(link)) for link in dict.fromkeys(news.link for news in thin)}
+        await asyncio.gather(*(enrich_category(news_list) for news_list in selected.values()))
+    if thin:
+        log_scrape_stats(scraper, logger, len(thin), replaced, scraped_at[0] - start)
+
+
+# =================================================================
+# 백그라운드 요약 (수동 큐레이션)
+# =================================================================
+class BackgroundEnricher:
+    """
+    수동 큐레이션 중 뒤 카테고리의 번역/요약을 백그라운드 스레드로 진행
+    작업은 (카테고리 순서, 후보 순위) 우선순위 큐에서 꺼내므로 곧 화면에 나올 카테고리의
+    상위 후보부터 요약되고, 운영자가 q를 누르면 다음 카테고리 목록이 대부분 준비되어 있음
+    동시 요청 수는 ai_summary.max_concurrency, 호출 제한은 AISummarizer의 RateLimiter가 담당
+    """
+
+    def __init__(self, selected: Dict[str, List[NewsItem]], summarizer: AISummarizer, logger: logging.Logger,
+                 journal: 'RunJournal' = None):
+        from queue import PriorityQueue
+
+        self.logger = logger
+        self._queue = PriorityQueue()
+        self._lock = threading.Lock()
+        self._remaining = {}
+        self._done = {}
+        self._closed = False
+        for order, (category, news_list) in enumerate(selected.items()):
+            tasks = enrich_tasks(news_list, summarizer, journal)
+            self._remaining[category] = len(tasks)
+            self._done[category] = threading.Event()
+            if not tasks:
+                self._done[category].set()
+            for position, (func, arg) in enumerate(tasks):
+                self._queue.put((order, position, category, func, arg))
+
+        total = sum(self._remaining.values())
+        max_concurrency = summarizer.ai_config.get('max_concurrency', 4) if summarizer.enabled else 1
+        self._workers = [
+            threading.Thread(target=self._run, name=f'enrich-{n}', daemon=True)
+            for n in range(max(1, min(max_concurrency, total)))
+        ] if total else []
+        for worker in self._workers:
+            worker.start()
+        if total:
+            logger.info(f">>> AI 번역/요약 백그라운드 시작: {len(selected)}개 카테고리, 요청 {total}개")
+
+    def _run(self):
+        while True:
+            order, position, category, func, arg = self._queue.get()
+            if func is None:
+                return
+            if self._closed:
+                continue
+            try:
+                func(arg)
+            except Exception as e:
+                # 남은 항목은 큐레이션 직전 enrich_news가 다시 처리
+                self.logger.warning(f"    [{category}] 백그라운드 요약 실패: {str(e)[:100]}")
+            with self._lock:
+                self._remaining[category] -= 1
+                if not self._remaining[category]:
+                    self._done[category].set()
+
+    def wait(self, category: str) -> float:
+        """category의 요약이 끝날 때까지 대기, 기다린 시간(초) 반환"""
+        start = time.perf_counter()
+        done = self._done.get(category)
+        if done is not None:
+            done.wait()
+        return time.perf_counter() - start
+
+    def close(self):
+        """남은 작업은 버리고 워커 종료 (큐레이션이 끝난 뒤 호출)"""
+        self._closed = True
+        for n, _ in enumerate(self._workers):
+            self._queue.put((math.inf, n, None, None, None))
 
 
 # =================================================================
 # 중복 제거
 # =================================================================
-def remove_duplicates(news_list: List[Dict], logger: logging.Logger) -> List[Dict]:
-    """제목 유사도 기반 중복 제거"""
-    unique = []
-    for news in news_list:
-        is_dup = False
-        for existing in unique:
-            sim = difflib.SequenceMatcher(None, news['title'], existing['title']).ratio()
-            if sim > 0.7:
-                is_dup = True
-                break
-        if not is_dup:
-            unique.append(news)
+class NearDuplicateIndex:
+    """
+    MinHash LSH 기반 유사 제목 인덱스
+    문자 n-gram MinHash로 비교 후보만 추린 뒤, 후보에 대해서만 기존과 같은
+    SequenceMatcher 유사도(> threshold)로 최종 판정 (전체 쌍 비교 O(n²) 제거)
+    """
+
+    TITLE_PREFIX = re.compile(r'^\[[^\]]*\]\s*')
+
+    def __init__(
+        self,
+        threshold: float = 0.7,
+        shingle_size: int = 4,
+        bands: int = 24,
+        rows: int = 3,
+        min_jaccard: float = 0.15
+    ):
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self.bands = bands
+        self.rows = rows
+        # 추정 n-gram 자카드 유사도가 이보다 낮은 후보는 SequenceMatcher 비교 생략
+        self.min_matches = int(min_jaccard * bands * rows)
+        rng = random.Random(20260104)  # 실행마다 같은 결과가 나오도록 고정 시드
+        self._masks = [rng.getrandbits(64) for _ in range(bands * rows)]
+        self._buckets = [{} for _ in range(bands)]
+        self._titles = []
+        self._signatures = []
+
+    def _signature(self, title: str) -> List[int]:
+        """출처 접두어([The Verge] 등)를 뗀 소문자 제목의 n-gram MinHash 서명"""
+        text = ' '.join(self.TITLE_PREFIX.sub('', title).lower().split())
+        k = self.shingle_size
+        hashes = {
+            int.from_bytes(hashlib.blake2b(text[i:i + k].encode('utf-8'), digest_size=8).digest(), 'little')
+            for i in range(max(1, len(text) - k + 1))
+        }
+        return [min(map(mask.__xor__, hashes)) for mask in self._masks]
+
+    def _is_similar(self, a: str, b: str) -> bool:
+        """SequenceMatcher 유사도 > threshold (상한값으로 먼저 걸러냄)"""
+        if 2.0 * min(len(a), len(b)) / ((len(a) + len(b)) or 1) <= self.threshold:
+            return False
+        matcher = difflib.SequenceMatcher(None, a, b)
+        return matcher.quick_ratio() > self.threshold and matcher.ratio() > self.threshold
+
+    def _lookup(self, title: str) -> tuple:
+        """(서명, 밴드 키, 유사한 제목 존재 여부)"""
+        signature = self._signature(title)
+        rows = self.rows
+        keys = [tuple(signature[b * rows:(b + 1) * rows]) for b in range(self.bands)]
+
+        # 같은 밴드에 걸린 횟수가 많은(유사할 가능성이 높은) 후보부터 비교
+        hits = {}
+        for bucket, key in zip(self._buckets, keys):
+            for idx in bucket.get(key, ()):
+                hits[idx] = hits.get(idx, 0) + 1
+        for idx in sorted(hits, key=lambda i: (-hits[i], i)):
+            matches = sum(map(int.__eq__, signature, self._signatures[idx]))
+            if matches >= self.min_matches and self._is_similar(title, self._titles[idx]):
+                return signature, keys, True
+        return signature, keys, False
+
+    def contains(self, title: str) -> bool:
+        """기존 제목 중 유사한 제목이 있는지 (인덱스는 바꾸지 않음)"""
+        return self._lookup(title)[2]
+
+    def add_if_unique(self, title: str) -> bool:
+        """기존 제목과 유사하지 않으면 인덱스에 추가하고 True, 중복이면 False"""
+        signature, keys, duplicate = self._lookup(title)
+        if duplicate:
+            return False
+
+        idx = len(self._titles)
+        self._titles.append(title)
+        self._signatures.append(array('Q', signature))
+        for bucket, key in zip(self._buckets, keys):
+            bucket.setdefault(key, []).append(idx)
+        return True
+
+    def __len__(self) -> int:
+        return len(self._titles)
+
+
+def create_dedup_index(config: dict) -> NearDuplicateIndex:
+    """config.yaml의 dedup 설정으로 인덱스 생성"""
+    dedup_config = config.get('dedup', {})
+    return NearDuplicateIndex(
+        threshold=dedup_config.get('threshold', 0.7),
+        shingle_size=dedup_config.get('shingle_size', 4),
+        bands=dedup_config.get('bands', 24),
+        rows=dedup_config.get('rows', 3)
+    )
+
+
+def remove_duplicates(
+    news_list: List[NewsItem],
+    logger: logging.Logger,
+    index: NearDuplicateIndex = None
+) -> List[NewsItem]:
+    """
+    제목 유사도 기반 중복 제거
+    index를 공유하면 여러 카테고리에 걸쳐 중복 제거 (먼저 들어온 뉴스를 유지)
+    """
+    if index is None:
+        index = NearDuplicateIndex()
+
+    unique = [news for news in news_list if index.add_if_unique(news.title)]
 
     if len(news_list) != len(unique):
         logger.info(f"    중복 제거: {len(news_list)}개 → {len(unique)}개")
@@ -546,10 +2927,17 @@ def remove_duplicates(news_list: List[Dict], logger: logging.Logger) -> List[Dic
     return unique
 
 
+def drop_cross_category(news_list: List[NewsItem], index: Optional[NearDuplicateIndex]) -> List[NewsItem]:
+    """앞 카테고리에 실린(선정/큐레이션된) 뉴스와 제목이 비슷한 뉴스 제외 (index가 None이면 그대로)"""
+    if index is None:
+        return news_list
+    return [news for news in news_list if not index.contains(news.original_title)]
+
+
 # =================================================================
 # 스코어링
 # =================================================================
-def calculate_scores(news_list: List[Dict], query: str, config: dict, category: str = None) -> List[Dict]:
+def calculate_scores(news_list: List[NewsItem], query: str, config: dict, category: str = None) -> List[NewsItem]:
     """키워드 매칭 기반 스코어링 + 우선순위 브랜드 가중치"""
     keywords = query.replace(" OR ", " ").split() if query else []
     weight = config.get('weights', {}).get('title_match', 10)
@@ -561,26 +2949,25 @@ def calculate_scores(news_list: List[Dict], query: str, config: dict, category:
         cat_config = config.get('categories', {}).get(category, {})
         priority_brands = cat_config.get('priority_brands', [])
 
+    keyword_matcher = compile_keywords(tuple(keywords)) if keywords else None
+    brand_matcher = compile_keywords(tuple(priority_brands)) if priority_brands else None
+
     for news in news_list:
         score = 0
-        title_lower = news['title'].lower()
 
-        # 키워드 매칭 점수
-        for kw in keywords:
-            if kw.lower() in title_lower:
-                score += weight
+        # 키워드 매칭 점수 (목록에 같은 키워드가 여러 번 있으면 그만큼 가산)
+        if keyword_matcher:
+            found = keyword_matcher.find(news.title_lower, lowered=True)
+            score += weight * sum(1 for kw in keywords if kw.lower() in found)
 
-        # 우선순위 브랜드 가중치
-        if priority_brands:
-            for brand in priority_brands:
-                if brand.lower() in title_lower:
-                    score += brand_weight
-                    break  # 하나라도 매칭되면 가중치 추가
+        # 우선순위 브랜드 가중치 (하나라도 매칭되면 가중치 추가)
+        if brand_matcher and brand_matcher.search(news.title_lower, lowered=True):
+            score += brand_weight
 
-        news['score'] = score
+        news.score = score
 
     # 점수 내림차순 정렬
-    return sorted(news_list, key=lambda x: x['score'], reverse=True)
+    return sorted(news_list, key=lambda x: x.score, reverse=True)
 
 
 # =================================================================
@@ -588,10 +2975,10 @@ def calculate_scores(news_list: List[Dict], query: str, config: dict, category:
 # =================================================================
 def curate_category(
     category: str,
-    news_list: List[Dict],
+    news_list: List[NewsItem],
     max_items: int,
     logger: logging.Logger
-) -> List[Dict]:
+) -> List[NewsItem]:
     """대화형 CLI 큐레이션"""
     while True:
         # 화면 클리어
@@ -602,7 +2989,7 @@ def curate_category(
         print('='*70)
 
         for idx, news in enumerate(news_list):
-            title_display = news['title'][:60] + "..." if len(news['title']) > 60 else news['title']
+            title_display = news.title[:60] + "..." if len(news.title) > 60 else news.title
             print(f" {idx:2d}. {title_display}")
 
         print('-'*70)
@@ -627,7 +3014,7 @@ def curate_category(
                 idx = int(cmd[1])
                 if 0 <= idx < len(news_list):
                     deleted = news_list.pop(idx)
-                    print(f"✓ {idx}번 뉴스 삭제됨: \"{deleted['title'][:50]}...\"")
+                    print(f"✓ {idx}번 뉴스 삭제됨: \"{deleted.title[:50]}...\"")
                 else:
                     print("❌ 유효하지 않은 번호입니다.")
             except ValueError:
@@ -652,8 +3039,10 @@ def curate_category(
 # =================================================================
 # HTML 생성
 # =================================================================
-def generate_html(final_data: Dict, config: dict, logger: logging.Logger) -> str:
-    """Jinja2 템플릿으로 HTML 생성"""
+def generate_html(final_data: Dict, config: dict, logger: logging.Logger, newsletter_date: date = None) -> str:
+    """Jinja2 템플릿으로 HTML 생성 (newsletter_date: 발행일/파일명 날짜, 기본 오늘)"""
+    from jinja2 import Environment, FileSystemLoader
+
     env = Environment(loader=FileSystemLoader('.'))
 
     try:
@@ -662,14 +3051,15 @@ def generate_html(final_data: Dict, config: dict, logger: logging.Logger) -> str
         logger.error(f"template.html 파일을 찾을 수 없습니다: {e}")
         sys.exit(1)
 
+    issue_date = newsletter_date or datetime.now()
     html = template.render(
         title=config['newsletter_title'],
         intro=config['intro_text'],
-        date=datetime.now().strftime("%Y년 %m월 %d일"),
+        date=issue_date.strftime("%Y년 %m월 %d일"),
         data=final_data
     )
 
-    filename = f"newsletter_{datetime.now().strftime('%Y%m%d')}.html"
+    filename = f"newsletter_{issue_date.strftime('%Y%m%d')}.html"
     with open(filename, "w", encoding="utf-8") as f:
         f.write(html)
 
@@ -680,8 +3070,203 @@ def generate_html(final_data: Dict, config: dict, logger: logging.Logger) -> str
 # =================================================================
 # 아카이빙
 # =================================================================
-def archive_newsletter(filename: str, config: dict, final_data: Dict, logger: logging.Logger):
-    """뉴스레터 아카이빙"""
+class ArchiveIndex:
+    """
+    발행한 뉴스레터 색인 (SQLite, 아카이브 디렉토리의 index.sqlite3)
+    호수(issue)별 아카이브 파일 목록과 발행 기사(제목/링크/출처/카테고리/점수/요약)를 기록해
+    보관 기간(keep_days) 정리는 디렉토리를 훑지 않고 색인의 파일 목록으로 삭제하고,
+    출처 통계/전문 검색은 HTML을 뒤지지 않고 색인에서 조회
+    전문 검색은 SQLite FTS5 trigram 토크나이저(한글 부분 일치)가 있으면 사용, 없으면 LIKE
+    """
+
+    def __init__(self, archive_dir: str, db_path: str = None):
+        self.archive_dir = Path(archive_dir)
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(db_path or self.archive_dir / 'index.sqlite3'), check_same_thread=False)
+        self.conn.executescript(
+            "CREATE TABLE IF NOT EXISTS issues ("
+            "issue_date TEXT PRIMARY KEY, filename TEXT NOT NULL, files TEXT NOT NULL, "
+            "total_news INTEGER NOT NULL, created_at REAL NOT NULL);"
+            "CREATE TABLE IF NOT EXISTS items ("
+            "id INTEGER PRIMARY KEY, issue_date TEXT NOT NULL, category TEXT NOT NULL, position INTEGER NOT NULL, "
+            "title TEXT NOT NULL, original_title TEXT NOT NULL, link TEXT NOT NULL, norm_link TEXT NOT NULL, "
+            "source TEXT, score INTEGER, summary TEXT, title_key TEXT);"
+            "CREATE INDEX IF NOT EXISTS idx_items_issue ON items(issue_date);"
+            "CREATE INDEX IF NOT EXISTS idx_items_category ON items(category, issue_date);"
+            "CREATE INDEX IF NOT EXISTS idx_items_link ON items(norm_link);"
+        )
+        if 'title_key' not in {row[1] for row in self.conn.execute("PRAGMA table_info(items)")}:
+            self.conn.execute("ALTER TABLE items ADD COLUMN title_key TEXT")
+        try:
+            self.conn.executescript(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5("
+                "title, summary, content='items', content_rowid='id', tokenize='trigram');"
+                "CREATE TRIGGER IF NOT EXISTS items_fts_insert AFTER INSERT ON items BEGIN "
+                "INSERT INTO items_fts(rowid, title, summary) VALUES (new.id, new.title, new.summary); END;"
+                "CREATE TRIGGER IF NOT EXISTS items_fts_delete AFTER DELETE ON items BEGIN "
+                "INSERT INTO items_fts(items_fts, rowid, title, summary) "
+                "VALUES ('delete', old.id, old.title, old.summary); END;"
+            )
+            self.fts = True
+        except sqlite3.OperationalError:
+            self.fts = False  # FTS5/trigram 미지원 SQLite
+        self.conn.commit()
+        self._lock = threading.Lock()
+        if not self.conn.execute("SELECT 1 FROM issues LIMIT 1").fetchone():
+            self._import_legacy()
+
+    def _import_legacy(self):
+        """색인 도입 전 아카이브(metadata_YYYYMMDD.json)를 호수로 등록 (기사 없이 파일 목록만, 최초 1회)"""
+        rows = []
+        for metadata_file in self.archive_dir.glob('*/*/metadata_*.json'):
+            try:
+                with open(metadata_file, 'r', encoding='utf-8') as f:
+                    metadata = json.load(f)
+                stamp = metadata_file.stem.split('_', 1)[1]
+                issue_date = metadata.get('issue_date') or datetime.strptime(stamp, '%Y%m%d').date().isoformat()
+            except (OSError, ValueError, IndexError):
+                continue
+            folder = metadata_file.parent
+            files = [folder / metadata.get('filename', ''), metadata_file, folder / f"metrics_{stamp}.json"]
+            rows.append((
+                issue_date, metadata.get('filename', ''),
+                json.dumps([str(path.relative_to(self.archive_dir)) for path in files if path.is_file()]),
+                metadata.get('total_news', 0), metadata_file.stat().st_mtime
+            ))
+        if rows:
+            with self._lock:
+                self.conn.executemany("INSERT OR IGNORE INTO issues VALUES (?, ?, ?, ?, ?)", rows)
+                self.conn.commit()
+
+    def add_issue(self, issue_date: date, filename: str, files: List[Path], final_data: Dict[str, List['NewsItem']]):
+        """발행한 호수 기록 (같은 날짜를 다시 발행하면 교체)"""
+        day = issue_date.isoformat()
+        rows = [
+            (day, category, position, news.title, news.original_title, news.link, normalize_link(news.link),
+             news.source, news.score, news.summary, title_fingerprint(news.original_title))
+            for category, news_list in final_data.items()
+            for position, news in enumerate(news_list)
+        ]
+        relative = [str(Path(path).relative_to(self.archive_dir)) for path in files]
+        with self._lock:
+            self.conn.execute("DELETE FROM items WHERE issue_date = ?", (day,))
+            self.conn.executemany(
+                "INSERT INTO items (issue_date, category, position, title, original_title, link, norm_link, "
+                "source, score, summary, title_key) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            self.conn.execute(
+                "INSERT OR REPLACE INTO issues VALUES (?, ?, ?, ?, ?)",
+                (day, filename, json.dumps(relative), len(rows), time.time())
+            )
+            self.conn.commit()
+
+    def prune(self, keep_days: float) -> int:
+        """
+        아카이브에 저장한 지 keep_days가 지난 호수의 파일/색인 삭제, 삭제한 호수 수 반환
+        (발행일이 아닌 저장 시각 기준이라 --date/--from으로 지난 날짜를 다시 만들어도 바로 지워지지 않음)
+        """
+        cutoff = time.time() - keep_days * 86400
+        with self._lock:
+            expired = self.conn.execute(
+                "SELECT issue_date, files FROM issues WHERE created_at < ?", (cutoff,)
+            ).fetchall()
+        if not expired:
+            return 0
+        folders = set()
+        for _, files in expired:
+            for name in json.loads(files):
+                path = self.archive_dir / name
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+                folders.update((path.parent, path.parent.parent))
+        # 비게 된 연/월 폴더 정리 (월 폴더 먼저)
+        for folder in sorted(folders, key=lambda p: len(p.parts), reverse=True):
+            try:
+                folder.rmdir()
+            except OSError:
+                pass
+        days = [(issue_date,) for issue_date, _ in expired]
+        with self._lock:
+            self.conn.executemany("DELETE FROM items WHERE issue_date = ?", days)
+            self.conn.executemany("DELETE FROM issues WHERE issue_date = ?", days)
+            self.conn.commit()
+        return len(expired)
+
+    def sources(self, category: str = None, since: date = None, until: date = None) -> List[tuple]:
+        """기간 내 발행 기사의 (출처, 카테고리, 기사 수, 첫 발행일, 마지막 발행일), 기사 수 내림차순"""
+        sql = ("SELECT COALESCE(source, ''), category, COUNT(*), MIN(issue_date), MAX(issue_date) FROM items "
+               "WHERE issue_date BETWEEN ? AND ?")
+        params = [(since or date.min).isoformat(), (until or date.max).isoformat()]
+        if category:
+            sql += " AND category = ?"
+            params.append(category)
+        sql += " GROUP BY source, category ORDER BY COUNT(*) DESC, source"
+        with self._lock:
+            return self.conn.execute(sql, params).fetchall()
+
+    def published_keys(self, since: date, until: date) -> tuple:
+        """기간 내 발행 기사의 (정규화 링크 목록, 제목 지문 목록)"""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT norm_link, COALESCE(title_key, '') FROM items WHERE issue_date BETWEEN ? AND ?",
+                (since.isoformat(), until.isoformat())
+            ).fetchall()
+        return [link for link, _ in rows], [title_key for _, title_key in rows]
+
+    def uses_fts(self, query: str) -> bool:
+        """검색어를 FTS 색인으로 찾는지 (trigram은 3글자 이상 단어만 색인으로 찾음)"""
+        terms = query.split()
+        return self.fts and bool(terms) and all(len(term) >= 3 for term in terms)
+
+    def search(self, query: str, category: str = None, since: date = None, until: date = None,
+               limit: int = 20) -> List[tuple]:
+        """제목/요약 전문 검색 (단어는 모두 포함, 대소문자 무시) → (발행일, 카테고리, 제목, 링크, 출처), 최신순"""
+        terms = query.split()
+        params = [(since or date.min).isoformat(), (until or date.max).isoformat()]
+        sql = ("SELECT items.issue_date, items.category, items.title, items.link, items.source FROM items "
+               "WHERE items.issue_date BETWEEN ? AND ?")
+        if self.uses_fts(query):
+            sql += " AND items.id IN (SELECT rowid FROM items_fts WHERE items_fts MATCH ?)"
+            params.append(' AND '.join('"' + term.replace('"', '""') + '"' for term in terms))
+        else:
+            for term in terms:
+                sql += " AND (items.title LIKE ? OR COALESCE(items.summary, '') LIKE ?)"
+                params.extend([f"%{term}%"] * 2)
+        if category:
+            sql += " AND items.category = ?"
+            params.append(category)
+        sql += " ORDER BY items.issue_date DESC, items.category, items.position LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            return self.conn.execute(sql, params).fetchall()
+
+    def close(self):
+        self.conn.close()
+
+
+def create_archive_index(config: dict) -> Optional[ArchiveIndex]:
+    """설정(archive)으로 아카이브 색인 열기 (아카이빙/색인 비활성화 시 None)"""
+    archive_config = config.get('archive', {})
+    if not archive_config.get('enabled', True) or not archive_config.get('index', True):
+        return None
+    return ArchiveIndex(archive_config.get('archive_dir', 'archive'), archive_config.get('index_path'))
+
+
+def archive_newsletter(
+    filename: str,
+    config: dict,
+    final_data: Dict,
+    logger: logging.Logger,
+    metrics: RunMetrics = None,
+    newsletter_date: date = None
+):
+    """
+    뉴스레터 아카이빙 (metrics를 주면 실행 지표 JSON도 메타데이터 옆에 저장)
+    newsletter_date를 주면 해당 날짜의 연/월 폴더, 메타데이터 파일명, 색인 발행일 사용 (기본 오늘)
+    """
     archive_config = config.get('archive', {})
     if not archive_config.get('enabled', True):
         return
@@ -690,7 +3275,8 @@ def archive_newsletter(filename: str, config: dict, final_data: Dict, logger: lo
 
     # 연/월 폴더 생성
     now = datetime.now()
-    year_month_dir = archive_dir / str(now.year) / f"{now.month:02d}"
+    issue_date = newsletter_date or now.date()
+    year_month_dir = archive_dir / str(issue_date.year) / f"{issue_date.month:02d}"
     year_month_dir.mkdir(parents=True, exist_ok=True)
 
     # HTML 파일 복사
@@ -701,17 +3287,470 @@ def archive_newsletter(filename: str, config: dict, final_data: Dict, logger: lo
     # 메타데이터 저장
     metadata = {
         'date': now.strftime('%Y-%m-%d %H:%M:%S'),
+        'issue_date': issue_date.isoformat(),
         'filename': filename,
         'categories': list(final_data.keys()),
         'total_news': sum(len(items) for items in final_data.values())
     }
 
-    metadata_file = year_month_dir / f"metadata_{now.strftime('%Y%m%d')}.json"
+    metadata_file = year_month_dir / f"metadata_{issue_date.strftime('%Y%m%d')}.json"
     with open(metadata_file, 'w', encoding='utf-8') as f:
         json.dump(metadata, f, ensure_ascii=False, indent=2)
+    files = [archive_file, metadata_file]
+
+    if metrics:
+        metrics_file = year_month_dir / f"metrics_{issue_date.strftime('%Y%m%d')}.json"
+        metrics.save(metrics_file)
+        files.append(metrics_file)
 
     logger.info(f"✓ 아카이브 저장: {archive_file}")
 
+    # 발행 기사 색인 + 보관 기간이 지난 호수 정리
+    index = create_archive_index(config)
+    if index is not None:
+        index.add_issue(issue_date, filename, files, final_data)
+        removed = index.prune(archive_config.get('keep_days', 90))
+        if removed:
+            logger.info(f"✓ 보관 기간({archive_config.get('keep_days', 90)}일)이 지난 아카이브 {removed}개 삭제")
+        index.close()
+
+
+TITLE_KEY_MIN_CHARS = 10
+
+
+def title_fingerprint(title: str) -> str:
+    """제목 지문 (출처 접두어/문장 부호/대소문자/공백 차이 무시, 짧은 제목은 오탐이 많아 빈 문자열)"""
+    key = ' '.join(re.sub(r'[\W_]+', ' ', NearDuplicateIndex.TITLE_PREFIX.sub('', title or '').lower()).split())
+    return key if len(key) >= TITLE_KEY_MIN_CHARS else ''
+
+
+class PublishedFilter:
+    """
+    최근 뉴스레터에 이미 실린 기사 집합 (정규화 링크/제목 지문의 64비트 해시)
+    피드에 2~3일 남아 있는 기사나 --date 재실행 시 같은 기사가 다시 번역/요약되지 않도록
+    parse_feed_entry에서 분류/스코어링 전에 제외 (파싱 프로세스에도 그대로 전달)
+    """
+
+    def __init__(self, links: List[str], titles: List[str]):
+        self._keys = frozenset(
+            [self._hash('link', link) for link in links if link]
+            + [self._hash('title', title) for title in titles if title]
+        )
+        self.hits = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _hash(kind: str, value: str) -> int:
+        return int.from_bytes(hashlib.blake2b(f"{kind}:{value}".encode('utf-8'), digest_size=8).digest(), 'big')
+
+    def seen(self, link: str, title: str) -> bool:
+        """같은 링크(정규화) 또는 같은 제목 지문의 기사를 이미 발행했는지 (발행했으면 hits 증가)"""
+        title_key = title_fingerprint(title)
+        if (link and self._hash('link', normalize_link(link)) in self._keys) or \
+                (title_key and self._hash('title', title_key) in self._keys):
+            self.add_hits(1)
+            return True
+        return False
+
+    def add_hits(self, count: int):
+        with self._lock:
+            self.hits += count
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __getstate__(self) -> dict:
+        # 파싱 프로세스로 보낼 때 잠금은 제외
+        return {'_keys': self._keys, 'hits': self.hits}
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+def create_published_filter(config: dict, first_day: date, logger: logging.Logger) -> Optional[PublishedFilter]:
+    """
+    first_day 이전 dedup.published_lookback_days일 동안 발행한 기사로 PublishedFilter 생성
+    (0이면 사용 안 함, first_day 이후 호수는 제외하므로 같은 날짜 재실행은 걸러지지 않음)
+    """
+    lookback = config.get('dedup', {}).get('published_lookback_days', 0)
+    if not lookback:
+        return None
+    index = create_archive_index(config)
+    if index is None:
+        return None
+    links, titles = index.published_keys(first_day - timedelta(days=lookback), first_day - timedelta(days=1))
+    index.close()
+    published = PublishedFilter(links, titles)
+    logger.info(f">>> 최근 {lookback}일 발행 기사 {len(links)}개는 수집에서 제외")
+    return published
+
+
+def archive_query(args: argparse.Namespace, config: dict, logger: logging.Logger):
+    """
+    --search/--sources: 아카이브 색인 조회 (--category로 카테고리, --from/--to로 발행일 범위 제한)
+    """
+    index = create_archive_index(config)
+    if index is None:
+        logger.warning("아카이브 색인이 꺼져 있습니다 (config.yaml의 archive.enabled / archive.index)")
+        return
+    since, until = args.date_range or (None, None)
+    span = f"{since} ~ {until}" if since else "전체 기간"
+
+    start = time.perf_counter()
+    if args.sources:
+        rows = index.sources(args.category, since, until)
+        elapsed = (time.perf_counter() - start) * 1000
+        logger.info(f">>> 출처별 발행 기사 ({args.category or '전체 카테고리'}, {span}): {len(rows)}개 ({elapsed:.1f}ms)")
+        logger.info(f"    {'기사 수':>6}  {'첫 발행':<10}  {'마지막 발행':<10}  출처 (카테고리)")
+        for source, category, count, first, last in rows:
+            logger.info(f"    {count:>6}  {first:<10}  {last:<10}  {source or '(출처 없음)'} ({category})")
+    else:
+        rows = index.search(args.search, args.category, since, until, limit=args.limit)
+        elapsed = (time.perf_counter() - start) * 1000
+        logger.info(f">>> 검색 \"{args.search}\" ({args.category or '전체 카테고리'}, {span}): "
+                    f"{len(rows)}개 ({elapsed:.1f}ms, {'FTS5' if index.uses_fts(args.search) else 'LIKE'})")
+        for issue_date, category, title, link, source in rows:
+            logger.info(f"    {issue_date} [{category}] {title}")
+            logger.info(f"               {link}")
+    index.close()
+
+
+# =================================================================
+# 백그라운드 수집 (--watch)
+# =================================================================
+class PollScheduler:
+    """
+    피드별 적응형 폴링 주기 (기사 저장소의 schedule 테이블에 유지)
+    주기 = 최근 엔트리 발행 간격의 중앙값 (min~max 범위로 제한)
+    새 엔트리가 없으면 1.5배, 오류 시 2배로 늘리고 새 엔트리가 들어오면 발행 주기로 복귀
+    """
+
+    def __init__(self, store: ArticleStore, min_interval: float = 300, max_interval: float = 7200):
+        self.store = store
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+
+    def cadence(self, url: str) -> float:
+        """최근 발행 간격 중앙값 (초), 엔트리가 부족하면 max_interval"""
+        published = self.store.recent_published(url)
+        gaps = sorted(a - b for a, b in zip(published, published[1:]) if a > b)
+        if not gaps:
+            return self.max_interval
+        return min(max(gaps[len(gaps) // 2], self.min_interval), self.max_interval)
+
+    def due(self, urls: List[str], now: float = None) -> List[str]:
+        """폴링할 차례가 된 피드 (처음 보는 피드 포함)"""
+        now = now or time.time()
+        due = []
+        for url in urls:
+            row = self.store.schedule(url)
+            if row is None or row[1] <= now:
+                due.append(url)
+        return due
+
+    def next_poll(self, urls: List[str]) -> float:
+        """가장 빠른 다음 폴링 시각"""
+        times = [row[1] for row in map(self.store.schedule, urls) if row is not None]
+        return min(times) if times else time.time()
+
+    def update(self, url: str, new_entries: int, error: bool = False, now: float = None) -> float:
+        """폴링 결과 반영 후 다음 주기(초) 반환"""
+        now = now or time.time()
+        row = self.store.schedule(url)
+        last_poll, interval, errors = (row[0], row[2], row[3]) if row else (None, self.min_interval, 0)
+        if error:
+            interval = min(interval * 2, self.max_interval)
+            errors += 1
+        else:
+            base = self.cadence(url)
+            interval = base if new_entries else min(max(base, interval * 1.5), self.max_interval)
+            last_poll, errors = now, 0
+        self.store.set_schedule(url, last_poll, now + interval, interval, errors)
+        return interval
+
+
+def warm_pool(
+    config: dict,
+    logger: logging.Logger,
+    store: ArticleStore,
+    summarizer: AISummarizer,
+    target_date: date,
+    scraper: ArticleScraper = None
+) -> int:
+    """
+    저장소에 쌓인 오늘 엔트리로 일일 실행과 같은 순위를 매기고 후보를 미리 번역/요약 (요약 캐시에 저장)
+    일일 실행은 같은 후보를 캐시에서 바로 가져감, 요약한 후보 수 반환
+    """
+    registry = FeedRegistry(logger, store=store, target_date=target_date, offline=True, pool_max_age=float('inf'))
+    published = create_published_filter(config, target_date, logger)
+    collected = collect_news(config, logger, target_date, registry, published)
+    ranked = rank_news(collected, config, logger)
+
+    curation_candidates = config.get('ai_summary', {}).get('curation_candidates', 20)
+    selected = {}
+    for cat_name, scored_news in ranked.items():
+        max_items = config['categories'][cat_name].get('max_items', 10)
+        selected[cat_name] = scored_news[:max(max_items, curation_candidates)]
+    # 일일 실행과 같은 요약 입력(보강된 본문)이 되도록 본문도 미리 가져옴 (디스크 캐시)
+    if scraper is not None:
+        scrape_thin_descriptions(selected, scraper, config, logger)
+    for candidates in selected.values():
+        enrich_news(candidates, summarizer, logger)
+    return sum(len(candidates) for candidates in selected.values())
+
+
+def run_watch(args: argparse.Namespace, config: dict, logger: logging.Logger):
+    """
+    상시 실행 모드 (--watch/--serve)
+    피드를 발행 주기에 맞춰 폴링해 기사 저장소에 누적하고, 새 엔트리가 들어오면 오늘 후보를 미리 요약
+    일일 실행(--auto 등)은 watch.pool_max_age_minutes 안에 폴링된 피드를 네트워크 없이 저장소에서 읽고
+    요약도 캐시에서 가져오므로 스코어링/선정/HTML 생성만 수행
+    """
+    import signal
+
+    rss_config = config.get('rss', {})
+    store_config = config.get('store', {})
+    watch_config = config.get('watch', {})
+
+    store = ArticleStore(
+        store_config.get('path', 'cache/articles.sqlite3'),
+        keep_days=store_config.get('keep_days', 60)
+    )
+    scheduler = PollScheduler(
+        store,
+        min_interval=watch_config.get('min_interval_minutes', 5) * 60,
+        max_interval=watch_config.get('max_interval_minutes', 120) * 60
+    )
+    # 폴링마다 조건부 요청 (TTL 캐시를 쓰면 변경을 놓치므로 ttl 0)
+    feed_cache = None
+    if rss_config.get('use_cache', False):
+        feed_cache = FeedCache(
+            rss_config.get('cache_dir', 'cache/feeds'), logger, ttl_minutes=0,
+            timeout=rss_config.get('timeout', 10)
+        )
+
+    feed_health = create_feed_health(config)
+    scraper = create_article_scraper(config, logger)
+
+    # AI 클라이언트/요약 캐시는 상시 유지
+    summarizer = AISummarizer(config, logger)
+    if summarizer.enabled and summarizer.cache is None:
+        logger.warning("AI 요약 캐시(ai_summary.cache)가 꺼져 있어 미리 만든 요약을 일일 실행에서 재사용할 수 없습니다")
+
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+
+    urls = collect_feed_urls(config)
+    logger.info(f">>> [상시 실행] 피드 {len(urls)}개 폴링 시작 (중지: Ctrl+C)")
+    last_day = date.today()
+    try:
+        while not stop.is_set():
+            today = date.today()
+            if today != last_day:
+                store.prune(store_config.get('keep_days', 60))
+                last_day = today
+            due = scheduler.due(urls)
+            if due:
+                feed_window = None
+                if rss_config.get('stream_parse', False):
+                    feed_window = FeedWindow(
+                        today,
+                        margin_days=rss_config.get('stream_margin_days', 1),
+                        stop_after=rss_config.get('stream_stop_after', 10)
+                    )
+                registry = FeedRegistry(
+                    logger, cache=feed_cache, window=feed_window,
+                    timeout=rss_config.get('timeout', 10), store=store, health=feed_health
+                )
+                before = {url: store.count(url) for url in due}
+                registry.prefetch(
+                    due,
+                    max_workers=rss_config.get('max_workers', 8),
+                    per_host_limit=rss_config.get('per_host_limit', 2)
+                )
+                new_total = 0
+                for url in due:
+                    new_entries = store.count(url) - before[url]
+                    new_total += new_entries
+                    scheduler.update(url, new_entries, error=registry.error(url) is not None)
+                logger.info(f">>> 폴링 {len(due)}개 피드, 새 엔트리 {new_total}개")
+
+                if new_total:
+                    start = time.perf_counter()
+                    warmed = warm_pool(config, logger, store, summarizer, today, scraper)
+                    logger.info(f">>> 대기 풀 갱신: 후보 {warmed}개 요약 준비 ({time.perf_counter() - start:.1f}초)")
+                    summarizer.log_stats()
+
+            # 다음 폴링까지 대기 (최대 1분 단위로 깨어나 날짜 변경/중지 확인)
+            stop.wait(min(max(scheduler.next_poll(urls) - time.time(), 1), 60))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        store.close()
+    logger.info(">>> [상시 실행] 종료")
+
+
+# =================================================================
+# 실행 재개 (--resume)
+# =================================================================
+class RunJournal:
+    """
+    단계별 결과를 덧붙여 기록하는 체크포인트 저널 (JSON Lines, 한 줄이 체크포인트 1개)
+    collected: 날짜별/카테고리별 수집 결과 (피드 다운로드·파싱·분류 생략)
+    enriched: 링크별 번역 제목/요약 (요약할 때마다 기록, LLM 재호출 생략)
+    curated: 날짜/카테고리별 큐레이션 결정 (선택한 링크 순서)
+    done: 뉴스레터를 생성/아카이빙한 날짜
+    --resume이면 기존 저널을 읽어 이어서 기록하고, 아니면 새로 시작. 정상 종료 시 삭제
+    기록은 수집 기준 날짜(days)로 구분하므로 자정을 넘겨 재개해도 같은 저널을 사용
+    """
+
+    def __init__(self, path: Path, days: List[date], auto: bool, resume: bool = False):
+        self.path = path
+        self._lock = threading.Lock()
+        self.days = days
+        self.collected_by_day = None
+        self.enriched = {}
+        self.curated = {}
+        self.done = {}
+        self.resumed = resume and path.exists()
+        if self.resumed:
+            self._load()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(path, 'a' if self.resumed else 'w', encoding='utf-8')
+        if not self.resumed:
+            self._append({
+                'type': 'start', 'days': [day.isoformat() for day in days], 'auto': auto,
+                'started_at': datetime.now().isoformat(timespec='seconds')
+            })
+
+    def _load(self):
+        with open(self.path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # 기록 중 중단된 마지막 줄
+                    continue
+                kind = record.get('type')
+                if kind == 'start':
+                    self.days = [date.fromisoformat(day) for day in record['days']]
+                elif kind == 'collected':
+                    self.collected_by_day = {
+                        date.fromisoformat(day): {
+                            category: [self._item(row) for row in rows] for category, rows in collected.items()
+                        }
+                        for day, collected in record['days'].items()
+                    }
+                elif kind == 'enriched':
+                    self.enriched[record['link']] = (record['title'], record['summary'])
+                elif kind == 'curated':
+                    self.curated[(record['day'], record['category'])] = record['links']
+                elif kind == 'done':
+                    self.done[record['day']] = record.get('file')
+
+    @staticmethod
+    def _row(news: NewsItem) -> list:
+        pub_date = news.pub_date.isoformat() if news.pub_date else None
+        return [news.title, news.original_title, news.source, news.link, news.description, pub_date,
+                sorted(news.categories) if news.categories is not None else None]
+
+    @staticmethod
+    def _item(row: list) -> NewsItem:
+        title, original_title, source, link, description, pub_date, categories = row
+        item = NewsItem(
+            title, original_title, source, link, description,
+            datetime.fromisoformat(pub_date) if pub_date else None,
+            frozenset(categories) if categories is not None else None
+        )
+        item.set_cleaned_description(description)
+        return item
+
+    def _append(self, record: dict):
+        line = json.dumps(record, ensure_ascii=False)
+        with self._lock:
+            self._file.write(line + '\n')
+            self._file.flush()
+
+    def record_collected(self, collected_by_day: Dict[date, Dict[str, List[NewsItem]]]):
+        self._append({'type': 'collected', 'days': {
+            day.isoformat(): {category: [self._row(news) for news in news_list]
+                              for category, news_list in collected.items()}
+            for day, collected in collected_by_day.items()
+        }})
+
+    def record_enriched(self, news: NewsItem):
+        self._append({'type': 'enriched', 'link': news.link, 'title': news.title, 'summary': news.summary})
+
+    def record_curated(self, day: date, category: str, news_list: List[NewsItem]):
+        self._append({'type': 'curated', 'day': day.isoformat(), 'category': category,
+                      'links': [news.link for news in news_list]})
+
+    def record_done(self, day: date, output_file: Optional[str]):
+        self._append({'type': 'done', 'day': day.isoformat(), 'file': output_file})
+
+    def restore_enriched(self, selected: Dict[str, List[NewsItem]]) -> int:
+        """저널에 요약이 있는 선정 뉴스에 번역 제목/요약을 채우고 개수 반환 (본문 보강/요약 대상에서 빠짐)"""
+        restored = 0
+        for news_list in selected.values():
+            for news in news_list:
+                if news.summary is None and news.link in self.enriched:
+                    news.title, news.summary = self.enriched[news.link]
+                    restored += 1
+        return restored
+
+    def curated_for(self, day: date, category: str, candidates: List[NewsItem]) -> Optional[List[NewsItem]]:
+        """기록된 큐레이션 결정을 후보에 적용 (결정이 없으면 None)"""
+        links = self.curated.get((day.isoformat(), category))
+        if links is None:
+            return None
+        by_link = {news.link: news for news in candidates}
+        return [by_link[link] for link in links if link in by_link]
+
+    def close(self, remove: bool = False):
+        with self._lock:
+            self._file.close()
+        if remove:
+            self.path.unlink()
+
+
+def create_run_journal(
+    args: argparse.Namespace,
+    config: dict,
+    days: List[date],
+    logger: logging.Logger
+) -> Optional[RunJournal]:
+    """
+    실행 저널 (resume.enabled, 파일은 수집 날짜 범위와 자동/수동 모드별)
+    --date/--from 없이 --resume이면 같은 모드의 가장 최근 중단된 저널을 이어서 실행 (journal.days가 실행 날짜)
+    --resume인데 저널이 없으면 처음부터 실행
+    """
+    resume_config = config.get('resume', {})
+    if not resume_config.get('enabled', False):
+        if getattr(args, 'resume', False):
+            logger.warning("resume.enabled가 꺼져 있어 처음부터 실행합니다")
+        return None
+
+    mode = 'auto' if args.auto else 'manual'
+    journal_dir = Path(resume_config.get('journal_dir', 'cache/journal'))
+    span = days[0].isoformat() if len(days) == 1 else f"{days[0].isoformat()}_{days[-1].isoformat()}"
+    path = journal_dir / f"run_{span}_{mode}.jsonl"
+    explicit = getattr(args, 'target_date', None) or getattr(args, 'date_range', None)
+    if getattr(args, 'resume', False) and not explicit and journal_dir.exists():
+        # 날짜를 지정하지 않은 재개: 자정을 넘겨도 중단된 실행의 날짜로 이어서 (정상 종료한 저널은 삭제되어 없음)
+        unfinished = sorted(journal_dir.glob(f"run_*_{mode}.jsonl"), key=lambda p: p.stat().st_mtime)
+        if unfinished:
+            path = unfinished[-1]
+    journal = RunJournal(path, days, args.auto, resume=getattr(args, 'resume', False))
+    if journal.resumed:
+        logger.info(
+            f">>> [재개] 저널 {path}: 수집 결과 {'있음' if journal.collected_by_day is not None else '없음'} / "
+            f"요약 {len(journal.enriched)}개 / 큐레이션 {len(journal.curated)}개 카테고리 / 완료 {len(journal.done)}일"
+        )
+    elif getattr(args, 'resume', False):
+        logger.warning(f"재개할 저널이 없어 처음부터 실행합니다 ({path})")
+    return journal
+
 
 # =================================================================
 # 메인 실행
@@ -722,6 +3761,26 @@ def main():
     parser.add_argument('--auto', action='store_true', help='자동 모드 (수동 큐레이션 스킵)')
     parser.add_argument('--test', action='store_true', help='테스트 모드 (설정 확인만)')
     parser.add_argument('--date', type=str, help='수집 날짜 (YYYY-MM-DD 형식, 예: 2026-01-09)')
+    parser.add_argument('--from', dest='from_date', type=str, help='여러 날짜 생성 시작일 (YYYY-MM-DD, --to와 함께 사용)')
+    parser.add_argument('--to', dest='to_date', type=str, help='여러 날짜 생성 종료일 (YYYY-MM-DD, 포함)')
+    parser.add_argument('--watch', '--serve', action='store_true',
+                        help='상시 실행 모드 (피드를 발행 주기에 맞춰 폴링하고 오늘 후보를 미리 요약)')
+    parser.add_argument('--async', dest='async_mode', action='store_true',
+                        help='비동기 모드 (피드 다운로드/분류와 전체 카테고리 AI 요약을 하나의 이벤트 루프에서 동시 실행)')
+    parser.add_argument('--feeds-report', action='store_true', help='피드별 상태(차단/느림/정상) 출력 후 종료')
+    parser.add_argument('--search', metavar='QUERY', help='발행한 기사 제목/요약 검색 (아카이브 색인, --from/--to로 기간 제한)')
+    parser.add_argument('--sources', action='store_true', help='출처별 발행 기사 수 (아카이브 색인, --from/--to로 기간 제한)')
+    parser.add_argument('--category', metavar='NAME', help='--search/--sources를 해당 카테고리로 제한')
+    parser.add_argument('--limit', type=int, default=20, help='--search 최대 결과 수 (기본: 20)')
+    parser.add_argument('--resume', action='store_true',
+                        help='중단된 실행 이어서 하기 (저널에 기록된 수집/요약/큐레이션/완료 날짜 건너뜀)')
+    parser.add_argument('--offline', action='store_true', help='네트워크 없이 기사 저장소만 사용 (--date 재생성용)')
+    parser.add_argument('--profile', nargs='?', const='', metavar='PATH',
+                        help='프로파일링 모드 (결과 파일 경로, 생략 시 로그 디렉토리에 저장)')
+    parser.add_argument('--profiler', choices=['cprofile', 'pyinstrument'], default='cprofile',
+                        help='--profile에 사용할 프로파일러 (기본: cprofile, 워커 스레드 포함 / '
+                             'pyinstrument는 메인 스레드만 기록)')
+    parser.add_argument('--metrics-json', metavar='PATH', help='실행 지표 JSON 저장 경로 (아카이브에는 항상 저장)')
     args = parser.parse_args()
 
     # 설정 로드
@@ -735,7 +3794,6 @@ def main():
     # 날짜 파싱
     if args.date:
         try:
-            from datetime import datetime
             args.target_date = datetime.strptime(args.date, '%Y-%m-%d').date()
             logger.info(f">>> 사용자 지정 날짜: {args.target_date}")
         except ValueError:
@@ -744,72 +3802,410 @@ def main():
     else:
         args.target_date = None
 
+    # 기간 파싱 (--from/--to: 피드는 한 번만 수집하고 날짜별로 뉴스레터 생성)
+    args.date_range = None
+    if args.from_date or args.to_date:
+        if not (args.from_date and args.to_date):
+            logger.error("--from과 --to는 함께 지정해야 합니다")
+            return
+        if args.date:
+            logger.error("--date와 --from/--to는 함께 사용할 수 없습니다")
+            return
+        try:
+            first = datetime.strptime(args.from_date, '%Y-%m-%d').date()
+            last = datetime.strptime(args.to_date, '%Y-%m-%d').date()
+        except ValueError:
+            logger.error(f"잘못된 날짜 형식입니다. YYYY-MM-DD 형식으로 입력하세요 (예: 2026-01-09)")
+            return
+        if first > last:
+            logger.error(f"시작일({first})이 종료일({last})보다 늦습니다")
+            return
+        args.date_range = (first, last)
+        logger.info(f">>> 사용자 지정 기간: {first} ~ {last}")
+
     # 테스트 모드
     if args.test:
         logger.info(">>> [테스트 모드] 환경 변수 및 설정 확인")
         logger.info(f"✓ AI_SUMMARY_PROVIDER: {os.getenv('AI_SUMMARY_PROVIDER', 'none')}")
-        logger.info(f"✓ AI 라이브러리 가용: {AI_AVAILABLE}")
+        logger.info(f"✓ AI 라이브러리 가용: {ai_available()}")
         logger.info(f"✓ 카테고리 개수: {len(config['categories'])}")
         logger.info(">>> [테스트 완료] 모든 설정이 정상입니다.")
         return
 
-    # 주말/공휴일 체크 (자동 모드에서만)
-    if args.auto and should_skip_today(config, logger):
+    # 피드 상태 보고서
+    if args.feeds_report:
+        feeds_report(config, logger)
+        return
+
+    # 아카이브 색인 조회
+    if args.search or args.sources:
+        archive_query(args, config, logger)
+        return
+
+    # 상시 실행 모드 (일일 실행은 이 프로세스가 채운 저장소/요약 캐시 사용)
+    if args.watch:
+        run_watch(args, config, logger)
+        return
+
+    # 주말/공휴일 체크 (자동 모드에서만, 기간 지정 시 제외)
+    if args.auto and args.date_range is None and should_skip_today(config, logger):
         sys.exit(0)
 
+    # 실행 지표 (프로파일링 모드에서는 프로파일러 안에서 실행)
+    metrics = RunMetrics()
+    if args.profile is not None:
+        run_profiled(lambda: run_newsletter(args, config, logger, metrics), args.profile, args.profiler, config, logger)
+    else:
+        run_newsletter(args, config, logger, metrics)
+
+
+def run_newsletter(
+    args: argparse.Namespace,
+    config: dict,
+    logger: logging.Logger,
+    metrics: RunMetrics,
+    summarizer: AISummarizer = None
+):
+    """
+    수집 → 중복 제거 → 스코어링 → 선정/요약 → HTML 생성 → 아카이빙
+    summarizer를 주면 설정 대신 해당 요약기 사용 (벤치마크의 가짜 프로바이더 등)
+    """
     # AI 요약기 초기화
-    summarizer = AISummarizer(config, logger)
+    if summarizer is None:
+        summarizer = AISummarizer(config, logger, metrics)
 
     # 자동 모드 안내
     if args.auto:
         logger.info(">>> [자동 모드] 수동 큐레이션을 생략합니다.")
 
-    # 수집 날짜 결정 (--date 옵션이 있으면 해당 날짜, 없으면 오늘)
-    if hasattr(args, 'target_date') and args.target_date:
-        target_date = args.target_date
+    # 수집 날짜 결정 (--from/--to 범위, --date 지정 날짜, 없으면 오늘)
+    if getattr(args, 'date_range', None):
+        first, last = args.date_range
+        days = [first + timedelta(days=n) for n in range((last - first).days + 1)]
     else:
-        target_date = date.today()
+        days = [args.target_date if getattr(args, 'target_date', None) else date.today()]
+
+    # 실행 저널 (단계 결과를 기록, 실패 후 --resume으로 완료한 단계 건너뜀)
+    # 날짜 없이 재개하면 중단된 실행의 날짜를 사용하고, 다음 날 재개해도 원래 날짜로 발행
+    journal = create_run_journal(args, config, days, logger)
+    dated = len(days) > 1
+    if journal is not None and journal.resumed and journal.days != days:
+        days = journal.days
+        dated = len(days) > 1 or days[0] != date.today()
+    resumed = journal is not None and journal.collected_by_day is not None
+    if len(days) > 1:
+        logger.info(f">>> 뉴스 수집 시작 (기간: {days[0]} ~ {days[-1]}, {len(days)}일)")
+    else:
+        logger.info(f">>> 뉴스 수집 시작 (날짜: {days[0]})")
 
-    logger.info(f">>> 뉴스 수집 시작 (날짜: {target_date})")
+    # 최근 뉴스레터에 이미 실린 기사 (수집 단계에서 제외해 다시 요약하지 않음, 재개 시 수집 생략)
+    published = None if resumed else create_published_filter(config, days[0], logger)
+    # 파싱/분류/본문 추출 프로세스 풀 (CPU 단계를 여러 코어로 분산)
+    parse_pool = create_parse_pool(config, days, logger, published)
 
-    final_data = {}
+    try:
+        # 1. 수집 (재개 시 저널의 수집 결과 사용)
+        if resumed:
+            collected_by_day = journal.collected_by_day
+            logger.info(">>> [재개] 저널의 수집 결과 사용 (피드 다운로드/파싱 생략)")
+        else:
+            collected_by_day = fetch_and_collect(args, config, logger, metrics, days, published, parse_pool)
+            if journal is not None:
+                journal.record_collected(collected_by_day)
+
+        # 날짜별 뉴스레터 생성 (AI 요약기/피드/본문 스크래퍼는 공유)
+        scraper = create_article_scraper(config, logger, parse_pool)
+        for day in days:
+            if len(days) > 1:
+                logger.info("\n" + "="*70)
+                logger.info(f">>> [{day}] 뉴스레터 생성")
+                logger.info("="*70)
+            if journal is not None and day.isoformat() in journal.done:
+                logger.info(f">>> [재개] {day} 뉴스레터는 이미 생성됨: {journal.done[day.isoformat()]}")
+                continue
+            build_newsletter(
+                collected_by_day[day], args, config, logger, metrics, summarizer,
+                newsletter_date=day if dated else None, scraper=scraper, journal=journal, day=day
+            )
+    except (Exception, KeyboardInterrupt):
+        if journal is not None:
+            journal.close()
+            logger.error(f">>> 실행 중단: 완료한 단계는 저널에 기록됨, --resume으로 이어서 실행 ({journal.path})")
+        raise
+    finally:
+        if parse_pool is not None:
+            parse_pool.close()
+    if journal is not None:
+        journal.close(remove=True)
+
+    summarizer.log_stats()
+
+    # 8. 실행 지표 요약
+    metrics.log_summary(logger)
+    if args.metrics_json:
+        metrics.save(args.metrics_json)
+        logger.info(f"✓ 실행 지표 저장: {args.metrics_json}")
+
+
+def fetch_and_collect(
+    args: argparse.Namespace,
+    config: dict,
+    logger: logging.Logger,
+    metrics: RunMetrics,
+    days: List[date],
+    published: 'PublishedFilter' = None,
+    parse_pool: ParsePool = None
+) -> Dict[date, Dict[str, List[NewsItem]]]:
+    """
+    피드 다운로드 → 파싱/분류 → {날짜: {카테고리: 뉴스}}
+    캐시/저장소/스트리밍 파싱/피드 상태 통계도 함께 로그
+    """
+    target_date = days[0]
+    rss_config = config.get('rss', {})
+    feed_cache = None
+    if rss_config.get('use_cache', False):
+        feed_cache = FeedCache(
+            rss_config.get('cache_dir', 'cache/feeds'),
+            logger,
+            ttl_minutes=rss_config.get('cache_ttl_minutes', 0),
+            timeout=rss_config.get('timeout', 10)
+        )
+    feed_window = None
+    if rss_config.get('stream_parse', False):
+        feed_window = FeedWindow(
+            target_date,
+            until=days[-1],
+            margin_days=rss_config.get('stream_margin_days', 1),
+            stop_after=rss_config.get('stream_stop_after', 10)
+        )
+    # 기사 저장소 (지난 날짜는 저장소에서 조회, 다운로드한 엔트리는 누적)
+    store_config = config.get('store', {})
+    article_store = None
+    if store_config.get('enabled', False) or args.offline:
+        article_store = ArticleStore(
+            store_config.get('path', 'cache/articles.sqlite3'),
+            keep_days=store_config.get('keep_days', 60)
+        )
+    feed_registry = FeedRegistry(
+        logger, cache=feed_cache, window=feed_window, timeout=rss_config.get('timeout', 10), metrics=metrics,
+        store=article_store, target_date=target_date, until_date=days[-1], offline=args.offline,
+        pool_max_age=config.get('watch', {}).get('pool_max_age_minutes', 30) * 60,
+        health=create_feed_health(config), parse_pool=parse_pool
+    )
+    feed_urls = collect_feed_urls(config)
+    logger.info(f">>> RSS 피드 {len(feed_urls)}개 (중복 제외)")
+    if feed_registry.health is not None:
+        states = [feed_registry.health.state(url) for url in feed_urls]
+        slow = sum(feed_registry.health.is_slow(url) for url in feed_urls)
+        if states.count('open') or states.count('half_open') or slow:
+            logger.info(
+                f">>> 피드 상태: 차단 {states.count('open')}개 건너뜀 / 시험 요청 {states.count('half_open')}개 / "
+                f"느린 피드 {slow}개 마지막 순서 (자세히: --feeds-report)"
+            )
+
+    if getattr(args, 'async_mode', False):
+        # 1. 다운로드와 파싱/분류를 하나의 이벤트 루프에서 겹쳐 실행 (끝난 피드부터 분류)
+        import asyncio
+
+        with metrics.stage('collect'):
+            collected_by_day = asyncio.run(collect_news_async(
+                config, logger, days, feed_registry,
+                max_workers=rss_config.get('max_workers', 8),
+                per_host_limit=rss_config.get('per_host_limit', 2),
+                published=published
+            ))
+    else:
+        # 피드 병렬 다운로드 (결과는 카테고리/설정 순서대로 사용되므로 출력은 동일)
+        with metrics.stage('prefetch'):
+            feed_registry.prefetch(
+                feed_urls,
+                max_workers=rss_config.get('max_workers', 8),
+                per_host_limit=rss_config.get('per_host_limit', 2)
+            )
+
+        # 1. 전체 카테고리 수집 (엔트리별 1회 파싱 후 카테고리 분류, 여러 날짜는 발행일로 분배)
+        with metrics.stage('collect'):
+            collected_by_day = collect_news_by_day(config, logger, days, feed_registry, published)
+
+    if published is not None:
+        logger.info(f">>> 이미 발행한 기사 제외: {published.hits}개")
+    if feed_cache:
+        stats = feed_cache.stats
+        logger.info(
+            f">>> 피드 캐시: TTL 내 재사용 {stats['fresh']}개 / 304 {stats['not_modified']}개 / "
+            f"다운로드 {stats['downloaded']}개 / 오류 시 캐시 사용 {stats['stale']}개"
+        )
+    if article_store:
+        stats = feed_registry.store_stats
+        logger.info(
+            f">>> 기사 저장소: 저장소 조회 {stats['from_store']}개 / 네트워크 수집 {stats['fetched']}개 피드, "
+            f"엔트리 {stats['saved']}개 저장"
+        )
+    if feed_window:
+        stats = feed_registry.stream_stats
+        logger.info(
+            f">>> 스트리밍 파싱: 조기 종료 {stats['stopped']}/{stats['feeds']}개 피드, "
+            f"엔트리 유지 {stats['kept']}개 / 날짜 범위 밖 {stats['skipped']}개, "
+            f"읽은 양 {stats['bytes_read'] / 1024:.0f}KB"
+        )
+
+    return collected_by_day
+
+
+def rank_news(
+    collected: Dict[str, List[NewsItem]],
+    config: dict,
+    logger: logging.Logger,
+    metrics: RunMetrics = None
+) -> Dict[str, List[NewsItem]]:
+    """
+    카테고리별 중복 제거 + 스코어링 → {카테고리: 점수순 뉴스} (뉴스가 남은 카테고리만, 설정 순서)
+    일일 실행과 --watch 대기 풀이 같은 순위를 쓰도록 공유
+    카테고리 간 중복 제거(dedup.cross_category)는 선정 단계에서 앞 카테고리에 실린 뉴스만 기준으로 처리
+    """
+    metrics = metrics or RunMetrics()
+    ranked = {}
 
     # 카테고리별 순회
     for cat_name, cat_info in config['categories'].items():
         query = cat_info.get('query', '')  # query가 없으면 빈 문자열
-        max_items = cat_info.get('max_items', 10)
+        raw_news = collected[cat_name]
 
-        logger.info(f"\n--- 카테고리: {cat_name} ---")
-
-        # 1. 수집
-        raw_news = fetch_news_by_category(cat_name, query, config, logger, summarizer, target_date)
+        logger.info(f"\n--- 선정: {cat_name} ---")
 
         if not raw_news:
             logger.warning(f"    [{cat_name}] 카테고리는 오늘 뉴스가 없습니다.")
             continue
 
         # 2. 중복 제거
-        unique_news = remove_duplicates(raw_news, logger)
+        with metrics.stage('dedup', cat_name):
+            unique_news = remove_duplicates(raw_news, logger, create_dedup_index(config))
+        metrics.record_category(cat_name, unique=len(unique_news))
 
         # 3. 스코어링 (카테고리 전달하여 우선순위 브랜드 가중치 적용)
-        scored_news = calculate_scores(unique_news, query, config, cat_name)
+        with metrics.stage('score', cat_name):
+            ranked[cat_name] = calculate_scores(unique_news, query, config, cat_name)
+
+    return ranked
+
+
+def build_newsletter(
+    collected: Dict[str, List[NewsItem]],
+    args: argparse.Namespace,
+    config: dict,
+    logger: logging.Logger,
+    metrics: RunMetrics,
+    summarizer: AISummarizer,
+    newsletter_date: date = None,
+    scraper: ArticleScraper = None,
+    journal: RunJournal = None,
+    day: date = None
+):
+    """
+    수집된 하루치 뉴스로 중복 제거 → 스코어링 → 선정/본문 보강/요약 → HTML 생성 → 아카이빙
+    newsletter_date를 주면 파일명/발행일/아카이브 위치에 해당 날짜 사용 (기본: 오늘)
+    journal을 주면 요약/큐레이션 결정/완료를 수집 날짜(day)로 기록하고, 기록된 요약과 결정은 다시 하지 않음
+    """
+    final_data = {}
 
-        # 4. 수동 큐레이션 (자동 모드가 아닐 때만)
+    # 수동 큐레이션 시 AI 요약 후 보여줄 후보 수
+    curation_candidates = config.get('ai_summary', {}).get('curation_candidates', 20)
+
+    # 2. 중복 제거 → 3. 스코어링
+    ranked = rank_news(collected, config, logger, metrics)
+
+    # 카테고리 간 중복 제거: 앞 카테고리에 실제로 실린(자동 선정/큐레이션된) 뉴스만 뒤 카테고리에서 제외
+    cross_index = create_dedup_index(config) if config.get('dedup', {}).get('cross_category', False) else None
+
+    # 선정(수동 큐레이션 시 후보) 뉴스
+    selected = {}
+    for cat_name, scored_news in ranked.items():
+        max_items = config['categories'][cat_name].get('max_items', 10)
+        if args.auto:
+            selected[cat_name] = drop_cross_category(scored_news, cross_index)[:max_items]
+            if cross_index is not None:
+                for news in selected[cat_name]:
+                    cross_index.add_if_unique(news.original_title)
+        else:
+            selected[cat_name] = scored_news[:max(max_items, curation_candidates)]
+    # 저널 기록 키 (--date 단일 실행도 발행일이 아닌 수집 날짜로 구분)
+    journal_day = day or newsletter_date or date.today()
+
+    # 재개: 저널에 기록된 요약 채우기 (본문 보강/요약 대상에서 빠짐)
+    if journal is not None and journal.enriched:
+        restored = journal.restore_enriched(selected)
+        if restored:
+            logger.info(f">>> [재개] 저널의 번역/요약 {restored}개 사용")
+
+    # RSS 설명이 짧은 선정 뉴스는 원문 본문으로 보강 (전체 카테고리 동시)
+    # 비동기 모드는 아래 enrich_all_async에서 본문 보강과 요약을 겹쳐 실행
+    # 수동 큐레이션은 백그라운드 요약할 후보만 미리 보강하고, 나머지는 카테고리마다 실제 후보(카테고리 간 중복 제외)를 보강
+    background_enrich = not args.auto and config.get('ai_summary', {}).get('background_enrich', True)
+    async_enrich = getattr(args, 'async_mode', False) and not background_enrich
+    if scraper is not None and not async_enrich and (args.auto or background_enrich):
+        with metrics.stage('scrape'):
+            scrape_thin_descriptions(selected, scraper, config, logger)
+
+    # 수동 큐레이션: 앞 카테고리를 큐레이션하는 동안 뒤 카테고리 후보를 백그라운드로 요약
+    # 비동기 모드: 모든 카테고리의 선정 뉴스를 한 번에 동시 요약 (아래 enrich_news는 남은 것만 처리)
+    enricher = None
+    if background_enrich:
+        enricher = BackgroundEnricher(selected, summarizer, logger, journal)
+    elif async_enrich:
+        import asyncio
+
+        with metrics.stage('enrich'):
+            asyncio.run(enrich_all_async(selected, summarizer, logger, journal, scraper, config))
+
+    for cat_name, scored_news in ranked.items():
+        max_items = config['categories'][cat_name].get('max_items', 10)
+
+        # 4. 선정 → 5. AI 번역/요약 (선정된 뉴스만)
         if args.auto:
-            curated = scored_news[:max_items]
+            with metrics.stage('enrich', cat_name):
+                curated = enrich_news(selected[cat_name], summarizer, logger, journal)
             logger.info(f"    [{cat_name}] 상위 {len(curated)}개 자동 선택")
         else:
-            curated = curate_category(cat_name, scored_news, max_items, logger)
+            # 수동 큐레이션: 후보 범위만 요약 후 표시 (앞 카테고리에서 큐레이션한 뉴스는 제외)
+            candidates = drop_cross_category(scored_news, cross_index)[:max(max_items, curation_candidates)]
+            if enricher is not None:
+                with metrics.stage('enrich', cat_name):
+                    waited = enricher.wait(cat_name)
+                logger.info(f"    [{cat_name}] 백그라운드 요약 대기 {waited:.1f}초")
+            if scraper is not None:
+                # 아직 요약 전인 후보만 대상 (미리 보강/요약한 후보는 제외)
+                with metrics.stage('scrape', cat_name):
+                    scrape_thin_descriptions({cat_name: candidates}, scraper, config, logger)
+            with metrics.stage('enrich', cat_name):
+                enrich_news(candidates, summarizer, logger, journal)
+            curated = journal.curated_for(journal_day, cat_name, candidates) if journal is not None else None
+            if curated is not None:
+                logger.info(f"    [{cat_name}] [재개] 저널의 큐레이션 결정 사용 ({len(curated)}개)")
+            else:
+                with metrics.stage('curation'):
+                    curated = curate_category(cat_name, candidates, max_items, logger)
+                if journal is not None:
+                    journal.record_curated(journal_day, cat_name, curated)
+            if cross_index is not None:
+                for news in curated:
+                    cross_index.add_if_unique(news.original_title)
 
         if curated:
             final_data[cat_name] = curated
+        elif args.auto:
+            logger.info(f"    [{cat_name}] 앞 카테고리와 모두 중복되어 건너뜁니다.")
+    if enricher is not None:
+        enricher.close()
 
-    # 5. HTML 생성
+    # 6. HTML 생성
     if final_data:
-        output_file = generate_html(final_data, config, logger)
+        with metrics.stage('html'):
+            output_file = generate_html(final_data, config, logger, newsletter_date)
 
-        # 6. 아카이빙
-        archive_newsletter(output_file, config, final_data, logger)
+        # 7. 아카이빙 (실행 지표 JSON도 메타데이터 옆에 저장)
+        # --date 단일 실행은 파일명/발행일이 오늘이어도 아카이브/색인은 수집 날짜(day)로 기록 (범위 실행과 동일)
+        with metrics.stage('archive'):
+            archive_newsletter(output_file, config, final_data, logger, metrics, newsletter_date or day)
 
         logger.info("\n" + "="*70)
         logger.info(f"✅ [완료] '{output_file}' 파일이 생성되었습니다.")
@@ -821,6 +4217,69 @@ def main():
         logger.info("4. 수신자 입력 후 발송\n")
     else:
         logger.warning("\n>>> 생성할 뉴스가 없습니다.")
+    if journal is not None:
+        journal.record_done(journal_day, output_file if final_data else None)
+
+
+def run_profiled(func, output: str, profiler: str, config: dict, logger: logging.Logger):
+    """
+    프로파일러를 켠 상태로 실행
+    cprofile: .prof 파일 저장(snakeviz 등으로 열람) + 누적 시간 상위 함수 로그
+              (피드 다운로드/본문/요약 워커 스레드도 스레드별로 기록해 합침)
+    pyinstrument: .html 리포트 저장 (미설치 시 cprofile 사용, 메인 스레드만 기록)
+    """
+    if profiler == 'pyinstrument':
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            logger.warning("pyinstrument가 설치되지 않아 cProfile을 사용합니다. (pip install pyinstrument)")
+            profiler = 'cprofile'
+
+    if not output:
+        log_dir = Path(config.get('logging', {}).get('log_dir', 'logs'))
+        suffix = 'html' if profiler == 'pyinstrument' else 'prof'
+        output = str(log_dir / f"profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{suffix}")
+    Path(output).parent.mkdir(parents=True, exist_ok=True)
+
+    if profiler == 'pyinstrument':
+        profile = Profiler()
+        profile.start()
+        try:
+            func()
+        finally:
+            profile.stop()
+            with open(output, 'w', encoding='utf-8') as f:
+                f.write(profile.output_html())
+            logger.info(f"✓ 프로파일 저장: {output}")
+        return
+
+    import cProfile
+    import io
+    import pstats
+    profile = cProfile.Profile()
+    # cProfile은 enable()한 스레드만 기록하므로 이후 시작되는 워커 스레드(ThreadPoolExecutor 등)는
+    # 스레드마다 Profile을 켜고 끝난 뒤 합침 (3.12+는 sys.monitoring 기반이라 하나의 Profile이 모든 스레드를 기록)
+    thread_profiles = []
+    if sys.version_info < (3, 12):
+        def start_thread_profile(frame, event, arg):
+            thread_profile = cProfile.Profile()
+            thread_profiles.append(thread_profile)
+            thread_profile.enable()
+        threading.setprofile(start_thread_profile)
+    profile.enable()
+    try:
+        func()
+    finally:
+        profile.disable()
+        threading.setprofile(None)
+        stream = io.StringIO()
+        stats = pstats.Stats(profile, *thread_profiles, stream=stream)
+        stats.dump_stats(output)
+        stats.sort_stats('cumulative').print_stats(25)
+        logger.info(
+            f"\n>>> [프로파일] 누적 시간 상위 25개 함수 (워커 스레드 {len(thread_profiles)}개 포함)\n{stream.getvalue()}"
+        )
+        logger.info(f"✓ 프로파일 저장: {output}")
 
 
 if __name__ == "__main__":